@@ -0,0 +1,295 @@
+# Description: This file implements the streaming archive writer used by the Show Tech dumps. Each section is
+# written into its tar member as it is collected and compressed straight into the archive, so no per-section log
+# files are written to /var/log/fp_troubleshooting_data, read back and deleted again.
+#
+# A tar header records the member size before its data, so a member's text is held in a spool until the member is
+# closed: in memory up to FPTH_ARCHIVE_SPOOL_BYTES, and only larger outputs (e.g. 'show blocks old dump') spill to
+# an anonymous temporary file that the OS removes when it is closed.
+#
+# gzip archives are compressed on a thread pool: the tar stream is cut into fixed-size blocks and every block is
+# compressed into its own gzip member (zlib releases the GIL while it works). Concatenated gzip members are a
+# standard gzip file, so the result still opens with 'tar xzf', gunzip and Python's tarfile.
+#
+# Every archive gets a '<archive>.index.json' manifest listing each member and section (command, offsets, sizes,
+# CRC32 and timing); core.archive_reader uses it to read a single section back without extracting the archive.
+
+import bz2
+import io
+import json
+import lzma
+import os
+import tarfile
+import tempfile
+import time
+import zlib
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+SPOOL_BYTES = int(os.environ.get("FPTH_ARCHIVE_SPOOL_BYTES", str(16 * 1024 * 1024)))
+ARCHIVE_CODEC = os.environ.get("FPTH_ARCHIVE_CODEC", "gz")
+ARCHIVE_LEVEL = int(os.environ.get("FPTH_ARCHIVE_LEVEL", "6"))
+COMPRESS_THREADS = int(os.environ.get("FPTH_COMPRESS_THREADS", str(min(4, os.cpu_count() or 1))))
+COMPRESS_BLOCK_SIZE = 1024 * 1024
+CHUNK_SIZE = 65536
+
+# Suffix of the index written next to every archive
+INDEX_SUFFIX = ".index.json"
+
+# Archive file extension for every supported codec
+CODEC_EXTENSIONS = {
+    "gz": ".tar.gz",
+    "xz": ".tar.xz",
+    "bz2": ".tar.bz2",
+    "none": ".tar",
+}
+
+
+class ParallelGzipWriter:
+    """
+    Write-only file object that gzip-compresses everything written to it on a thread pool. Blocks are written
+    to the underlying file in order, and at most two blocks per thread are held in memory at any time.
+
+    flush_block() ends the current block early, so the next byte written starts a new gzip member that a reader
+    can decompress on its own; the compressed offset of every such boundary is kept in 'boundaries'.
+    """
+
+    def __init__(self, file, level=ARCHIVE_LEVEL, threads=COMPRESS_THREADS):
+        self.file = file
+        self.level = level
+        self.max_pending = max(threads, 1) * 2
+        self.boundaries = {0: 0}  # uncompressed offset of a block start -> its compressed offset
+        self._pool = ThreadPoolExecutor(max_workers=max(threads, 1), thread_name_prefix="fpth-gzip")
+        self._pending = deque()
+        self._buffer = bytearray()
+        self._position = 0
+        self._compressed_position = 0
+
+    def _compress(self, block):
+        # wbits=31 produces a complete gzip member (header, deflate data and CRC32/size trailer)
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        return compressor.compress(block) + compressor.flush()
+
+    def _write_next(self):
+        end, future = self._pending.popleft()
+        compressed = future.result()
+        self.file.write(compressed)
+        self._compressed_position += len(compressed)
+        self.boundaries[end] = self._compressed_position
+
+    def _submit(self, block, end):
+        self._pending.append((end, self._pool.submit(self._compress, bytes(block))))
+        while len(self._pending) >= self.max_pending:
+            self._write_next()
+
+    def tell(self):
+        """Returns the number of uncompressed bytes written so far."""
+        return self._position
+
+    def write(self, data):
+        self._buffer += data
+        self._position += len(data)
+        while len(self._buffer) >= COMPRESS_BLOCK_SIZE:
+            self._submit(self._buffer[:COMPRESS_BLOCK_SIZE], self._position - len(self._buffer) + COMPRESS_BLOCK_SIZE)
+            del self._buffer[:COMPRESS_BLOCK_SIZE]
+        return len(data)
+
+    def flush_block(self):
+        """Ends the current block and returns the uncompressed offset at which the next block starts."""
+        if self._buffer:
+            self._submit(self._buffer, self._position)
+            self._buffer = bytearray()
+        return self._position
+
+    def close(self):
+        """Compresses what is left and writes every outstanding block."""
+        try:
+            self.flush_block()
+            while self._pending:
+                self._write_next()
+        finally:
+            self._pool.shutdown(cancel_futures=True)
+
+
+def open_compressor(file, codec=ARCHIVE_CODEC, level=ARCHIVE_LEVEL):
+    """Returns a write-only file object compressing into 'file' with the given codec."""
+    if codec == "gz":
+        return ParallelGzipWriter(file, level)
+    if codec == "xz":
+        return lzma.LZMAFile(file, "wb", preset=level)
+    if codec == "bz2":
+        return bz2.BZ2File(file, "wb", compresslevel=max(level, 1))
+    if codec == "none":
+        return None
+    raise ValueError(f"Unsupported archive codec '{codec}' (expected one of: {', '.join(CODEC_EXTENSIONS)})")
+
+
+class _MemberText(io.TextIOWrapper):
+    """Text file of one archive member that remembers where each of its sections starts."""
+
+    def __init__(self, spool):
+        super().__init__(spool, encoding="utf-8", errors="replace", newline="")
+        self.sections = []
+
+    def begin_section(self, title, command=None):
+        """Marks the start of a section; it runs until the next section or the end of the member."""
+        self.flush()
+        self._end_section()
+        self.sections.append({"title": title, "command": command, "offset": self.buffer.tell(),
+                              "started": time.monotonic()})
+
+    def _end_section(self):
+        if self.sections and "size" not in self.sections[-1]:
+            section = self.sections[-1]
+            section["size"] = self.buffer.tell() - section["offset"]
+            section["seconds"] = round(time.monotonic() - section.pop("started"), 3)
+
+    def finish(self):
+        self.flush()
+        self._end_section()
+
+
+def _checksums(spool, size, sections):
+    """Returns the CRC32 of the whole member and fills in the CRC32 of every section."""
+    ranges = [(section["offset"], section["offset"] + section["size"], section) for section in sections]
+    member_crc = 0
+    section_crcs = [0] * len(ranges)
+    spool.seek(0)
+    position = 0
+    while position < size:
+        chunk = spool.read(min(CHUNK_SIZE, size - position))
+        member_crc = zlib.crc32(chunk, member_crc)
+        for index, (start, end, _) in enumerate(ranges):
+            if start < position + len(chunk) and end > position:
+                section_crcs[index] = zlib.crc32(chunk[max(start - position, 0):end - position],
+                                                 section_crcs[index])
+        position += len(chunk)
+    for (_, _, section), crc in zip(ranges, section_crcs):
+        section["crc32"] = crc
+    return member_crc
+
+
+class ArchiveWriter:
+    """
+    Writes a compressed tar archive member by member to '<base_path><extension>', the extension following the
+    codec (e.g. '.tar.gz'). The archive is built under '<path>.part' and only renamed to its final name once
+    every member has been written, so an interrupted dump never leaves a truncated archive behind under a name
+    that looks complete.
+
+    The codec and level default to FPTH_ARCHIVE_CODEC and FPTH_ARCHIVE_LEVEL; a collection can pass its own to
+    trade compression ratio for speed.
+
+    Next to the archive, '<path>.index.json' lists every member and the sections in it (title, command, offsets,
+    sizes, CRC32 and the seconds spent writing them). In gzip archives every member starts a new gzip member, so
+    core.archive_reader can decompress a single section without reading the rest of the archive.
+    """
+
+    def __init__(self, base_path, codec=None, level=None):
+        self.codec = codec or ARCHIVE_CODEC
+        self.level = ARCHIVE_LEVEL if level is None else level
+        if self.codec not in CODEC_EXTENSIONS:
+            raise ValueError(f"Unsupported archive codec '{self.codec}' "
+                             f"(expected one of: {', '.join(CODEC_EXTENSIONS)})")
+        self.path = base_path + CODEC_EXTENSIONS[self.codec]
+        self.part_path = f"{self.path}.part"
+        self.index_path = self.path + INDEX_SUFFIX
+        self.members = []
+        self._file = None
+        self._compressor = None
+        self._tar = None
+
+    def __enter__(self):
+        self._file = open(self.part_path, "wb")
+        self._compressor = open_compressor(self._file, self.codec, self.level)
+        # Every writer in use offers tell(), so the tar is written straight through without seeking back
+        self._tar = tarfile.open(fileobj=self._compressor or self._file, mode="w")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self._tar.close()
+            if self._compressor is not None:
+                self._compressor.close()
+        finally:
+            self._file.close()
+
+        if exc_type is None:
+            self._write_index()
+            os.replace(self.part_path, self.path)
+        else:
+            os.remove(self.part_path)
+        return False
+
+    def _write_index(self):
+        if isinstance(self._compressor, ParallelGzipWriter):
+            boundaries = self._compressor.boundaries
+            starts = sorted(boundaries)
+            for member in self.members:
+                member["block_offset"] = boundaries[member["block_uoffset"]]
+                member["compressed_size"] = boundaries[member.pop("block_end")] - member["block_offset"]
+                # A section deep inside a large member is read from the last block boundary before it
+                for section in member["sections"]:
+                    block_start = starts[bisect_right(starts, member["offset"] + section["offset"]) - 1]
+                    section["block_uoffset"] = block_start
+                    section["block_offset"] = boundaries[block_start]
+
+        index = {"archive": os.path.basename(self.path), "codec": self.codec, "members": self.members}
+        with open(self.index_path, "w") as f:
+            json.dump(index, f, indent=1)
+
+    @contextmanager
+    def member(self, name):
+        """
+        Yields a text file; everything written to it becomes the archive member 'name' when the block exits.
+        Call begin_section(title, command) on it to index the sections of the member.
+        Raises DiskBudgetExceeded instead of adding a member that could leave the disk nearly full.
+        """
+        from core.retention import check_free_space
+
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+        text = _MemberText(spool)
+        try:
+            started = time.monotonic()
+            yield text
+            text.finish()
+            info = tarfile.TarInfo(name)
+            info.size = spool.tell()
+            info.mtime = int(time.time())
+            info.mode = 0o644
+            # The uncompressed size bounds what the member can add to the archive
+            check_free_space(self.part_path, info.size)
+            crc32 = _checksums(spool, info.size, text.sections)
+            spool.seek(0)
+
+            # Start the member in a fresh gzip member so a reader can begin decompressing right at it
+            if isinstance(self._compressor, ParallelGzipWriter):
+                block_start = self._compressor.flush_block()
+            self._tar.addfile(info, spool)
+            data_offset = self._tar.offset - tarfile.BLOCKSIZE * ((info.size + tarfile.BLOCKSIZE - 1)
+                                                                   // tarfile.BLOCKSIZE)
+            entry = {"name": name, "offset": data_offset, "size": info.size, "crc32": crc32,
+                     "seconds": round(time.monotonic() - started, 3), "sections": text.sections}
+            if isinstance(self._compressor, ParallelGzipWriter):
+                entry["block_uoffset"] = block_start
+                entry["block_end"] = self._compressor.flush_block()
+            self.members.append(entry)
+        finally:
+            text.close()
+
+    def add_text(self, name, content):
+        """Adds a member holding the given text."""
+        with self.member(name) as f:
+            f.write(content)
+
+
+def open_archive(base_path, codec=None, level=None):
+    """
+    Returns the writer a Show Tech dump should write its run into: an ArchiveWriter for '<base_path>.tar.gz',
+    or, with FPTH_DEDUP_STORE=1, a writer recording the run in the deduplicated store under its base name.
+    """
+    from core import dedup_store
+
+    if dedup_store.STORE_ENABLED:
+        return dedup_store.StoreWriter(os.path.basename(base_path))
+    return ArchiveWriter(base_path, codec, level)
@@ -0,0 +1,129 @@
+# Description: This file implements the reader for the '<archive>.index.json' files ArchiveWriter writes next to
+# every Show Tech archive. The index lists each member and section with its offset, size and CRC32, so a single
+# section (e.g. 'show crypto ipsec sa') can be pulled out of an archive without extracting it.
+#
+# In gzip archives every member starts a new gzip member, and the index records the last 1 MB block boundary before
+# every section, so at most one block of other data is decompressed to reach a section, however large the archive.
+# Uncompressed archives are read at the offset directly; xz and bz2 archives have no such boundaries and are read
+# sequentially up to the member.
+
+import json
+import os
+import tarfile
+import zlib
+from core.archive import CHUNK_SIZE, INDEX_SUFFIX
+
+
+class ArchiveIndexError(Exception):
+    """Raised when an archive has no usable index, or a section read back does not match its checksum."""
+
+
+def load_index(archive_path):
+    """Returns the index of an archive."""
+    try:
+        with open(archive_path + INDEX_SUFFIX) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        raise ArchiveIndexError(f"No index for {archive_path}: {e}")
+
+
+def list_sections(archive_path):
+    """Returns (member name, section title, command, size) for every indexed section of an archive."""
+    return [(member["name"], section["title"], section["command"], section["size"])
+            for member in load_index(archive_path)["members"] for section in member["sections"]]
+
+
+def _find_member(index, name):
+    for member in index["members"]:
+        if member["name"] == name or os.path.basename(member["name"]) == name:
+            return member
+    raise ArchiveIndexError(f"No member '{name}' in {index['archive']}")
+
+
+def find_section(index, query):
+    """
+    Returns (member, section) for the section whose command or title matches query, ignoring case.
+    Exact matches win over sections that merely contain query.
+    """
+    query = query.strip().lower()
+    partial_match = None
+    for member in index["members"]:
+        for section in member["sections"]:
+            names = [name.lower() for name in (section["command"], section["title"]) if name]
+            if query in names:
+                return member, section
+            if partial_match is None and any(query in name for name in names):
+                partial_match = member, section
+    if partial_match is None:
+        raise ArchiveIndexError(f"No section matching '{query}' in {index['archive']}")
+    return partial_match
+
+
+def _read_gzip_range(f, member, block, start, size):
+    """
+    Decompresses the gzip members of one archive member, from the block boundary 'block' (the member or one of
+    its sections) on, and returns size bytes from start.
+    """
+    f.seek(block["block_offset"])
+    remaining_input = member["block_offset"] + member["compressed_size"] - block["block_offset"]
+    skip = start - block["block_uoffset"]
+    data = bytearray()
+    decompressor = zlib.decompressobj(31)
+
+    while len(data) < size and remaining_input > 0:
+        compressed = f.read(min(CHUNK_SIZE, remaining_input))
+        if not compressed:
+            break
+        remaining_input -= len(compressed)
+        while compressed:
+            output = decompressor.decompress(compressed)
+            if skip:
+                dropped = min(skip, len(output))
+                output = output[dropped:]
+                skip -= dropped
+            data += output
+            # The next block is a new gzip member starting in what this one left unused
+            compressed = decompressor.unused_data
+            if decompressor.eof:
+                decompressor = zlib.decompressobj(31)
+            else:
+                break
+    return bytes(data[:size])
+
+
+def _read_range(archive_path, index, member, entry, start, size):
+    """Returns size bytes of the archive's uncompressed tar stream from offset start, which lies in entry."""
+    if index["codec"] == "gz" and "block_offset" in entry:
+        with open(archive_path, "rb") as f:
+            return _read_gzip_range(f, member, entry, start, size)
+    if index["codec"] == "none":
+        with open(archive_path, "rb") as f:
+            f.seek(start)
+            return f.read(size)
+
+    with tarfile.open(archive_path, "r:*") as tar:
+        f = tar.extractfile(member["name"])
+        f.seek(start - member["offset"])
+        return f.read(size)
+
+
+def _read_verified(archive_path, index, member, entry, offset):
+    data = _read_range(archive_path, index, member, entry, offset, entry["size"])
+    if len(data) != entry["size"] or zlib.crc32(data) != entry["crc32"]:
+        raise ArchiveIndexError(f"Checksum mismatch reading '{entry.get('title', member['name'])}' "
+                                f"from {archive_path}")
+    return data.decode("utf-8", errors="replace")
+
+
+def read_member(archive_path, name):
+    """Returns the text of one archive member, by full or base name."""
+    index = load_index(archive_path)
+    member = _find_member(index, name)
+    return _read_verified(archive_path, index, member, member, member["offset"])
+
+
+def read_section(archive_path, query):
+    """Returns the text of the section whose command or title matches query (e.g. 'show crypto ipsec sa')."""
+    index = load_index(archive_path)
+    member, section = find_section(index, query)
+    return _read_verified(archive_path, index, member, section, member["offset"] + section["offset"])
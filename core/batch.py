@@ -0,0 +1,218 @@
+# Description: This file implements the headless batch mode ('python3 fp_troubleshooting_helper.py --batch JOB').
+# A job file names the Show Tech collectors to run, the S2S peers and AnyConnect tunnel groups to include and where
+# the results go. The collectors run one after another without a single prompt, their console output goes to
+# stderr, and a JSON status document listing every collector's outcome and files is printed on stdout (and
+# optionally written to a file), so captures can be scheduled from cron or driven across a fleet. With
+# FPTH_DEDUP_STORE=1 a collector's runs are recorded in the store instead, and their run IDs are listed as its files.
+#
+# Job files are plain 'key = value' lines; '#' starts a comment and lists are separated by commas or spaces:
+#
+#     collectors = nat, routing, s2s, anyconnect
+#     peers = 192.0.2.1, 198.51.100.7
+#     tunnel_groups = RA-VPN
+#     output = /var/common/fpth
+#     budget = 900
+#     resume = no
+#     status = /var/common/fpth/status.json
+
+import json
+import os
+import shutil
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from core import dedup_store, journal
+from core.dedup_store import TROUBLESHOOTING_DIR
+from core.deadline import collection_budget, default_budget
+from core.registry import lazy_command
+
+# Collector name: the dump it runs
+COLLECTORS = {
+    "nat": lazy_command("lina.nat.dump_all_nat_data.dump_all_nat_data"),
+    "routing": lazy_command("lina.routing.global_routing.dump_all_route_data.dump_all_route_data"),
+    "eigrp": lazy_command("lina.routing.eigrp.dump_all_eigrp_data.dump_all_eigrp_data"),
+    "ospf": lazy_command("lina.routing.ospf.dump_all_ospf_data.dump_all_ospf_data"),
+    "bgp": lazy_command("lina.routing.bgp.dump_all_bgp_data.dump_all_bgp_data"),
+    "isis": lazy_command("lina.routing.isis.dump_all_isis_data.dump_all_isis_data"),
+    "vrf": lazy_command("lina.routing.vrf.dump_all_vrf_data.dump_all_vrf_data"),
+    "anyconnect": lazy_command("lina.vpn.anyconnect.dump_all_anyconnect_data.dump_all_anyconnect_data"),
+    "s2s": lazy_command("lina.vpn.s2s.dump_all_s2s_data.dump_all_s2s_data", "dump_s2s_tunnel_groups"),
+    "conn_and_traffic": lazy_command(
+        "lina.connectivity_and_traffic.dump_all_conn_and_traffic_data.dump_all_conn_and_traffic_data"
+    ),
+    "failover": lazy_command("lina.failover.dump_all_failover_data.dump_all_failover_data"),
+    "syslog": lazy_command("lina.logging_and_monitoring.syslog.dump_all_syslog_data.dump_all_syslog_data"),
+    "snmp": lazy_command("lina.logging_and_monitoring.snmp.dump_all_snmp_data.dump_all_snmp_data"),
+    "cluster": lazy_command("lina.cluster.dump_all_cluster_data.dump_all_cluster_data"),
+    "blocks": lazy_command("lina.blocks.dump_all_blocks_data.dump_all_blocks_data"),
+    "everything": lazy_command("lina.dump_all_data.dump_all_data"),
+}
+
+LIST_KEYS = ("collectors", "peers", "tunnel_groups")
+VALUE_KEYS = ("output", "budget", "resume", "status")
+
+# Exit codes of --batch
+EXIT_OK, EXIT_FAILED, EXIT_INVALID_JOB = 0, 1, 2
+
+# Entries of the troubleshooting directory that hold state rather than results
+_STATE_ENTRIES = {"journal", "store"}
+
+
+class JobSpecError(ValueError):
+    """Raised for a job file that cannot be run."""
+
+
+def parse_job_spec(text):
+    """Parses a job file into a dict, checking every key and collector name."""
+    job = {"collectors": [], "peers": [], "tunnel_groups": [], "output": None, "budget": None,
+           "resume": False, "status": None}
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        key, separator, value = line.partition("=")
+        key, value = key.strip().lower(), value.strip()
+        if not separator or key not in LIST_KEYS + VALUE_KEYS:
+            raise JobSpecError(f"line {number}: expected '<key> = <value>' with a key among "
+                               f"{', '.join(LIST_KEYS + VALUE_KEYS)}")
+        if key in LIST_KEYS:
+            job[key].extend(item for item in value.replace(",", " ").split())
+        elif key == "budget":
+            try:
+                job["budget"] = int(value)
+            except ValueError:
+                raise JobSpecError(f"line {number}: budget must be a number of seconds")
+        elif key == "resume":
+            if value.lower() not in ("yes", "no", "true", "false"):
+                raise JobSpecError(f"line {number}: resume must be 'yes' or 'no'")
+            job["resume"] = value.lower() in ("yes", "true")
+        else:
+            job[key] = value or None
+
+    unknown = [name for name in job["collectors"] if name not in COLLECTORS]
+    if unknown:
+        raise JobSpecError(f"unknown collectors {', '.join(unknown)} (available: {', '.join(COLLECTORS)})")
+    if not job["collectors"]:
+        raise JobSpecError("no collectors listed")
+    return job
+
+
+def _results():
+    if not os.path.isdir(TROUBLESHOOTING_DIR):
+        return set()
+    return {name for name in os.listdir(TROUBLESHOOTING_DIR)
+            if name not in _STATE_ENTRIES and not name.endswith(".part")}
+
+
+def _stored_runs():
+    if not dedup_store.STORE_ENABLED:
+        return set()
+    return {manifest["run"] for manifest in dedup_store.list_runs()}
+
+
+class _MessageLog:
+    """Sends console output to stderr and keeps the '[!]' lines for the status document."""
+
+    def __init__(self):
+        self.messages = []
+        self._line = ""
+
+    def write(self, text):
+        sys.stderr.write(text)
+        lines = (self._line + text).split("\n")
+        self._line = lines.pop()
+        self.messages.extend(line.strip() for line in lines if line.strip().startswith("[!]"))
+        return len(text)
+
+    def flush(self):
+        sys.stderr.flush()
+
+
+def _run_collector(name, job):
+    command = COLLECTORS[name]
+    if name == "s2s":
+        arguments = {"peers": job["peers"] or None}
+    elif name == "anyconnect":
+        arguments = {"tunnel_groups": job["tunnel_groups"] or None}
+    else:
+        arguments = {}
+
+    log = _MessageLog()
+    before, runs_before = _results(), _stored_runs()
+    started = time.monotonic()
+    status = {"collector": name}
+    try:
+        # The job's budget replaces FPTH_DUMP_BUDGET for the dump, so it can also be longer
+        with redirect_stdout(log), default_budget(job["budget"]), collection_budget():
+            command(**arguments)
+    except Exception as e:
+        status["error"] = str(e) or type(e).__name__
+
+    files = sorted(_results() - before)
+    runs = sorted(_stored_runs() - runs_before)
+    if job["output"] and os.path.abspath(job["output"]) != TROUBLESHOOTING_DIR:
+        os.makedirs(job["output"], exist_ok=True)
+        for filename in files:
+            shutil.move(os.path.join(TROUBLESHOOTING_DIR, filename), os.path.join(job["output"], filename))
+    output_dir = job["output"] or TROUBLESHOOTING_DIR
+
+    if os.path.exists(os.path.join(journal.JOURNAL_DIR, command.function_name, "journal.jsonl")):
+        status["status"] = "incomplete"
+    elif "error" in status or not (files or runs):
+        status["status"] = "failed"
+    else:
+        status["status"] = "ok"
+    status["seconds"] = round(time.monotonic() - started, 1)
+    # Runs stay in the store (see Show Tech - Stored Runs); they are listed by run ID
+    status["files"] = [os.path.join(output_dir, filename) for filename in files] + runs
+    status["messages"] = log.messages
+    return status
+
+
+def run_batch(job_path):
+    """
+    Runs the job file at job_path ('-' for stdin) and prints its JSON status document on stdout.
+    Returns EXIT_OK when every collector produced its files, EXIT_FAILED otherwise, and EXIT_INVALID_JOB for a
+    job file that cannot be run.
+    """
+    started = datetime.now()
+    document = {"job": job_path, "started": started.isoformat(timespec="seconds")}
+    try:
+        if job_path == "-":
+            job = parse_job_spec(sys.stdin.read())
+        else:
+            with open(job_path) as f:
+                job = parse_job_spec(f.read())
+    except (OSError, JobSpecError) as e:
+        document.update(status="invalid", error=str(e))
+        print(json.dumps(document, indent=2))
+        return EXIT_INVALID_JOB
+
+    # Nothing may wait for an answer: interrupted collections are resumed or restarted as the job says, and any
+    # other prompt fails its collector at once instead of hanging the run
+    journal.RESUME_MODE = job["resume"]
+    stdin = sys.stdin
+    sys.stdin = open(os.devnull)
+    try:
+        results = [_run_collector(name, job) for name in job["collectors"]]
+    finally:
+        sys.stdin.close()
+        sys.stdin = stdin
+
+    failed = [result for result in results if result["status"] != "ok"]
+    document.update(
+        status="failed" if failed else "ok",
+        finished=datetime.now().isoformat(timespec="seconds"),
+        output=job["output"] or TROUBLESHOOTING_DIR,
+        collectors=results,
+    )
+    report = json.dumps(document, indent=2)
+    if job["status"]:
+        try:
+            with open(job["status"], "w") as f:
+                f.write(report + "\n")
+        except OSError as e:
+            print(f"[!] Could not write the status file {job['status']}: {e}", file=sys.stderr)
+    print(report)
+    return EXIT_FAILED if failed else EXIT_OK
@@ -0,0 +1,199 @@
+# Description: This file implements the session-scoped response cache used by get_and_parse_cli_output and
+# run_system_command. Entries expire after a per-command TTL, the cache is bounded in entries and bytes (least
+# recently used entries are evicted first), and commands that change the device invalidate the entries that
+# depend on what they changed.
+#
+# It also provides shared_responses(), a scope in which every distinct CLI command is run only once no matter how
+# many collectors ask for it, used when several dumps (or many peers of one dump) are collected in one pass.
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+CACHE_ENABLED = os.environ.get("FPTH_CLI_CACHE", "1") != "0"
+MAX_ENTRIES = int(os.environ.get("FPTH_CLI_CACHE_ENTRIES", "256"))
+MAX_BYTES = int(os.environ.get("FPTH_CLI_CACHE_BYTES", str(32 * 1024 * 1024)))
+
+# (command prefix, TTL in seconds, dependency tag). Only commands matching a rule are cached; counters and
+# session tables (conn, xlate, traffic, SAs, ...) change constantly and are always fetched fresh.
+CACHE_RULES = (
+    ("show running-config", 300, "lina-config"),
+    ("show version", 3600, "lina-version"),
+    ("show crypto ca certificates", 300, "lina-config"),
+    ("OmniQuery.pl", 30, "mdb"),
+)
+
+# Commands that change the device, and the dependency tag whose entries they invalidate.
+WRITE_RULES = (
+    (re.compile(r"^LinaConfigTool\b"), "lina-config"),
+    (re.compile(r"^OmniQuery\.pl\b.*\b(delete|update|insert|replace)\b", re.IGNORECASE), "mdb"),
+    (re.compile(r"^remove_peer\.pl\b"), "mdb"),
+)
+
+_entries = OrderedDict()  # command -> (expires_at, tag, size, value)
+_total_bytes = 0
+_cache_lock = threading.Lock()
+_invalidation_callbacks = {}
+
+_shared = None  # command -> Future while a shared_responses() block is active
+_shared_stats = None
+_shared_lock = threading.Lock()
+
+
+def normalize_command(command):
+    """
+    Returns the canonical form of a CLI command so spelling variants of the same request share one execution and
+    one cache entry: surrounding whitespace is dropped, runs of whitespace in the command are collapsed and the
+    '|' before an output filter is spaced consistently. The filter pattern itself is kept as written.
+    """
+    command_part, separator, filter_part = command.partition("|")
+    command_part = " ".join(command_part.split())
+    if not separator:
+        return command_part
+    filter_name, _, pattern = filter_part.strip().partition(" ")
+    return f"{command_part} | {filter_name} {pattern.strip()}".rstrip()
+
+
+def _rule_for(command):
+    for prefix, ttl, tag in CACHE_RULES:
+        if command.startswith(prefix):
+            return ttl, tag
+    return None
+
+
+def _value_size(value):
+    if isinstance(value, str):
+        return len(value)
+    # subprocess.CompletedProcess from run_system_command
+    return len(getattr(value, "stdout", "") or "") + len(getattr(value, "stderr", "") or "")
+
+
+def _remove(command):
+    global _total_bytes
+    _, _, size, _ = _entries.pop(command)
+    _total_bytes -= size
+
+
+def get_cached(command):
+    """Returns the cached response for a command, or None if it is not cached or has expired."""
+    if not CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        entry = _entries.get(command)
+        if entry is None:
+            return None
+        if entry[0] < time.time():
+            _remove(command)
+            return None
+        _entries.move_to_end(command)
+        return entry[3]
+
+
+def store_cached(command, value):
+    """Caches a response if the command has a cache rule, evicting least recently used entries as needed."""
+    global _total_bytes
+
+    rule = _rule_for(command)
+    if not CACHE_ENABLED or rule is None:
+        return
+
+    ttl, tag = rule
+    size = _value_size(value)
+    if size > MAX_BYTES:
+        return
+
+    with _cache_lock:
+        if command in _entries:
+            _remove(command)
+        _entries[command] = (time.time() + ttl, tag, size, value)
+        _total_bytes += size
+        while len(_entries) > MAX_ENTRIES or _total_bytes > MAX_BYTES:
+            _remove(next(iter(_entries)))
+
+
+def invalidate_cli_cache(tag=None):
+    """Drops every cached entry with the given dependency tag (all entries if tag is None)."""
+    with _cache_lock:
+        for command in [command for command, entry in _entries.items() if tag is None or entry[1] == tag]:
+            _remove(command)
+        callbacks = [callback for callback_tag, registered in _invalidation_callbacks.items()
+                     if tag is None or callback_tag == tag for callback in registered]
+
+    for callback in callbacks:
+        callback()
+
+
+def on_invalidate(tag, callback):
+    """Registers a callback run whenever entries with the given tag are invalidated (e.g. derived caches)."""
+    with _cache_lock:
+        _invalidation_callbacks.setdefault(tag, []).append(callback)
+
+
+def invalidate_for_write(command):
+    """Invalidates the entries a command depends on if the command changes the device. Returns True if it did."""
+    for pattern, tag in WRITE_RULES:
+        if pattern.search(command):
+            invalidate_cli_cache(tag)
+            return True
+    return False
+
+
+@contextmanager
+def shared_responses():
+    """
+    Within the block, each distinct command runs once: callers asking for a command that is already running or
+    has already completed get the same result. Yields a dict counting 'commands' run and 'shared' answers.
+    """
+    global _shared, _shared_stats
+
+    with _shared_lock:
+        outermost = _shared is None
+        if outermost:
+            _shared = {}
+            _shared_stats = {"commands": 0, "shared": 0}
+        stats = _shared_stats
+    try:
+        yield stats
+    finally:
+        if outermost:
+            with _shared_lock:
+                _shared = None
+                _shared_stats = None
+
+
+def run_shared(command, function):
+    """
+    Returns function(command), running it only once per normalized command inside a shared_responses() block.
+    Every caller asking for the same command while the block is active is answered from that one execution.
+    """
+    command = normalize_command(command)
+    with _shared_lock:
+        if _shared is None:
+            future = None
+            owner = True
+        else:
+            future = _shared.get(command)
+            owner = future is None
+            if owner:
+                future = _shared[command] = Future()
+                _shared_stats["commands"] += 1
+            else:
+                _shared_stats["shared"] += 1
+
+    if not owner:
+        return future.result()
+    if future is None:
+        return function(command)
+
+    try:
+        result = function(command)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    future.set_result(result)
+    return result
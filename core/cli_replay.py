@@ -0,0 +1,102 @@
+# Description: This file implements the on-disk fixture store used to record raw ConvergedCliClient and OmniQuery
+# responses on a firewall and replay them later on any Linux workstation.
+#
+# FPTH_CLI_RECORD=<dir>  records every response the tool receives into <dir>.
+# FPTH_CLI_REPLAY=<dir>  answers every command from <dir> instead of running it on the device.
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+RECORD_DIR = os.environ.get("FPTH_CLI_RECORD")
+REPLAY_DIR = os.environ.get("FPTH_CLI_REPLAY")
+
+INDEX_FILE = "index.jsonl"
+
+_index_lock = threading.Lock()
+
+
+class CliReplayError(Exception):
+    """Raised when a replayed command has no recorded response."""
+
+
+def _entry_file(kind, command):
+    """Returns the fixture file name for a command; responses are keyed by a hash of the kind and command."""
+    digest = hashlib.sha1(f"{kind}\0{command}".encode("utf-8")).hexdigest()
+    return f"{kind}_{digest[:20]}.gz"
+
+
+def _add_to_index(kind, command, file_name):
+    """Appends an entry to the human-readable index so a capture can be listed without decompressing it."""
+    with _index_lock:
+        with open(os.path.join(RECORD_DIR, INDEX_FILE), "a") as f:
+            f.write(json.dumps({"kind": kind, "command": command, "file": file_name}) + "\n")
+
+
+def is_replaying():
+    return bool(REPLAY_DIR)
+
+
+def is_recording():
+    return bool(RECORD_DIR) and not REPLAY_DIR
+
+
+def record_response(kind, command, payload):
+    """Stores a response (str) for a command in the record directory."""
+    with open_recording(kind, command) as f:
+        f.write(payload.encode("utf-8"))
+
+
+@contextmanager
+def open_recording(kind, command):
+    """
+    Yields a binary file that writes the compressed response for a command.
+    Used directly when a response is streamed, so it never has to be held in memory.
+    """
+    os.makedirs(RECORD_DIR, exist_ok=True)
+    file_name = _entry_file(kind, command)
+    final_path = os.path.join(RECORD_DIR, file_name)
+    # Write to a temporary name so a half-written response is never replayed
+    temporary_path = f"{final_path}.{threading.get_ident()}.tmp"
+
+    f = gzip.open(temporary_path, "wb")
+    try:
+        yield f
+    except BaseException:
+        f.close()
+        os.remove(temporary_path)
+        raise
+    f.close()
+    os.replace(temporary_path, final_path)
+    _add_to_index(kind, command, file_name)
+
+
+def open_replay(kind, command):
+    """Returns a binary file object over the recorded response for a command."""
+    path = os.path.join(REPLAY_DIR, _entry_file(kind, command))
+    if not os.path.exists(path):
+        raise CliReplayError(f"No recorded response for '{command}' in {REPLAY_DIR}")
+    return gzip.open(path, "rb")
+
+
+def load_response(kind, command):
+    """Returns the recorded response (str) for a command."""
+    with open_replay(kind, command) as f:
+        return f.read().decode("utf-8", errors="replace")
+
+
+def list_recorded_commands(directory=None):
+    """Returns the (kind, command) pairs stored in a capture directory."""
+    directory = directory or REPLAY_DIR or RECORD_DIR
+    entries = {}
+    try:
+        with open(os.path.join(directory, INDEX_FILE)) as f:
+            for line in f:
+                entry = json.loads(line)
+                entries[(entry["kind"], entry["command"])] = entry["file"]
+    except FileNotFoundError:
+        pass
+    return sorted(entries)
@@ -0,0 +1,219 @@
+# Description: This file keeps a small pool of long-lived ConvergedCliClient processes so that every CLI command
+# does not pay process start-up and connection setup again.
+
+import atexit
+import os
+import queue
+import select
+import subprocess
+import threading
+import time
+from core.deadline import COMMAND_TIMEOUT, POLL_INTERVAL, CommandCancelled, CommandTimeout, check_cancelled, \
+    command_timeout, run_process
+
+CLI_CLIENT = "ConvergedCliClient"
+MESSAGE_END = b"</message>"
+
+# Number of persistent client processes to keep open. Set FPTH_CLI_POOL_SIZE=0 to always fork a fresh client.
+# Matches the default collector concurrency in core.executor so parallel dumps do not queue for a client.
+POOL_SIZE = int(os.environ.get("FPTH_CLI_POOL_SIZE", "4"))
+
+# Cheap command used to confirm a new persistent client answers, and the seconds to wait for it.
+PROBE_COMMAND = "show clock"
+PROBE_TIMEOUT = 15
+
+_idle_sessions = queue.LifoQueue()
+_all_sessions = []
+_pool_lock = threading.Lock()
+_persistent_supported = None
+
+
+class CliSessionError(Exception):
+    """Raised when a persistent ConvergedCliClient process stops answering."""
+
+
+class CliSession:
+    """A single ConvergedCliClient process that reads one command per line on stdin."""
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [CLI_CLIENT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+        self._buffer = bytearray()
+
+    def run(self, command, timeout=None):
+        """
+        Sends a command and returns the raw response up to and including the closing </message> tag.
+        Without an explicit timeout the command gets the per-command timeout, capped by the dump's time budget.
+        """
+        if timeout is None:
+            timeout = command_timeout(command)
+        expires_at = time.monotonic() + timeout if timeout else None
+
+        try:
+            self.process.stdin.write(command.encode("utf-8") + b"\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise CliSessionError(f"client is not accepting commands: {e}")
+
+        fd = self.process.stdout.fileno()
+        search_from = 0
+        while True:
+            end = self._buffer.find(MESSAGE_END, search_from)
+            if end != -1:
+                break
+            # The closing tag may straddle two reads, so re-scan the tail of the previous chunk
+            search_from = max(0, len(self._buffer) - len(MESSAGE_END))
+
+            # Wait in short slices so a cancellation is noticed while a slow command is running
+            wait = POLL_INTERVAL
+            if expires_at is not None:
+                wait = min(wait, expires_at - time.monotonic())
+                if wait <= 0:
+                    raise CommandTimeout(command, timeout)
+            ready, _, _ = select.select([fd], [], [], wait)
+            if not ready:
+                check_cancelled()
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise CliSessionError("client exited before completing the response")
+            self._buffer += chunk
+
+        end += len(MESSAGE_END)
+        response = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return response.decode("utf-8", errors="replace")
+
+    def close(self):
+        """Terminates the client process."""
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+def run_cli_command_once(command):
+    """Runs a single command in a fresh ConvergedCliClient process and returns its raw stdout."""
+    result = run_process(
+        [CLI_CLIENT, command], timeout=COMMAND_TIMEOUT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    return result.stdout
+
+
+def _open_session():
+    """Starts a persistent client and confirms it answers commands on stdin."""
+    global _persistent_supported
+
+    session = None
+    try:
+        session = CliSession()
+        session.run(PROBE_COMMAND, timeout=PROBE_TIMEOUT)
+    except CommandCancelled:
+        session.close()
+        raise
+    except (CliSessionError, CommandTimeout, OSError):
+        if session is not None:
+            session.close()
+        # A client that cannot be driven over stdin will never work, so stop trying for this run
+        _persistent_supported = False
+        return None
+
+    _persistent_supported = True
+    return session
+
+
+def _acquire_session():
+    """Returns an idle session, opening a new one while the pool is below POOL_SIZE."""
+    while _persistent_supported is not False:
+        try:
+            return _idle_sessions.get_nowait()
+        except queue.Empty:
+            pass
+
+        with _pool_lock:
+            can_open = len(_all_sessions) < POOL_SIZE
+            if can_open:
+                # Reserve the slot before the (slow) start-up so concurrent callers do not overshoot the pool
+                _all_sessions.append(None)
+
+        if not can_open:
+            try:
+                return _idle_sessions.get(timeout=1)
+            except queue.Empty:
+                continue
+
+        session = None
+        try:
+            session = _open_session()
+        finally:
+            with _pool_lock:
+                _all_sessions.remove(None)
+                if session is not None:
+                    _all_sessions.append(session)
+        return session
+    return None
+
+
+def _discard_session(session):
+    session.close()
+    with _pool_lock:
+        if session in _all_sessions:
+            _all_sessions.remove(session)
+
+
+def run_cli_command(command):
+    """
+    Runs a CLI command and returns the raw ConvergedCliClient response.
+
+    Commands are sent to a pooled persistent client when the client supports it, otherwise a fresh client
+    process is started for the command.
+    """
+    if POOL_SIZE <= 0 or _persistent_supported is False:
+        return run_cli_command_once(command)
+
+    session = _acquire_session()
+    if session is None:
+        return run_cli_command_once(command)
+
+    try:
+        output = session.run(command)
+    except CliSessionError:
+        # Drop the broken client; the next command opens a replacement
+        _discard_session(session)
+        check_cancelled()
+        return run_cli_command_once(command)
+    except BaseException:
+        # Timed out, cancelled or interrupted: the response is still pending, so the client cannot be reused
+        _discard_session(session)
+        raise
+
+    _idle_sessions.put(session)
+    return output
+
+
+def close_cli_sessions():
+    """Closes every persistent client process."""
+    with _pool_lock:
+        sessions = [session for session in _all_sessions if session is not None]
+        _all_sessions[:] = [session for session in _all_sessions if session is None]
+    for session in sessions:
+        session.close()
+    while True:
+        try:
+            _idle_sessions.get_nowait()
+        except queue.Empty:
+            break
+
+
+atexit.register(close_cli_sessions)
@@ -0,0 +1,258 @@
+# Description: This file streams large ConvergedCliClient responses line by line, so that tables such as
+# 'show conn detail' or 'show xlate detail' never have to be held in memory as a whole.
+
+import codecs
+import html
+import shutil
+import subprocess
+import threading
+import time
+from core import cli_replay
+from core.cli_session import CLI_CLIENT
+from core.deadline import CommandCancelled, CommandTimeout, cancel_commands, command_timeout, is_cancelled, \
+    tracked_process
+from core.journal import current_journal
+from core.profiling import profile_command
+
+CHUNK_SIZE = 65536
+
+# Longest HTML entity reference we need to hold back when a chunk ends in the middle of one.
+MAX_ENTITY_LENGTH = 40
+
+
+class _EntityDecoder:
+    """Incrementally HTML-unescapes text without splitting an entity reference across two chunks."""
+
+    def __init__(self):
+        self.pending = ""
+
+    def feed(self, text):
+        text = self.pending + text
+        amp = text.rfind("&")
+        if amp != -1 and ";" not in text[amp:] and len(text) - amp < MAX_ENTITY_LENGTH:
+            text, self.pending = text[:amp], text[amp:]
+        else:
+            self.pending = ""
+        return html.unescape(text)
+
+    def flush(self):
+        text, self.pending = self.pending, ""
+        return html.unescape(text)
+
+
+class _TagScanner:
+    """Passes through only the text between an opening tag (e.g. '<content') and its closing tag."""
+
+    def __init__(self, open_tag, close_tag):
+        self.open_tag = open_tag
+        self.close_tag = close_tag
+        self.state = "before"
+        self.pending = ""
+
+    def feed(self, text):
+        text = self.pending + text
+        self.pending = ""
+
+        if self.state == "before":
+            start = text.find(self.open_tag)
+            if start == -1:
+                # Keep enough of the tail to spot an opening tag that straddles two chunks
+                self.pending = text[-len(self.open_tag):]
+                return ""
+            tag_end = text.find(">", start)
+            if tag_end == -1:
+                self.pending = text[start:]
+                return ""
+            self.state = "inside"
+            text = text[tag_end + 1:]
+
+        if self.state == "inside":
+            end = text.find(self.close_tag)
+            if end != -1:
+                self.state = "after"
+                return text[:end]
+            keep = len(self.close_tag) - 1
+            if len(text) > keep:
+                self.pending = text[-keep:]
+                return text[:-keep]
+            self.pending = text
+            return ""
+
+        return ""
+
+    def flush(self):
+        text, self.pending = self.pending, ""
+        return text if self.state == "inside" else ""
+
+
+def _raw_chunks(command):
+    """Yields the raw ConvergedCliClient response in chunks, from the device or from a recorded capture."""
+    if cli_replay.is_replaying():
+        with cli_replay.open_replay("cli", command) as f:
+            yield from iter(lambda: f.read(CHUNK_SIZE), b"")
+        return
+
+    timeout = command_timeout(command)
+    process = subprocess.Popen([CLI_CLIENT, command], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+    # Reads block until the client writes, so a watchdog kills a client that runs past its timeout
+    timed_out = threading.Event()
+
+    def expire():
+        timed_out.set()
+        process.kill()
+
+    def check_complete():
+        # Raised inside the recording block so a truncated response is never saved as a fixture
+        if timed_out.is_set():
+            raise CommandTimeout(command, timeout)
+        if is_cancelled() and process.wait() < 0:
+            raise CommandCancelled(f"'{command}' was cancelled")
+
+    watchdog = threading.Timer(timeout, expire) if timeout else None
+    with tracked_process(process):
+        try:
+            if watchdog is not None:
+                watchdog.daemon = True
+                watchdog.start()
+            if cli_replay.is_recording():
+                with cli_replay.open_recording("cli", command) as recording:
+                    for chunk in iter(lambda: process.stdout.read1(CHUNK_SIZE), b""):
+                        recording.write(chunk)
+                        yield chunk
+                    check_complete()
+            else:
+                yield from iter(lambda: process.stdout.read1(CHUNK_SIZE), b"")
+                check_complete()
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+            process.stdout.close()
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+
+
+def stream_cli_output(command):
+    """
+    Runs a command in its own ConvergedCliClient process and yields the CLI output one line at a time.
+
+    The <content> payload is decoded as it arrives, so memory use stays bounded by the chunk size regardless of
+    how large the table is. Like get_and_parse_cli_output, leading and trailing blank lines are dropped.
+    """
+    content_scanner = _TagScanner("<content", "</content>")
+    xml_decoder = _EntityDecoder()
+    html_decoder = _EntityDecoder()
+    cli_scanner = _TagScanner("<cli", "</cli>")
+    utf8_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    partial_line = ""
+    blank_lines = []
+    seen_text = False
+
+    def decode(chunk, final=False):
+        content = content_scanner.feed(chunk)
+        if final:
+            content += content_scanner.flush()
+        text = xml_decoder.feed(content)
+        if final:
+            text += xml_decoder.flush()
+        text = html_decoder.feed(text)
+        if final:
+            text += html_decoder.flush()
+        return cli_scanner.feed(text) + (cli_scanner.flush() if final else "")
+
+    with profile_command(command) as profile:
+        chunks = _raw_chunks(command)
+        try:
+            while True:
+                raw = next(chunks, b"")
+                final = not raw
+                parse_start = time.perf_counter()
+                text = partial_line + decode(utf8_decoder.decode(raw, final), final)
+                profile["parse_time"] += time.perf_counter() - parse_start
+                profile["bytes"] += len(raw)
+
+                lines = text.split("\n")
+                partial_line = "" if final else lines.pop()
+
+                for line in lines:
+                    if not line.strip():
+                        # Hold blank lines back until we know they are not trailing ones
+                        if seen_text:
+                            blank_lines.append(line)
+                        continue
+                    if not seen_text:
+                        line = line.lstrip()
+                        seen_text = True
+                    yield from blank_lines
+                    blank_lines = []
+                    yield line
+
+                if final:
+                    break
+        finally:
+            chunks.close()
+
+    if content_scanner.state == "before":
+        raise Exception("Failed to extract CLI output from response.")
+
+
+def write_cli_output(command, file):
+    """Streams a command's CLI output into an open text file and returns the number of lines written."""
+    line_count = 0
+    for line in stream_cli_output(command):
+        file.write(line + "\n")
+        line_count += 1
+    return line_count
+
+
+class _Tee:
+    """Text file writing everything to two files."""
+
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+
+    def write(self, text):
+        self.first.write(text)
+        self.second.write(text)
+        return len(text)
+
+
+class StreamedCliOutput:
+    """
+    Placeholder for a section whose output should be streamed straight into the dump file
+    instead of being collected as a string first.
+    """
+
+    def __init__(self, command):
+        self.command = command
+
+    def write_to(self, file):
+        journal = current_journal()
+        key = f"stream:{self.command}"
+
+        # Inside a @journaled dump the stream is checkpointed too, and a resumed dump copies it back
+        stored = journal.open_output(key) if journal is not None else None
+        if stored is not None:
+            with stored:
+                shutil.copyfileobj(stored, file)
+            return
+
+        try:
+            if journal is None:
+                write_cli_output(self.command, file)
+            else:
+                with journal.recording(key) as checkpoint:
+                    write_cli_output(self.command, _Tee(file, checkpoint))
+        except KeyboardInterrupt:
+            # Keep what was streamed so far and let the dump finish writing the other sections
+            cancel_commands()
+            if journal is not None:
+                journal.mark_incomplete()
+            file.write("[!] Cancelled\n")
+        except Exception as e:
+            if journal is not None:
+                journal.check_interrupted()
+            file.write(f"[!] Error: {e}\n")
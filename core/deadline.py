@@ -0,0 +1,190 @@
+# Description: This file implements the per-command timeouts, the overall time budget of a Show Tech dump and the
+# cooperative cancellation used when Ctrl-C is pressed while a dump is collecting.
+#
+# Every command asks command_timeout() how long it may run. That is its own timeout capped by whatever is left of
+# the dump's budget, so a single hung command can no longer stall a whole dump. Child processes are registered
+# while they run so cancel_commands() can kill them.
+
+import os
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+# Seconds a single CLI command may run (0 disables the limit).
+COMMAND_TIMEOUT = int(os.environ.get("FPTH_COMMAND_TIMEOUT", "300"))
+
+# Seconds a whole dump may spend collecting (0 disables the limit).
+DUMP_BUDGET = int(os.environ.get("FPTH_DUMP_BUDGET", "1200"))
+
+# Seconds between checks for cancellation while waiting on a command.
+POLL_INTERVAL = 0.5
+
+_cancelled = threading.Event()
+_deadline = None
+# Budget of collection_budget() calls that give none, instead of DUMP_BUDGET (see default_budget())
+_default_budget = None
+_budget_depth = 0
+_budget_lock = threading.Lock()
+_processes = set()
+_processes_lock = threading.Lock()
+
+
+class CommandTimeout(subprocess.TimeoutExpired):
+    """Raised when a command runs past its timeout or the dump's time budget is used up."""
+
+    def __init__(self, cmd, timeout, reason=None):
+        super().__init__(cmd, timeout)
+        self.reason = reason
+
+    def __str__(self):
+        return self.reason or f"'{self.cmd}' did not finish within {self.timeout:.0f} seconds"
+
+
+class CommandCancelled(Exception):
+    """Raised when a command is cancelled (e.g. Ctrl-C during a dump)."""
+
+
+def is_cancelled():
+    return _cancelled.is_set()
+
+
+def check_cancelled():
+    """Raises CommandCancelled if collection has been cancelled."""
+    if _cancelled.is_set():
+        raise CommandCancelled("collection cancelled")
+
+
+def budget_exhausted():
+    """Returns True if the time budget of the running dump has been used up."""
+    deadline = _deadline
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def command_timeout(command, timeout=COMMAND_TIMEOUT):
+    """
+    Returns the seconds a command may run: its own timeout capped by what is left of the dump's budget.
+    None means no limit. Raises CommandCancelled or CommandTimeout if the command should not start at all.
+    """
+    check_cancelled()
+    deadline = _deadline
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise CommandTimeout(command, 0, f"time budget used up before '{command}' could run")
+        timeout = min(timeout, remaining) if timeout else remaining
+    return timeout or None
+
+
+def cancel_commands():
+    """Cancels collection: running child processes are killed and commands not started yet are skipped."""
+    _cancelled.set()
+    with _processes_lock:
+        processes = list(_processes)
+    for process in processes:
+        _kill(process)
+
+
+def _kill(process):
+    try:
+        if process.poll() is None:
+            process.kill()
+    except OSError:
+        pass
+
+
+@contextmanager
+def tracked_process(process):
+    """Registers a child process so cancel_commands() can kill it while it runs."""
+    with _processes_lock:
+        _processes.add(process)
+    # Cancelled between the caller's check and the registration
+    if _cancelled.is_set():
+        _kill(process)
+    try:
+        yield process
+    finally:
+        with _processes_lock:
+            _processes.discard(process)
+
+
+def run_process(args, timeout=None, **popen_kwargs):
+    """
+    Runs a child process to completion like subprocess.run(), honouring the timeout, the dump's time budget and
+    cancellation. Returns a subprocess.CompletedProcess.
+    """
+    command = args if isinstance(args, str) else " ".join(args)
+    timeout = command_timeout(command, timeout)
+
+    process = subprocess.Popen(args, **popen_kwargs)
+    with tracked_process(process):
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise CommandTimeout(command, timeout)
+        except BaseException:
+            # KeyboardInterrupt or similar; never leave the child running
+            process.kill()
+            process.wait()
+            raise
+
+    if _cancelled.is_set() and process.returncode < 0:
+        raise CommandCancelled(f"'{command}' was cancelled")
+    return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+
+
+@contextmanager
+def collection_budget(seconds=None):
+    """
+    Applies a time budget (DUMP_BUDGET, or the one set by default_budget()) to every command run inside the block.
+    Nested budgets keep the earlier deadline. A cancellation stays in effect until the outermost budget ends.
+    """
+    global _deadline, _budget_depth
+
+    if seconds is None:
+        seconds = DUMP_BUDGET if _default_budget is None else _default_budget
+    with _budget_lock:
+        previous_deadline = _deadline
+        if seconds:
+            deadline = time.monotonic() + seconds
+            _deadline = deadline if previous_deadline is None else min(previous_deadline, deadline)
+        _budget_depth += 1
+    try:
+        yield
+    finally:
+        with _budget_lock:
+            _deadline = previous_deadline
+            _budget_depth -= 1
+            if _budget_depth == 0:
+                _cancelled.clear()
+
+
+@contextmanager
+def default_budget(seconds):
+    """
+    Replaces DUMP_BUDGET inside the block as the budget of every dump that does not give its own, e.g. with a batch
+    job's budget, which may then be longer than FPTH_DUMP_BUDGET. None keeps DUMP_BUDGET.
+    """
+    global _default_budget
+
+    previous = _default_budget
+    if seconds is not None:
+        _default_budget = seconds
+    try:
+        yield
+    finally:
+        _default_budget = previous
+
+
+def budgeted(function):
+    """Decorator running a whole dump function inside collection_budget()."""
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with collection_budget():
+            return function(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,256 @@
+# Description: This file implements the content-addressed store for repeated Show Tech runs. With
+# FPTH_DEDUP_STORE=1 the dumps write into /var/log/fp_troubleshooting_data/store instead of a new archive per run:
+# every file of the run is cut into chunks, each chunk is saved once under its SHA-256 and the run itself is only a
+# small JSON manifest listing its files and their chunk hashes. Sections that did not change since an earlier run
+# (running-config, 'show version', failover and VRF config, ...) therefore take no additional disk space.
+#
+# Chunks are cut at line boundaries: before every section rule written by the dumps, and otherwise wherever the
+# CRC of a line hits a fixed pattern, so an edit in one section only changes the chunks around it. Any stored run
+# can be materialized back into a normal archive.
+#
+# Several processes (the menu, a --batch job, a cron run) may use the store at once. A run holds the store's lock
+# shared while it writes, and garbage collection only removes chunks while it holds the lock exclusively, so it
+# never deletes a chunk that a run still being written has stored or reused before that run's manifest exists.
+
+import fcntl
+import hashlib
+import json
+import os
+import time
+import zlib
+from contextlib import contextmanager
+from core.archive import ArchiveWriter
+
+TROUBLESHOOTING_DIR = "/var/log/fp_troubleshooting_data"
+STORE_DIR = os.path.join(TROUBLESHOOTING_DIR, "store")
+LOCK_PATH = os.path.join(STORE_DIR, "lock")
+STORE_ENABLED = os.environ.get("FPTH_DEDUP_STORE", "0") == "1"
+
+# Opening and closing line of every section written by the dumps; a chunk always starts at one
+SECTION_RULE = ("=" * 80 + "\n").encode()
+
+MIN_CHUNK_SIZE = 16 * 1024
+MAX_CHUNK_SIZE = 1024 * 1024
+# A line whose CRC is divisible by this ends a chunk (once the chunk is at least MIN_CHUNK_SIZE)
+CHUNK_LINE_DIVISOR = 64
+
+
+def _chunk_path(digest):
+    return os.path.join(STORE_DIR, "chunks", digest[:2], f"{digest}.gz")
+
+
+def _manifest_path(run_id):
+    return os.path.join(STORE_DIR, "runs", f"{run_id}.json")
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.part"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+@contextmanager
+def _store_lock(exclusive=False):
+    """
+    Holds the store lock across processes: shared while a run is written, exclusive while chunks are removed.
+    An exclusive lock is not waited for; the block gets False when another run holds the store.
+    """
+    os.makedirs(STORE_DIR, exist_ok=True)
+    with open(LOCK_PATH, "a") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB if exclusive else fcntl.LOCK_SH)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class _ChunkedMember:
+    """Text file that cuts what is written to it into chunks and saves every chunk not yet in the store."""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.chunks = []
+        self.size = 0
+        self._chunk = bytearray()
+        self._partial_line = b""
+
+    def _cut(self):
+        if self._chunk:
+            self.chunks.append(self.writer.save_chunk(bytes(self._chunk)))
+            self._chunk = bytearray()
+
+    def write(self, text):
+        encoded = text.encode("utf-8", errors="replace")
+        data = self._partial_line + encoded
+        lines = data.split(b"\n")
+        self._partial_line = lines.pop()
+        for line in lines:
+            line += b"\n"
+            if line == SECTION_RULE:
+                self._cut()
+            self._chunk += line
+            if len(self._chunk) >= MAX_CHUNK_SIZE or (
+                    len(self._chunk) >= MIN_CHUNK_SIZE and zlib.crc32(line) % CHUNK_LINE_DIVISOR == 0):
+                self._cut()
+        self.size += len(encoded)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self._chunk += self._partial_line
+        self._partial_line = b""
+        self._cut()
+
+
+class StoreWriter:
+    """
+    Drop-in replacement for ArchiveWriter that records a run in the store. The manifest is only written once
+    every file of the run has been stored, so an interrupted dump never shows up as a run. The store lock is held
+    shared from the first chunk to the manifest, so no garbage collection removes the chunks of the run meanwhile.
+    """
+
+    def __init__(self, run_id):
+        self.run_id = run_id
+        self.path = _manifest_path(run_id)
+        self.members = []
+        self.stats = {"chunks": 0, "new_chunks": 0, "bytes": 0, "new_bytes": 0}
+        self._lock = None
+
+    def __enter__(self):
+        self._lock = _store_lock()
+        self._lock.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                manifest = {"run": self.run_id, "created": time.time(), "members": self.members}
+                _write_atomic(self.path, json.dumps(manifest, indent=1).encode())
+                print(f"[+] Stored run {self.run_id}: {self.stats['new_chunks']} of {self.stats['chunks']} chunks "
+                      f"new, {self.stats['new_bytes']} of {self.stats['bytes']} bytes added to the store")
+        finally:
+            self._lock.__exit__(None, None, None)
+        return False
+
+    def save_chunk(self, data):
+        """Saves a chunk unless the store already holds it, and returns its hash."""
+        from core.retention import check_free_space
+
+        digest = hashlib.sha256(data).hexdigest()
+        path = _chunk_path(digest)
+        self.stats["chunks"] += 1
+        self.stats["bytes"] += len(data)
+        if not os.path.exists(path):
+            check_free_space(STORE_DIR, len(data))
+            _write_atomic(path, zlib.compress(data, 6))
+            self.stats["new_chunks"] += 1
+            self.stats["new_bytes"] += len(data)
+        return digest
+
+    def member(self, name):
+        """Returns a text file; everything written to it is stored as the file 'name' of the run."""
+        return _StoredMember(self, name)
+
+    def add_text(self, name, content):
+        """Stores a file holding the given text."""
+        with self.member(name) as f:
+            f.write(content)
+
+
+class _StoredMember:
+    def __init__(self, writer, name):
+        self.writer = writer
+        self.name = name
+
+    def __enter__(self):
+        self.file = _ChunkedMember(self.writer)
+        return self.file
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.file.close()
+            self.writer.members.append({"name": self.name, "size": self.file.size, "chunks": self.file.chunks})
+        return False
+
+
+def list_runs():
+    """Returns the manifests of every stored run, oldest first."""
+    runs_dir = os.path.join(STORE_DIR, "runs")
+    if not os.path.isdir(runs_dir):
+        return []
+
+    manifests = []
+    for filename in os.listdir(runs_dir):
+        if filename.endswith(".json"):
+            with open(os.path.join(runs_dir, filename)) as f:
+                manifests.append(json.load(f))
+    return sorted(manifests, key=lambda manifest: manifest["created"])
+
+
+def load_run(run_id):
+    """Returns the manifest of a stored run."""
+    with open(_manifest_path(run_id)) as f:
+        return json.load(f)
+
+
+def read_chunk(digest):
+    """Returns the content of a stored chunk, checking it against its hash."""
+    with open(_chunk_path(digest), "rb") as f:
+        data = zlib.decompress(f.read())
+    if hashlib.sha256(data).hexdigest() != digest:
+        raise Exception(f"Chunk {digest} in the store is corrupted")
+    return data
+
+
+def materialize_run(run_id, output_dir=TROUBLESHOOTING_DIR, codec=None, level=None):
+    """Writes a stored run back into a normal archive in output_dir and returns the archive path."""
+    manifest = load_run(run_id)
+    with ArchiveWriter(os.path.join(output_dir, run_id), codec, level) as archive:
+        for member in manifest["members"]:
+            with archive.member(member["name"]) as f:
+                for digest in member["chunks"]:
+                    f.write(read_chunk(digest).decode("utf-8", errors="replace"))
+    return archive.path
+
+
+def delete_run(run_id):
+    """Removes a run's manifest; its chunks are removed by collect_garbage() once no other run uses them."""
+    os.remove(_manifest_path(run_id))
+
+
+def collect_garbage():
+    """
+    Removes every chunk no stored run refers to and returns the number of bytes freed. While another run is being
+    written (in this or another process) nothing is removed; the chunks are collected by a later call.
+    """
+    chunks_dir = os.path.join(STORE_DIR, "chunks")
+    if not os.path.isdir(chunks_dir):
+        return 0
+
+    with _store_lock(exclusive=True) as locked:
+        if not locked:
+            print("[+] The store is in use by a run being written; unused chunks are removed later.")
+            return 0
+
+        referenced = set()
+        for manifest in list_runs():
+            for member in manifest["members"]:
+                referenced.update(member["chunks"])
+
+        freed = 0
+        for prefix in os.listdir(chunks_dir):
+            prefix_dir = os.path.join(chunks_dir, prefix)
+            for filename in os.listdir(prefix_dir):
+                if filename[:-len(".gz")] not in referenced:
+                    path = os.path.join(prefix_dir, filename)
+                    freed += os.path.getsize(path)
+                    os.remove(path)
+        return freed
@@ -0,0 +1,129 @@
+# Description: This file provides the shared thread pool the dump_all_* collectors use to run their commands
+# concurrently while still getting the results back in the order they asked for them.
+
+import os
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from core.deadline import cancel_commands, collection_budget
+from core.journal import current_journal
+
+# Upper bound on how many collectors run against LINA at the same time.
+MAX_PARALLEL_COMMANDS = int(os.environ.get("FPTH_MAX_PARALLEL_COMMANDS", "4"))
+
+# Output written for a section that was not collected because the dump was interrupted.
+CANCELLED_OUTPUT = "[!] Cancelled: collection was interrupted before this section completed"
+
+
+def _run_collector(function):
+    """Calls a collector with suppress_output=True, turning an unexpected exception into an error string."""
+    try:
+        return function(suppress_output=True)
+    except Exception as e:
+        return f"[!] Error: {e}"
+
+
+def _checkpointed(journal, title, function):
+    """
+    Returns the output a resumed dump already collected for a section, or wraps the collector so its output is
+    checkpointed in the journal as soon as it completes. Errors are not checkpointed, so a resume retries them.
+    """
+    if not callable(function):
+        return function
+
+    key = title if isinstance(title, str) else repr(title)
+    stored = journal.get(key)
+    if stored is not None:
+        return stored
+
+    def collect(suppress_output=True):
+        output = function(suppress_output=suppress_output)
+        if isinstance(output, str) and not output.startswith("[!] "):
+            try:
+                journal.record(key, output)
+            except OSError:
+                pass  # The section is still written to the dump, it just cannot be resumed
+        return output
+
+    return collect
+
+
+def run_collectors(collectors, max_workers=None):
+    """
+    Runs a list of (title, function) collectors concurrently and returns (title, output) pairs in the same order.
+
+    Each function is called with suppress_output=True; use functools.partial for any extra arguments.
+    Entries that are not callable (e.g. StreamedCliOutput placeholders) are passed through unchanged.
+
+    Collection runs inside the dump's time budget. On Ctrl-C the running commands are cancelled and the sections
+    that already completed are still returned, with the others marked as cancelled.
+
+    Inside a @journaled dump, sections completed by an interrupted earlier run are re-used instead of collected.
+    """
+    max_workers = max_workers or MAX_PARALLEL_COMMANDS
+
+    journal = current_journal()
+    if journal is not None:
+        collectors = [(title, _checkpointed(journal, title, function)) for title, function in collectors]
+
+    with collection_budget():
+        results = _run_collectors(collectors, max_workers)
+        if journal is not None:
+            journal.check_interrupted()
+            if any(output == CANCELLED_OUTPUT for _, output in results):
+                journal.mark_incomplete()
+        return results
+
+
+def _run_collectors(collectors, max_workers):
+    """Runs the collectors on the shared pool (or one after another) and returns (title, output) pairs."""
+    if max_workers <= 1:
+        results = []
+        try:
+            for title, function in collectors:
+                results.append((title, _run_collector(function) if callable(function) else function))
+        except KeyboardInterrupt:
+            _report_interrupt()
+        return results + [(title, CANCELLED_OUTPUT) for title, _ in collectors[len(results):]]
+
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            (title, pool.submit(_run_collector, function) if callable(function) else None, function)
+            for title, function in collectors
+        ]
+        try:
+            return [(title, future.result() if future is not None else function)
+                    for title, future, function in futures]
+        except KeyboardInterrupt:
+            _report_interrupt()
+            # Cancelled commands fail fast, so every collector that was running returns shortly
+            return [(title, _cancelled_result(future)) for title, future, _ in futures]
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _report_interrupt():
+    print("\n[!] Interrupted: cancelling running commands and keeping the sections that completed...")
+    cancel_commands()
+
+
+def _cancelled_result(future):
+    if future is None or future.cancelled():
+        return CANCELLED_OUTPUT
+    try:
+        return future.result()
+    except CancelledError:
+        return CANCELLED_OUTPUT
+
+
+def run_commands(commands, function, max_workers=None):
+    """
+    Runs function(command) for every command concurrently and returns the results in the same order.
+    Typically used with get_and_parse_cli_output for a plain list of CLI commands.
+    """
+    max_workers = max_workers or MAX_PARALLEL_COMMANDS
+
+    if max_workers <= 1:
+        return [function(command) for command in commands]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(function, commands))
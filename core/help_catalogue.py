@@ -0,0 +1,108 @@
+# Description: This file loads the help catalogue (help_catalogue.json) and prints help pages from it. Every
+# command's help text and every '*_help' menu page lives in the catalogue, keyed by the function it documents, and
+# the file is only read the first time help is requested.
+
+import json
+import os
+import threading
+
+CATALOGUE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "help_catalogue.json")
+
+_catalogue = None
+_catalogue_lock = threading.Lock()
+
+
+def _load_catalogue():
+    global _catalogue
+
+    with _catalogue_lock:
+        if _catalogue is None:
+            with open(CATALOGUE_PATH, encoding="utf-8") as f:
+                _catalogue = json.load(f)
+        return _catalogue
+
+
+def get_help(key):
+    """
+    Returns the catalogue entry for a function name (following aliases), or None if there is none. An alias whose
+    page differs in a field or two finds them under 'overrides' in the entry it points to.
+    """
+    catalogue = _load_catalogue()
+    entry = catalogue["entries"].get(catalogue["aliases"].get(key, key))
+    if entry is not None and key in entry.get("overrides", {}):
+        entry = dict(entry, **entry["overrides"][key])
+    return entry
+
+
+def help_keys():
+    """Returns every documented function name, aliases included."""
+    catalogue = _load_catalogue()
+    return sorted(list(catalogue["entries"]) + list(catalogue["aliases"]))
+
+
+def _title(entry):
+    if "title" in entry:
+        return entry["title"]
+    command = entry["command"] if "command" in entry else ", ".join(entry["commands"])
+    icon = f"{entry['icon']} " if "icon" in entry else ""
+    return f"{icon}Help for: {command}"
+
+
+def print_help(key):
+    """Prints the help page for a function from the catalogue."""
+    entry = get_help(key)
+    if entry is None:
+        print(f"\n[!] No help available for: {key}")
+        return
+
+    # Pages keep the layout they were written with: '-' or '=' rules, with or without an icon in the title
+    rule = entry.get("rule", "-")
+    print("\n" + rule * 80)
+    print(_title(entry).center(80))
+    print(rule * 80)
+
+    if "description" in entry:
+        # Some pages have always labelled their description
+        label = "Description:\n" if entry.get("description_label") else ""
+        print(f"\n{label}{entry['description']}\n")
+
+    for section, lines in entry.get("help_sections", {}).items():
+        print(f"\n🟢 {section}")
+        for line in lines:
+            print(f"   {line}")
+
+    if "troubleshooting_steps" in entry:
+        print("Troubleshooting Steps:")
+        for step in entry["troubleshooting_steps"]:
+            print(f"   {step}")
+        print()
+
+    if isinstance(entry.get("commands"), dict):
+        # Pages covering several commands carry one description and example per command
+        for command, description in entry["commands"].items():
+            if "command_icon" in entry:
+                print(f"\n{entry['command_icon']} Command: {command}")
+                print(f"   {description}")
+            else:
+                print(f"\nCommand: {command}")
+                print(description)
+            print("\nExample Output:")
+            print(entry["example_output"].get(command, "No example available."))
+            print("-" * 80)
+    elif "example_output" in entry:
+        print("Example Output:")
+        print(entry["example_output"])
+
+    if "notes" in entry:
+        print("\nNotes:")
+        print(entry["notes"])
+
+    if "related_commands" in entry:
+        print("\nRelated Commands:")
+        for related in entry["related_commands"]:
+            print(f"  - {related['command']}: {related['description']}")
+
+    if "tip" in entry:
+        print("\n" + "=" * 80)
+        print(entry["tip"])
+        print("=" * 80)
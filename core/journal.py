@@ -0,0 +1,243 @@
+# Description: This file implements the checkpoint journal that makes long Show Tech collections resumable. While a
+# @journaled dump runs, every section (and every S2S peer) that completes is saved under
+# /var/log/fp_troubleshooting_data/journal/<dump>/ and then appended to the dump's journal.jsonl. The output is
+# written and synced before its journal line, so every line refers to complete output.
+#
+# A dump that finishes normally deletes its journal. One interrupted by Ctrl-C, its time budget, an SSH drop or a
+# failover keeps it, and 'python3 fp_troubleshooting_helper.py --resume' runs it again with the same arguments (e.g.
+# the S2S peers it was asked for), re-using the completed sections and collecting only the remainder.
+
+import gzip
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from core.deadline import budget_exhausted, is_cancelled
+
+JOURNAL_DIR = "/var/log/fp_troubleshooting_data/journal"
+
+# True with --resume, False when collections must always start fresh, None to ask when a terminal is attached
+RESUME_MODE = None
+
+_active_journal = None
+
+
+class Journal:
+    """Checkpoint journal of one dump: which keys completed and where their output is stored."""
+
+    def __init__(self, name, function_path=None, arguments=None):
+        self.name = name
+        self.function_path = function_path
+        # Keyword arguments of the interrupted call, passed again on resume
+        self.arguments = arguments or {}
+        self.directory = os.path.join(JOURNAL_DIR, name)
+        self.path = os.path.join(self.directory, "journal.jsonl")
+        self.entries = {}
+        self.started = time.time()
+        self.complete = True
+        self._files = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, name):
+        """Loads an existing journal, ignoring a last line that was cut off or refers to missing output."""
+        journal = cls(name)
+        with open(journal.path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if "collection" in entry:
+                    journal.function_path = entry["function"]
+                    journal.arguments = entry.get("arguments") or {}
+                    journal.started = entry["started"]
+                elif os.path.exists(os.path.join(journal.directory, entry["file"])):
+                    journal.entries[entry["key"]] = entry["file"]
+                journal._files += 1
+        return journal
+
+    def start(self):
+        """Creates an empty journal on disk."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory)
+        header = {"collection": self.name, "function": self.function_path, "arguments": self.arguments,
+                  "started": self.started}
+        self._append(header)
+
+    def _append(self, entry):
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def open_output(self, key):
+        """Returns the stored output of a completed key as an open text file, or None if it has not completed."""
+        filename = self.entries.get(key)
+        if filename is None:
+            return None
+        return gzip.open(os.path.join(self.directory, filename), "rt", encoding="utf-8")
+
+    def get(self, key):
+        """Returns the stored output of a completed key, or None if it has not completed."""
+        f = self.open_output(key)
+        if f is None:
+            return None
+        with f:
+            return f.read()
+
+    @contextmanager
+    def recording(self, key):
+        """
+        Yields a text file to write a key's output into. The key is recorded as completed only if the block
+        finishes without an exception.
+        """
+        with self._lock:
+            self._files += 1
+            filename = f"{self._files}.gz"
+        part_path = os.path.join(self.directory, f"{filename}.part")
+        try:
+            with gzip.open(part_path, "wt", encoding="utf-8", compresslevel=1) as f:
+                yield f
+            with open(part_path, "rb") as f:
+                os.fsync(f.fileno())
+            os.replace(part_path, os.path.join(self.directory, filename))
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        with self._lock:
+            self._append({"key": key, "file": filename})
+            self.entries[key] = filename
+
+    def record(self, key, output):
+        """Records a key as completed with the given output."""
+        with self.recording(key) as f:
+            f.write(output)
+
+    def mark_incomplete(self):
+        """Keeps the journal when the dump returns: something was interrupted and can be resumed."""
+        self.complete = False
+
+    def check_interrupted(self):
+        """Marks the journal incomplete if the collection was cancelled or ran out of its time budget."""
+        if is_cancelled() or budget_exhausted():
+            self.mark_incomplete()
+
+    def discard(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def current_journal():
+    """Returns the journal of the dump being collected, or None."""
+    return _active_journal
+
+
+def pending_journals():
+    """Returns the journals of every interrupted collection, oldest first."""
+    if not os.path.isdir(JOURNAL_DIR):
+        return []
+
+    journals = []
+    for name in os.listdir(JOURNAL_DIR):
+        try:
+            journals.append(Journal.load(name))
+        except (OSError, ValueError):
+            continue
+    return sorted(journals, key=lambda journal: journal.started)
+
+
+def _should_resume(journal):
+    if RESUME_MODE is not None:
+        return RESUME_MODE
+    if not sys.stdin.isatty():
+        return False
+
+    started = datetime.fromtimestamp(journal.started).strftime("%Y-%m-%d %H:%M:%S")
+    answer = input(f"[?] An interrupted '{journal.name}' collection from {started} has {len(journal.entries)} "
+                   f"completed sections. Resume it? (y/n): ").strip().lower()
+    return answer == "y"
+
+
+def journaled(function):
+    """
+    Decorator making a dump resumable. Sections collected through run_collectors, streamed sections and S2S peers
+    are checkpointed in the dump's journal, which is removed once the dump finishes without interruption.
+    The call's keyword arguments are kept in the journal; a journal is only resumed by a call with the same ones.
+    """
+    name = function.__name__
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        global _active_journal
+
+        if current_journal() is not None:
+            # Nested inside another journaled dump (e.g. collect everything); use the outer journal
+            return function(*args, **kwargs)
+
+        try:
+            # Stored as JSON, so compared in that form (tuples become lists); None is the same as not passing it
+            arguments = json.loads(json.dumps({key: value for key, value in kwargs.items() if value is not None}))
+        except (TypeError, ValueError) as e:
+            print(f"[!] The collection will not be resumable, its arguments cannot be recorded: {e}")
+            return function(*args, **kwargs)
+
+        journal = None
+        if os.path.exists(os.path.join(JOURNAL_DIR, name, "journal.jsonl")):
+            try:
+                journal = Journal.load(name)
+            except (OSError, ValueError):
+                journal = None
+            if journal is not None and journal.arguments != arguments:
+                # Sections of another selection (e.g. other S2S peers) must not be mixed into this one
+                print(f"[!] The interrupted '{name}' collection was run with other arguments; starting over")
+                journal = None
+            elif journal is not None and not _should_resume(journal):
+                journal = None
+            elif journal is not None:
+                print(f"[+] Resuming '{name}': {len(journal.entries)} completed sections are reused")
+
+        try:
+            if journal is None:
+                journal = Journal(name, f"{function.__module__}:{function.__name__}", arguments)
+                journal.start()
+        except OSError as e:
+            print(f"[!] Could not create the checkpoint journal, the collection will not be resumable: {e}")
+            return function(*args, **kwargs)
+
+        _active_journal = journal
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            _active_journal = None
+
+        # Interrupted collections keep their journal so --resume can finish them
+        if journal.complete:
+            journal.discard()
+        else:
+            print("[!] Collection incomplete; run 'python3 fp_troubleshooting_helper.py --resume' to finish it")
+        return result
+
+    return wrapper
+
+
+def resume_pending():
+    """Runs every interrupted collection again, re-using the sections it already completed."""
+    global RESUME_MODE
+    from core.registry import lazy_command
+
+    journals = pending_journals()
+    if not journals:
+        print("[+] No interrupted collections to resume.")
+        return
+
+    RESUME_MODE = True
+    for journal in journals:
+        module_name, _, function_name = journal.function_path.partition(":")
+        print(f"\n[+] Resuming {journal.name} ({len(journal.entries)} sections already collected)...")
+        lazy_command(module_name, function_name)(**journal.arguments)
@@ -0,0 +1,158 @@
+# Description: This file implements the opt-in per-command profiler. When FPTH_PROFILE=<dir> is set, every CLI and
+# system command records its wall time, bytes returned, parse time and peak RSS growth, and a summary table plus a
+# Chrome trace (chrome://tracing / Perfetto) is written at the end of each menu action or Show Tech dump.
+#
+# ru_maxrss is a high-water mark over the life of the process (and of all its exited children), so a command is
+# charged only with how far it raised that mark: 0 unless it pushed the peak above every earlier command. With
+# commands running concurrently, the growth is charged to every command that was running when the peak rose.
+
+import atexit
+import json
+import os
+import resource
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+PROFILE_DIR = os.environ.get("FPTH_PROFILE")
+
+# Number of rows shown in the summary table; the trace file always holds every command.
+SUMMARY_ROWS = 20
+
+_events = []
+_events_lock = threading.Lock()
+_epoch = time.perf_counter()
+
+
+def is_profiling():
+    return bool(PROFILE_DIR)
+
+
+def _peak_rss_kb():
+    """Returns the peak RSS (KB) so far of this process and of the largest child process that has exited."""
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return own, children
+
+
+@contextmanager
+def profile_command(command, kind="cli"):
+    """
+    Times a command. Yields a dict the caller fills in with 'bytes' and 'parse_time' (seconds) once known.
+    Does nothing but yield a throwaway dict when profiling is disabled.
+    """
+    event = {"bytes": 0, "parse_time": 0.0}
+    if not PROFILE_DIR:
+        yield event
+        return
+
+    own_before, child_before = _peak_rss_kb()
+    start = time.perf_counter()
+    try:
+        yield event
+    finally:
+        end = time.perf_counter()
+        own_rss, child_rss = _peak_rss_kb()
+        event.update({
+            "command": command,
+            "kind": kind,
+            "start": start - _epoch,
+            "wall_time": end - start,
+            "rss_growth_kb": own_rss - own_before,
+            "child_rss_growth_kb": child_rss - child_before,
+            "thread": threading.get_ident(),
+        })
+        with _events_lock:
+            _events.append(event)
+
+
+def _summarize(events):
+    """Aggregates events per command, slowest first."""
+    summary = {}
+    for event in events:
+        row = summary.setdefault(event["command"], {
+            "command": event["command"], "calls": 0, "wall_time": 0.0, "parse_time": 0.0, "bytes": 0, "rss_growth_kb": 0
+        })
+        row["calls"] += 1
+        row["wall_time"] += event["wall_time"]
+        row["parse_time"] += event["parse_time"]
+        row["bytes"] += event["bytes"]
+        row["rss_growth_kb"] = max(row["rss_growth_kb"], event["rss_growth_kb"], event["child_rss_growth_kb"])
+    return sorted(summary.values(), key=lambda row: row["wall_time"], reverse=True)
+
+
+def _print_summary(rows, events):
+    total_wall = sum(event["wall_time"] for event in events)
+    command_width = min(max(len(row["command"]) for row in rows), 50)
+
+    header = (f"{'Command'.ljust(command_width)} | {'Calls':>5} | {'Wall (s)':>9} | {'Parse (s)':>9} | "
+              f"{'Bytes':>11} | {'Peak RSS growth (MB)':>20}")
+    print("\n" + "=" * len(header))
+    print(" Command Profile ".center(len(header), "="))
+    print("=" * len(header))
+    print(header)
+    print("-" * len(header))
+    for row in rows[:SUMMARY_ROWS]:
+        command = row["command"]
+        if len(command) > command_width:
+            command = command[:command_width - 3] + "..."
+        print(f"{command.ljust(command_width)} | {row['calls']:>5} | {row['wall_time']:>9.2f} | "
+              f"{row['parse_time']:>9.2f} | {row['bytes']:>11} | {row['rss_growth_kb'] / 1024:>20.1f}")
+    print("-" * len(header))
+    print(f"{len(events)} commands, {total_wall:.2f}s of command time "
+          f"({max(0, len(rows) - SUMMARY_ROWS)} more commands in the trace file)")
+
+
+def _write_trace(events, file_path):
+    """Writes the events as a Chrome trace-event JSON timeline."""
+    pid = os.getpid()
+    trace_events = [
+        {
+            "name": event["command"],
+            "cat": event["kind"],
+            "ph": "X",
+            "ts": int(event["start"] * 1_000_000),
+            "dur": int(event["wall_time"] * 1_000_000),
+            "pid": pid,
+            "tid": event["thread"],
+            "args": {
+                "bytes": event["bytes"],
+                "parse_time_ms": round(event["parse_time"] * 1000, 3),
+                "rss_growth_kb": event["rss_growth_kb"],
+                "child_rss_growth_kb": event["child_rss_growth_kb"],
+            },
+        }
+        for event in events
+    ]
+    with open(file_path, "w") as f:
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+
+
+def flush_profile_report():
+    """
+    Prints the summary table and writes the trace file for every command recorded since the last report.
+    Called whenever a menu is displayed again, i.e. at the end of each menu action or dump.
+    """
+    if not PROFILE_DIR:
+        return
+
+    with _events_lock:
+        events = list(_events)
+        _events.clear()
+    if not events:
+        return
+
+    _print_summary(_summarize(events), events)
+
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        trace_path = os.path.join(PROFILE_DIR, f"{timestamp}_profile_trace.json")
+        _write_trace(events, trace_path)
+        print(f"[+] Profile trace written to: {trace_path}")
+    except Exception as e:
+        print(f"[!] Error writing profile trace: {e}")
+
+
+atexit.register(flush_profile_report)
@@ -0,0 +1,53 @@
+# Description: This file implements the lazy command registry used by the menus. A menu entry refers to its
+# function by module path, and that module is imported only the first time the entry is selected, so the tool
+# reaches its first prompt without importing every feature module under lina/, firepower/ and menus/.
+
+import importlib
+import threading
+
+_commands = {}
+_registry_lock = threading.Lock()
+
+
+class LazyCommand:
+    """A callable that stands in for a feature function until the function is first used."""
+
+    def __init__(self, module_name, function_name):
+        self.module_name = module_name
+        self.function_name = function_name
+        self._function = None
+
+    def resolve(self):
+        """Imports the module on first use and returns the real function."""
+        if self._function is None:
+            module = importlib.import_module(self.module_name)
+            self._function = getattr(module, self.function_name)
+        return self._function
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<LazyCommand {self.module_name}.{self.function_name}>"
+
+
+def lazy_command(module_name, function_name=None):
+    """
+    Returns the registered LazyCommand for a function. The function name defaults to the last component of the
+    module path, which is how every feature module in this tool is named.
+
+    The same object is returned for the same function everywhere, so menus can still compare entries
+    (e.g. 'function == nat_help').
+    """
+    function_name = function_name or module_name.rsplit(".", 1)[-1]
+    key = (module_name, function_name)
+    with _registry_lock:
+        if key not in _commands:
+            _commands[key] = LazyCommand(module_name, function_name)
+        return _commands[key]
+
+
+def registered_commands():
+    """Returns every LazyCommand registered so far, in registration order."""
+    with _registry_lock:
+        return list(_commands.values())
@@ -0,0 +1,204 @@
+# Description: This file implements the retention manager for the data this tool writes to disk: Show Tech logs and
+# archives under /var/log/fp_troubleshooting_data, runs in the deduplicated store, and the exports written to
+# /var/common. Collectors call ensure_space() before they write. It evicts runs older than FPTH_RETENTION_DAYS,
+# then, until everything fits in FPTH_RETENTION_BYTES, the least valuable runs first: runs superseded by a newer
+# run of the same collector, oldest first, and only then the latest run of each collector. It refuses to write when
+# the file system would drop below FPTH_MIN_FREE_PERCENT free space. ArchiveWriter checks the same floor while it
+# streams.
+#
+# Only files this tool creates are ever considered: names starting with a '<YYYYmmdd>_<HHMMSS>_' timestamp in
+# /var/log/fp_troubleshooting_data, the xlate detail archive in /var/common/fp_troubleshooting_data, and
+# '<timestamp>_deleted_files.txt' in /var/common.
+
+import os
+import re
+import shutil
+import threading
+import time
+from core import dedup_store
+from core.archive import INDEX_SUFFIX
+
+RETENTION_BYTES = int(os.environ.get("FPTH_RETENTION_BYTES", str(512 * 1024 * 1024)))
+RETENTION_DAYS = float(os.environ.get("FPTH_RETENTION_DAYS", "14"))
+MIN_FREE_PERCENT = float(os.environ.get("FPTH_MIN_FREE_PERCENT", "10"))
+
+# An unfinished '.part' file this old belongs to a dump that was killed, not to one still running
+STALE_PART_AGE = 3600
+
+# (directory, pattern of the files this tool writes there)
+MANAGED_LOCATIONS = (
+    (dedup_store.TROUBLESHOOTING_DIR, re.compile(r"^\d{8}_\d{6}_")),
+    ("/var/common/fp_troubleshooting_data", re.compile(r"^(\d{8}_\d{6}_|xlate_detail_output\.txt\.tar)")),
+    ("/var/common", re.compile(r"^\d{8}_\d{6}_deleted_files\.txt$")),
+)
+
+# Eviction order: leftovers of interrupted dumps first, then expired runs, then runs a newer run of the same
+# collector supersedes, and the latest run of each collector last
+STALE, EXPIRED, SUPERSEDED, CURRENT = 0, 1, 2, 3
+
+_TIMESTAMP_PREFIX = re.compile(r"^\d{8}_\d{6}_")
+
+_retention_lock = threading.Lock()
+
+
+class DiskBudgetExceeded(Exception):
+    """Raised when writing would leave the file system with less than FPTH_MIN_FREE_PERCENT free space."""
+
+
+def _path_size(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, names in os.walk(path) for name in names)
+    return os.path.getsize(path)
+
+
+def _store_size():
+    return _path_size(dedup_store.STORE_DIR) if os.path.isdir(dedup_store.STORE_DIR) else 0
+
+
+def _device(path):
+    while not os.path.exists(path):
+        path = os.path.dirname(path)
+    return os.stat(path).st_dev
+
+
+def _collector(name):
+    """Returns the collector a run belongs to: its name without the timestamp and extensions ('s2s_data')."""
+    return _TIMESTAMP_PREFIX.sub("", name).split(".", 1)[0]
+
+
+def _candidates():
+    """Returns (rank, age key, kind, target, size, device) for everything retention may remove."""
+    now = time.time()
+    max_age = RETENTION_DAYS * 86400
+    candidates = []
+
+    for directory, pattern in MANAGED_LOCATIONS:
+        if not os.path.isdir(directory):
+            continue
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if not pattern.search(name) or path == dedup_store.STORE_DIR:
+                continue
+            index_path = path + INDEX_SUFFIX
+            if name.endswith(INDEX_SUFFIX):
+                if os.path.exists(path[:-len(INDEX_SUFFIX)]):
+                    continue  # Removed together with its archive
+                candidates.append((STALE, 0, "file", path, _path_size(path), _device(path)))
+                continue
+            try:
+                modified = os.path.getmtime(path)
+                size = _path_size(path)
+                if os.path.exists(index_path):
+                    size += os.path.getsize(index_path)
+            except OSError:
+                continue
+            if name.endswith(".part"):
+                if now - modified < STALE_PART_AGE:
+                    continue  # Still being written
+                rank = STALE
+            else:
+                rank = EXPIRED if max_age and now - modified > max_age else CURRENT
+            candidates.append((rank, modified, "file", path, size, _device(path)))
+
+    store_device = _device(dedup_store.STORE_DIR)
+    for run in dedup_store.list_runs():
+        rank = EXPIRED if max_age and now - run["created"] > max_age else CURRENT
+        # Chunks are shared between runs, so what a run frees is only known once it is gone
+        candidates.append((rank, run["created"], "run", run["run"], 0, store_device))
+
+    # Only the latest run of every collector keeps the CURRENT rank; older ones are superseded by it
+    latest = {}
+    for rank, modified, _, target, _, _ in candidates:
+        if rank == CURRENT:
+            collector = _collector(os.path.basename(target))
+            latest[collector] = max(latest.get(collector, modified), modified)
+    candidates = [
+        (SUPERSEDED,) + candidate[1:]
+        if candidate[0] == CURRENT and candidate[1] < latest[_collector(os.path.basename(candidate[3]))]
+        else candidate
+        for candidate in candidates
+    ]
+
+    return sorted(candidates, key=lambda candidate: candidate[:2])
+
+
+def free_space_floor(path):
+    """Returns (free bytes, minimum free bytes to keep) for the file system holding path."""
+    while not os.path.exists(path):
+        path = os.path.dirname(path)
+    usage = shutil.disk_usage(path)
+    return usage.free, usage.total * MIN_FREE_PERCENT / 100
+
+
+def check_free_space(path, upcoming_bytes=0):
+    """Raises DiskBudgetExceeded if writing upcoming_bytes more under path would cross the free space floor."""
+    free, floor = free_space_floor(path)
+    if free - upcoming_bytes < floor:
+        raise DiskBudgetExceeded(
+            f"Not enough disk space to write to {path}: {free // (1024 * 1024)} MB free, at least "
+            f"{int(floor) // (1024 * 1024)} MB (FPTH_MIN_FREE_PERCENT={MIN_FREE_PERCENT:g}%) must stay free"
+        )
+
+
+def enforce_retention(path=dedup_store.TROUBLESHOOTING_DIR):
+    """
+    Evicts stale and expired runs, then superseded runs and finally the latest runs, oldest first, until the data
+    fits in FPTH_RETENTION_BYTES and the file system holding path is above its free space floor. Returns the
+    number of bytes freed.
+    """
+    with _retention_lock:
+        candidates = _candidates()
+        total = sum(candidate[4] for candidate in candidates) + _store_size()
+        device = _device(path)
+        freed = 0
+        removed = 0
+
+        for rank, _, kind, target, size, candidate_device in candidates:
+            free, floor = free_space_floor(path)
+            over_budget = RETENTION_BYTES and total > RETENTION_BYTES
+            low_on_disk = free < floor and candidate_device == device
+            if rank >= SUPERSEDED and not over_budget and not low_on_disk:
+                continue
+
+            try:
+                if kind == "file":
+                    if os.path.isdir(target):
+                        shutil.rmtree(target)
+                    else:
+                        os.remove(target)
+                        if os.path.exists(target + INDEX_SUFFIX):
+                            os.remove(target + INDEX_SUFFIX)
+                else:
+                    store_before = _store_size()
+                    dedup_store.delete_run(target)
+                    dedup_store.collect_garbage()
+                    size = store_before - _store_size()
+            except OSError as e:
+                print(f"[!] Retention: could not remove {target}: {e}")
+                continue
+
+            total -= size
+            freed += size
+            removed += 1
+
+        if removed:
+            print(f"[+] Retention: removed {removed} old runs, freeing {freed // 1024} KB")
+        return freed
+
+
+def ensure_space(path):
+    """
+    Applies the retention policy and checks the free space floor before a collector writes under path.
+    Prints the reason and returns False when the collector must not write.
+    """
+    try:
+        enforce_retention(path)
+        check_free_space(path)
+        return True
+    except DiskBudgetExceeded as e:
+        print(f"[!] {e}")
+        return False
+    except OSError as e:
+        print(f"[!] Error applying the retention policy: {e}")
+        return True
@@ -0,0 +1,179 @@
+# Description: This file holds a session-wide snapshot of 'show running-config' and answers scoped
+# 'show running-config ...' commands and their pipe filters locally instead of asking LINA again.
+
+import os
+import re
+import threading
+import time
+from core.cli_cache import on_invalidate
+from core.utils import get_and_parse_cli_output
+
+# Seconds a snapshot is trusted before 'show running-config' is fetched again.
+SNAPSHOT_MAX_AGE = int(os.environ.get("FPTH_RUNNING_CONFIG_MAX_AGE", "300"))
+
+# Top-level keywords whose scoped output is exactly the matching top-level lines plus their sub-mode lines.
+# Anything else (e.g. 'nat', which also lives inside object blocks) is always sent to LINA.
+SNAPSHOT_SCOPES = (
+    "aaa-server",
+    "access-list",
+    "crypto",
+    "group-policy",
+    "interface",
+    "logging",
+    "route",
+    "router",
+    "tunnel-group",
+    "username",
+)
+
+PIPE_FILTERS = ("include", "exclude", "begin", "grep")
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+class RunningConfigSnapshot:
+    """
+    An in-memory copy of the running configuration with a line index.
+
+    Top-level commands and their indented sub-mode lines are kept together as blocks, and blocks are indexed by
+    their first keyword so scope lookups only touch the relevant part of the configuration.
+    """
+
+    def __init__(self, config_text):
+        self.fetched_at = time.time()
+        self.lines = config_text.splitlines()
+        self.blocks = []
+        self.keyword_index = {}
+
+        block_start = None
+        for number, line in enumerate(self.lines):
+            if line and not line[0].isspace():
+                if block_start is not None:
+                    self._add_block(block_start, number)
+                block_start = number
+        if block_start is not None:
+            self._add_block(block_start, len(self.lines))
+
+    def _add_block(self, start, end):
+        tokens = self.lines[start].split()
+        self.blocks.append((start, end))
+        self.keyword_index.setdefault(tokens[0], []).append((tokens, start, end))
+
+    @classmethod
+    def fetch(cls):
+        """Fetches 'show running-config' from LINA and builds a snapshot from it."""
+        return cls(get_and_parse_cli_output("show running-config"))
+
+    def is_stale(self):
+        return time.time() - self.fetched_at > SNAPSHOT_MAX_AGE
+
+    def section(self, scope):
+        """
+        Returns the lines 'show running-config <scope>' would print: every top-level command whose leading
+        words match the scope, together with its sub-mode lines.
+        """
+        scope_tokens = scope.split()
+        if not scope_tokens:
+            return list(self.lines)
+
+        section_lines = []
+        for tokens, start, end in self.keyword_index.get(scope_tokens[0], []):
+            if tokens[:len(scope_tokens)] == scope_tokens:
+                section_lines.extend(self.lines[start:end])
+        return section_lines
+
+    @staticmethod
+    def apply_filter(lines, filter_name, pattern):
+        """Applies an ASA output filter (include, exclude, begin or grep [-v]) to a list of lines."""
+        if filter_name == "grep":
+            invert = pattern.startswith("-v ")
+            filter_name = "exclude" if invert else "include"
+            pattern = pattern[3:].strip() if invert else pattern
+
+        regex = re.compile(pattern)
+        if filter_name == "include":
+            return [line for line in lines if regex.search(line)]
+        if filter_name == "exclude":
+            return [line for line in lines if not regex.search(line)]
+        if filter_name == "begin":
+            for number, line in enumerate(lines):
+                if regex.search(line):
+                    return lines[number:]
+            return []
+        raise ValueError(f"Unsupported output filter: {filter_name}")
+
+    def include(self, pattern, scope=""):
+        return "\n".join(self.apply_filter(self.section(scope), "include", pattern))
+
+    def exclude(self, pattern, scope=""):
+        return "\n".join(self.apply_filter(self.section(scope), "exclude", pattern))
+
+    def begin(self, pattern, scope=""):
+        return "\n".join(self.apply_filter(self.section(scope), "begin", pattern))
+
+    def grep(self, pattern, scope=""):
+        return "\n".join(self.apply_filter(self.section(scope), "grep", pattern))
+
+    def answer(self, command):
+        """
+        Answers a 'show running-config ...' command from the snapshot.
+        Returns None when the command cannot be answered locally and has to be sent to LINA.
+        """
+        command_part, _, filter_part = command.partition("|")
+        tokens = command_part.split()
+        if tokens[:2] != ["show", "running-config"]:
+            return None
+
+        scope_tokens = tokens[2:]
+        if scope_tokens and scope_tokens[0] not in SNAPSHOT_SCOPES:
+            return None
+
+        lines = self.section(" ".join(scope_tokens))
+
+        if filter_part.strip():
+            filter_name, _, pattern = filter_part.strip().partition(" ")
+            if filter_name not in PIPE_FILTERS or not pattern.strip():
+                return None
+            try:
+                lines = self.apply_filter(lines, filter_name, pattern.strip())
+            except re.error:
+                return None
+
+        return "\n".join(lines).strip()
+
+
+def get_running_config_snapshot():
+    """Returns the session's running-config snapshot, fetching it on first use or once it is too old."""
+    global _snapshot
+
+    # Concurrent collectors share one fetch instead of each pulling the full configuration
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot.is_stale():
+            _snapshot = RunningConfigSnapshot.fetch()
+        return _snapshot
+
+
+def invalidate_running_config_snapshot():
+    """Drops the snapshot so the next lookup fetches the running configuration again."""
+    global _snapshot
+    _snapshot = None
+
+
+# Configuration writes (e.g. LinaConfigTool) invalidate the snapshot together with the cached running-config
+on_invalidate("lina-config", invalidate_running_config_snapshot)
+
+
+def get_running_config_output(command):
+    """
+    Drop-in replacement for get_and_parse_cli_output for 'show running-config ...' commands.
+    Commands the snapshot cannot answer (e.g. 'show running-config all ...') are sent to LINA unchanged.
+    """
+    try:
+        output = get_running_config_snapshot().answer(command)
+    except Exception:
+        output = None
+
+    if output is None:
+        return get_and_parse_cli_output(command)
+    return output
@@ -0,0 +1,230 @@
+# Description: This file implements the headless sampler ('python3 fp_troubleshooting_helper.py --sample'). It
+# polls LINA counters such as 'show perfmon', 'show traffic' and 'show blocks' on independent intervals, parses each
+# response into numbers and appends them, together with per-second rates for cumulative counters, to one JSON
+# Lines file per sampler under /var/log/fp_troubleshooting_data/<timestamp>_samples.
+#
+# Overhead stays bounded for runs of several hours: at most FPTH_SAMPLER_WORKERS commands run at a time, a sampler
+# whose previous poll is still running skips its turn instead of queueing, intervals never drop below
+# MIN_INTERVAL, and only the last sample of every sampler is kept in memory.
+
+import heapq
+import json
+import os
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from core.deadline import cancel_commands, collection_budget, is_cancelled
+from core.retention import DiskBudgetExceeded, check_free_space, ensure_space
+from core.utils import get_and_parse_cli_output
+
+TROUBLESHOOTING_DIR = "/var/log/fp_troubleshooting_data"
+
+# Comma-separated '<sampler>=<seconds>' list; samplers not listed are not polled
+SAMPLERS_SPEC = os.environ.get(
+    "FPTH_SAMPLERS", "perfmon=10,traffic=30,blocks=30,conn_count=5,xlate_count=5,cluster_cpu=30"
+)
+SAMPLE_JITTER = float(os.environ.get("FPTH_SAMPLE_JITTER", "0.1"))
+SAMPLER_WORKERS = int(os.environ.get("FPTH_SAMPLER_WORKERS", "2"))
+MIN_INTERVAL = 1.0
+
+# Free space is re-checked after this many samples have been written
+DISK_CHECK_EVERY = 50
+
+
+def parse_perfmon(output):
+    """'show perfmon': current and average rate of every counter."""
+    values = {}
+    for name, current, average in re.findall(r"^(\S[^\n]*?)\s+(\d+)/s\s+(\d+)/s\s*$", output, re.MULTILINE):
+        key = name.strip().lower().replace(" ", "_")
+        values[f"{key}_current"] = int(current)
+        values[f"{key}_average"] = int(average)
+    return values
+
+
+def parse_traffic(output):
+    """'show traffic': cumulative received/transmitted packets and bytes of every interface."""
+    values = {}
+    interface = direction = None
+    for line in output.splitlines():
+        interface_match = re.match(r"^(\S[^:]*):\s*$", line)
+        if interface_match:
+            interface = interface_match.group(1).strip()
+            continue
+        direction_match = re.search(r"(received|transmitted) \(in", line)
+        if direction_match:
+            direction = direction_match.group(1)
+            continue
+        counters = re.search(r"(\d+) packets\s+(\d+) bytes", line)
+        if counters and interface and direction:
+            values[f"{interface}.{direction}_packets"] = int(counters.group(1))
+            values[f"{interface}.{direction}_bytes"] = int(counters.group(2))
+            direction = None
+    return values
+
+
+def parse_blocks(output):
+    """'show blocks': MAX, LOW and CNT of every block size."""
+    values = {}
+    for size, maximum, low, count in re.findall(r"^\s*(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s*$", output, re.MULTILINE):
+        values[f"{size}.max"] = int(maximum)
+        values[f"{size}.low"] = int(low)
+        values[f"{size}.cnt"] = int(count)
+    return values
+
+
+def parse_in_use(output):
+    """'show conn count' / 'show xlate count': entries in use and the most used since the last clear."""
+    match = re.search(r"(\d+) in use, (\d+) most used", output)
+    return {"in_use": int(match.group(1)), "most_used": int(match.group(2))} if match else {}
+
+
+def parse_cluster_cpu(output):
+    """'show cluster cpu': the numeric columns of every unit row."""
+    values = {}
+    for line in output.splitlines():
+        tokens = line.split()
+        numbers = [token for token in tokens[1:] if re.fullmatch(r"\d+(\.\d+)?%?", token)]
+        if tokens and numbers:
+            for index, number in enumerate(numbers):
+                values[f"{tokens[0]}.{index}"] = float(number.rstrip("%"))
+    return values
+
+
+# name: (command, parser, cumulative counters whose per-second rate is recorded as well)
+SAMPLERS = {
+    "perfmon": ("show perfmon", parse_perfmon, False),
+    "traffic": ("show traffic", parse_traffic, True),
+    "blocks": ("show blocks", parse_blocks, False),
+    "conn_count": ("show conn count", parse_in_use, False),
+    "xlate_count": ("show xlate count", parse_in_use, False),
+    "cluster_cpu": ("show cluster cpu", parse_cluster_cpu, False),
+}
+
+
+def parse_samplers_spec(spec):
+    """Parses a '<sampler>=<seconds>,...' list into {sampler: interval}."""
+    intervals = {}
+    for item in filter(None, (item.strip() for item in spec.split(","))):
+        name, _, seconds = item.partition("=")
+        name = name.strip()
+        if name not in SAMPLERS:
+            raise ValueError(f"Unknown sampler '{name}' (available: {', '.join(SAMPLERS)})")
+        intervals[name] = max(float(seconds or 30), MIN_INTERVAL)
+    return intervals
+
+
+class _Sampler:
+    def __init__(self, name, interval, output_dir):
+        self.name = name
+        self.command, self.parser, self.cumulative = SAMPLERS[name]
+        self.interval = interval
+        self.path = os.path.join(output_dir, f"{name}.jsonl")
+        self.previous = None
+        self.running = False
+        self.samples = self.errors = self.skipped = 0
+
+    def next_delay(self):
+        # Jitter keeps samplers with the same interval from always hitting LINA at the same moment
+        return self.interval * (1 + random.uniform(-SAMPLE_JITTER, SAMPLE_JITTER))
+
+    def poll(self):
+        """Runs the command once and returns the JSON record for it."""
+        timestamp = time.time()
+        try:
+            values = self.parser(get_and_parse_cli_output(self.command))
+        except Exception as e:
+            self.errors += 1
+            return {"t": timestamp, "error": str(e)}
+
+        record = {"t": timestamp, "values": values}
+        if self.cumulative and self.previous is not None:
+            elapsed = timestamp - self.previous["t"]
+            previous_values = self.previous["values"]
+            # A counter that went down was cleared; no rate for that interval
+            record["rates"] = {key: round((value - previous_values[key]) / elapsed, 3)
+                               for key, value in values.items()
+                               if key in previous_values and value >= previous_values[key] and elapsed > 0}
+        self.previous = record
+        self.samples += 1
+        return record
+
+
+def run_sampler(spec=None, duration=None):
+    """
+    Polls the samplers in spec (FPTH_SAMPLERS by default) until Ctrl-C or, if given, for duration seconds.
+    Returns the directory the samples were written to, or None if sampling could not start.
+    """
+    try:
+        intervals = parse_samplers_spec(spec or SAMPLERS_SPEC)
+    except ValueError as e:
+        print(f"[!] {e}")
+        return None
+
+    os.makedirs(TROUBLESHOOTING_DIR, exist_ok=True)
+    if not ensure_space(TROUBLESHOOTING_DIR):
+        return None
+
+    output_dir = os.path.join(TROUBLESHOOTING_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_samples")
+    os.makedirs(output_dir)
+    samplers = [_Sampler(name, interval, output_dir) for name, interval in intervals.items()]
+    print(f"[+] Sampling {', '.join(f'{s.name} every {s.interval:g}s' for s in samplers)} into {output_dir}")
+    print("[+] Press Ctrl-C to stop.")
+
+    write_lock = threading.Lock()
+    written = [0]
+
+    def poll_and_write(sampler):
+        try:
+            record = sampler.poll()
+            with write_lock:
+                written[0] += 1
+                if written[0] % DISK_CHECK_EVERY == 0:
+                    check_free_space(output_dir)
+                with open(sampler.path, "a") as f:
+                    f.write(json.dumps(record) + "\n")
+        finally:
+            sampler.running = False
+
+    started = time.monotonic()
+    schedule = [(started, index) for index in range(len(samplers))]
+    heapq.heapify(schedule)
+    pool = ThreadPoolExecutor(max_workers=max(SAMPLER_WORKERS, 1), thread_name_prefix="fpth-sampler")
+    futures = []
+
+    # No overall budget: the run ends on Ctrl-C or after duration seconds
+    with collection_budget(0):
+        try:
+            while not is_cancelled():
+                due, index = schedule[0]
+                if duration and due - started >= duration:
+                    break
+                time.sleep(max(0.0, due - time.monotonic()))
+
+                sampler = samplers[index]
+                if sampler.running:
+                    sampler.skipped += 1
+                else:
+                    sampler.running = True
+                    futures.append(pool.submit(poll_and_write, sampler))
+                heapq.heapreplace(schedule, (due + sampler.next_delay(), index))
+
+                # Surface write failures (e.g. the disk floor was reached) and drop finished futures
+                for future in [future for future in futures if future.done()]:
+                    futures.remove(future)
+                    future.result()
+        except KeyboardInterrupt:
+            print("\n[!] Stopping the sampler...")
+            cancel_commands()
+        except DiskBudgetExceeded as e:
+            print(f"[!] Stopping the sampler: {e}")
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    for sampler in samplers:
+        print(f"[+] {sampler.name}: {sampler.samples} samples, {sampler.errors} errors, "
+              f"{sampler.skipped} skipped while the previous poll was still running")
+    print(f"[+] Samples written to: {output_dir}")
+    return output_dir
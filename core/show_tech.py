@@ -0,0 +1,98 @@
+# Description: This file implements the "collect everything" Show Tech engine. It merges the COLLECTORS of several
+# dump_all_* modules into one plan, drops collectors that more than one dump asks for, runs the whole plan in a
+# single concurrent pass and writes every dump into one consolidated archive.
+
+import os
+from datetime import datetime
+from functools import partial
+from core.archive import open_archive
+from core.cli_cache import shared_responses
+from core.cli_stream import StreamedCliOutput
+from core.executor import run_collectors
+from core.retention import ensure_space
+
+TROUBLESHOOTING_DIR = "/var/log/fp_troubleshooting_data"
+
+
+def collector_key(collector):
+    """Returns a key identifying what a collector runs, so the same collector listed by two dumps runs once."""
+    if isinstance(collector, partial):
+        return collector_key(collector.func), collector.args, tuple(sorted(collector.keywords.items()))
+    if isinstance(collector, StreamedCliOutput):
+        return "stream", collector.command
+    return getattr(collector, "__module__", None), getattr(collector, "__qualname__", repr(collector))
+
+
+def build_plan(dumps):
+    """
+    Builds one collection plan from a list of (dump name, collectors) pairs.
+
+    Returns (plan, layout): plan is the de-duplicated list of (key, collector) to run, and layout maps every
+    dump name to its (title, key) sections so each dump can still be written in its own order.
+    """
+    plan = {}
+    layout = []
+    for dump_name, collectors in dumps:
+        sections = []
+        for title, collector in collectors:
+            key = collector_key(collector)
+            plan.setdefault(key, collector)
+            sections.append((title, key))
+        layout.append((dump_name, sections))
+    return list(plan.items()), layout
+
+
+def write_sections(f, sections):
+    """
+    Writes (title, output) sections in the Show Tech log format, streaming StreamedCliOutput sections.
+    Sections are indexed when f is an archive member, so a single one can later be read back on its own.
+    """
+    for title, output in sections:
+        if hasattr(f, "begin_section"):
+            f.begin_section(title, output.command if isinstance(output, StreamedCliOutput) else None)
+        f.write(f"{'=' * 80}\n")
+        f.write(f"{title}\n")
+        f.write(f"{'-' * 80}\n")
+        if isinstance(output, StreamedCliOutput):
+            # Large tables are streamed straight into the file rather than held in memory
+            output.write_to(f)
+        else:
+            f.write(f"{output}\n")
+        f.write(f"{'=' * 80}\n\n")
+
+
+def run_show_tech(dumps, archive_name="show_tech_all"):
+    """
+    Collects every dump in one concurrent pass and writes them as <dump>_dump.log files into a single
+    <timestamp>_<archive_name>.tar.gz archive (extension per FPTH_ARCHIVE_CODEC). Returns the archive path, or None if it could not be written.
+    """
+    plan, layout = build_plan(dumps)
+    section_count = sum(len(sections) for _, sections in layout)
+    print(f"[+] Collecting {len(layout)} dumps: {section_count} sections, {len(plan)} distinct collectors "
+          f"({section_count - len(plan)} duplicates skipped)")
+
+    # Commands that several collectors issue (e.g. the same running-config scope) are also run only once
+    with shared_responses() as stats:
+        results = dict(run_collectors(plan))
+    if stats["shared"]:
+        print(f"[+] {stats['shared']} repeated commands answered from a single execution")
+
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(TROUBLESHOOTING_DIR):
+        return None
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    root = f"{timestamp}_{archive_name}"
+
+    try:
+        os.makedirs(TROUBLESHOOTING_DIR, exist_ok=True)
+        # Every dump is streamed straight into its archive member; nothing is staged on disk
+        with open_archive(os.path.join(TROUBLESHOOTING_DIR, root)) as archive:
+            for dump_name, sections in layout:
+                with archive.member(f"{root}/{timestamp}_{dump_name}_dump.log") as f:
+                    write_sections(f, [(title, results[key]) for title, key in sections])
+        print(f"[+] All Show Tech data written to: {archive.path}")
+        return archive.path
+    except Exception as e:
+        print(f"[!] Error writing Show Tech archive: {e}")
+        return None
@@ -1,11 +1,18 @@
 # Description: This file contains utility functions that are used by other modules in the application.
 
 import html
+import json
 import re
 import subprocess
 import sys
 import termios
+import time
 import xml.etree.ElementTree as ET
+from core import cli_replay
+from core.cli_cache import get_cached, invalidate_for_write, normalize_command, run_shared, store_cached
+from core.cli_session import run_cli_command
+from core.deadline import run_process
+from core.profiling import flush_profile_report, profile_command
 
 
 def flush_stdin():
@@ -81,13 +88,93 @@ def parse_config(file_path, keys_to_extract):
 def get_and_parse_cli_output(command):
     """Executes the ConvergedCliClient command and extracts the desired CLI output."""
 
-    # Execute the command using subprocess
-    result = subprocess.run(
-        ["ConvergedCliClient", command], capture_output=True, text=True
-    )
+    # Spelling variants of the same command share one cache entry and one execution
+    command = normalize_command(command)
+
+    # Configuration and version output is reused for a short while instead of asking LINA again
+    cached_output = get_cached(command)
+    if cached_output is not None:
+        return cached_output
+
+    # Inside a shared_responses() block, collectors asking for the same command share one execution
+    return run_shared(command, _fetch_cli_output)
+
+
+def _fetch_cli_output(command):
+    """Runs a CLI command (or replays it), parses the response and stores it in the response cache."""
+    with profile_command(command) as profile:
+        if cli_replay.is_replaying():
+            # Answer from a recorded capture instead of the device
+            raw_output = cli_replay.load_response("cli", command)
+        else:
+            # Execute the command through the shared ConvergedCliClient session pool
+            raw_output = run_cli_command(command)
+            if cli_replay.is_recording():
+                cli_replay.record_response("cli", command, raw_output)
+
+        parse_start = time.perf_counter()
+        desired_output = extract_cli_output(raw_output)
+        profile["parse_time"] = time.perf_counter() - parse_start
+        profile["bytes"] = len(raw_output)
+
+    store_cached(command, desired_output)
+    return desired_output
+
+
+def run_system_command(command, timeout=None, check=False):
+    """
+    Runs a system command (e.g. an OmniQuery.pl query) and returns the subprocess.CompletedProcess.
+    A string is run through the shell, a list is executed directly.
+    Responses are recorded to / replayed from a capture when FPTH_CLI_RECORD / FPTH_CLI_REPLAY is set.
+    With check=True a non-zero exit status raises subprocess.CalledProcessError.
+    """
+    command_key = command if isinstance(command, str) else " ".join(command)
+
+    # Commands that change the device (LinaConfigTool, database updates) drop the cached output they affect
+    is_write = invalidate_for_write(command_key)
+    result = None if is_write else get_cached(command_key)
+    if result is not None:
+        return result
+
+    with profile_command(command_key, kind="system") as profile:
+        if cli_replay.is_replaying():
+            recorded = json.loads(cli_replay.load_response("shell", command_key))
+            result = subprocess.CompletedProcess(
+                command, recorded["returncode"], recorded["stdout"], recorded["stderr"]
+            )
+        else:
+            # Like subprocess.run, but also bounded by the dump's time budget and killed on cancellation
+            result = run_process(
+                command,
+                shell=isinstance(command, str),  # Using shell=True to allow multi-part commands
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,  # Text mode to automatically decode
+                encoding='utf-8',  # UTF-8 encoding
+                errors='ignore',  # Ignore characters that can't be decoded
+                timeout=timeout
+            )
+            if cli_replay.is_recording():
+                cli_replay.record_response("shell", command_key, json.dumps(
+                    {"returncode": result.returncode, "stdout": result.stdout, "stderr": result.stderr}
+                ))
+        profile["bytes"] = len(result.stdout or "") + len(result.stderr or "")
+
+    if is_write:
+        # Also drop anything cached while the write was running
+        invalidate_for_write(command_key)
+    elif result.returncode == 0:
+        store_cached(command_key, result)
+
+    if check:
+        result.check_returncode()
+    return result
+
+
+def extract_cli_output(raw_output):
+    """Extracts the CLI text from a raw ConvergedCliClient response."""
 
     # Parse the output, which is XML-like with HTML-encoded content
-    raw_output = result.stdout
     start = raw_output.find("<message>")
     end = raw_output.find("</message>") + len("</message>")
     xml_content = raw_output[start:end]
@@ -144,6 +231,9 @@ def display_formatted_menu(title, options):
     Returns:
         None
     """
+    # A menu is only shown again once the previous action has finished, so report its profile first
+    flush_profile_report()
+
     print("\n" + "=" * 80)
     print(f" {title} ".center(80, "="))
     print("=" * 80)
@@ -152,14 +242,14 @@ def display_formatted_menu(title, options):
     print("=" * 80)
 
 
-def print_section(title, content):
+def print_section(title, content, file=None):
     separator = "-" * 80
     title_line = f"| {title.center(76)} |"
-    print(separator)
-    print(title_line)
-    print(separator)
-    print(content)
-    print(separator + "\n")
+    print(separator, file=file)
+    print(title_line, file=file)
+    print(separator, file=file)
+    print(content, file=file)
+    print(separator + "\n", file=file)
 
 def ip_sort_key(ip):
     return tuple(map(int, ip.split('.')))
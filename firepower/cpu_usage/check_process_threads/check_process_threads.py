@@ -1,6 +1,6 @@
 # Description: This script checks the thread information of a given process.
 
-import subprocess
+from core.utils import run_system_command
 
 
 def check_process_threads():
@@ -12,11 +12,7 @@ def check_process_threads():
 
         # Use 'pidof' to get the PID of the process
         pid_command = f"pidof {process_name}"
-        result = subprocess.run(pid_command,
-                                shell=True,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                text=True)
+        result = run_system_command(pid_command)
 
         # Check if the command executed successfully
         if result.returncode == 0:
@@ -26,11 +22,7 @@ def check_process_threads():
                 pidstat_command = f"pidstat -h -t -p {pid} 1 1"
                 print(f"\nExecuting: {pidstat_command}")
 
-                pidstat_result = subprocess.run(pidstat_command,
-                                                shell=True,
-                                                stdout=subprocess.PIPE,
-                                                stderr=subprocess.PIPE,
-                                                text=True)
+                pidstat_result = run_system_command(pidstat_command)
 
                 if pidstat_result.returncode == 0:
                     # Print the output of the pidstat command
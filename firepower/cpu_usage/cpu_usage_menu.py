@@ -1,11 +1,16 @@
 # Description: CPU usage troubleshooting menu.
 
-from firepower.cpu_usage.show_cpu_affinity.show_cpu_affinity import show_cpu_affinity
-from firepower.cpu_usage.verify_affected_system_cores.verify_affected_system_cores import verify_affected_system_cores
-from firepower.cpu_usage.gather_processes_on_cores.gather_processes_on_cores import gather_processes_on_cores
-from firepower.cpu_usage.check_process_threads.check_process_threads import check_process_threads
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from firepower.cpu_usage.extract_sys_cores import extract_sys_cores
+
+# Feature modules are imported only when their menu entry is selected
+show_cpu_affinity = lazy_command("firepower.cpu_usage.show_cpu_affinity.show_cpu_affinity")
+verify_affected_system_cores = lazy_command(
+    "firepower.cpu_usage.verify_affected_system_cores.verify_affected_system_cores"
+)
+gather_processes_on_cores = lazy_command("firepower.cpu_usage.gather_processes_on_cores.gather_processes_on_cores")
+check_process_threads = lazy_command("firepower.cpu_usage.check_process_threads.check_process_threads")
+extract_sys_cores = lazy_command("firepower.cpu_usage.extract_sys_cores")
 
 
 def cpu_usage_menu():
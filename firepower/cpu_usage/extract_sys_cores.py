@@ -1,7 +1,7 @@
 # Description: This script is used to extract the system cores from the 'show_cpu_affinity' command output.
 
-import subprocess
 from firepower.cpu_usage.expand_cores.expand_cores import expand_cores
+from core.utils import run_system_command
 
 
 def extract_sys_cores():
@@ -10,10 +10,7 @@ def extract_sys_cores():
     """
     try:
         # Execute 'show_cpu_affinity' to gather the system cores
-        result = subprocess.run(["pmtool", "show", "affinity"],
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                text=True)
+        result = run_system_command(["pmtool", "show", "affinity"])
 
         # Check if the command executed successfully
         if result.returncode == 0:
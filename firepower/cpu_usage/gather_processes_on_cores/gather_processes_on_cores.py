@@ -1,7 +1,7 @@
 # Description: Gather a snapshot of processes and threads running on specific cores with highest CPU usage.
 
 from firepower.cpu_usage.expand_cores.expand_cores import expand_cores
-import subprocess
+from core.utils import run_system_command
 
 
 def gather_processes_on_cores(cores):
@@ -23,11 +23,7 @@ def gather_processes_on_cores(cores):
 
         # Execute the pidstat command and capture its output
         print(f"\nExecuting: {pidstat_command}")
-        result = subprocess.run(pidstat_command,
-                                shell=True,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                text=True)
+        result = run_system_command(pidstat_command)
 
         # Check if the pidstat command executed successfully
         if result.returncode == 0:
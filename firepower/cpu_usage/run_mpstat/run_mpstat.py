@@ -1,7 +1,7 @@
 # Description: This script runs the 'mpstat' command with the given core list.
 
-import subprocess
 from firepower.cpu_usage.expand_cores.expand_cores import expand_cores
+from core.utils import run_system_command
 
 
 def run_mpstat(cores):
@@ -20,11 +20,7 @@ def run_mpstat(cores):
 
         # Execute the mpstat command and capture its output
         print(f"\nExecuting: {mpstat_command}")
-        result = subprocess.run(mpstat_command,
-                                shell=True,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                text=True)
+        result = run_system_command(mpstat_command)
 
         # Check if the mpstat command executed successfully
         if result.returncode == 0:
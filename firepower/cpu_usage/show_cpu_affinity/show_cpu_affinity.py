@@ -1,6 +1,6 @@
 # Description: This script gathers and displays the output of 'pmtool show affinity'.
 
-import subprocess
+from core.utils import run_system_command
 
 
 def show_cpu_affinity():
@@ -10,10 +10,7 @@ def show_cpu_affinity():
     try:
         print("\nGathering CPU affinity information...")
         # Execute the command and capture its output
-        result = subprocess.run(["pmtool", "show", "affinity"],
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                text=True)
+        result = run_system_command(["pmtool", "show", "affinity"])
 
         # Check if the command executed successfully
         if result.returncode == 0:
@@ -1,8 +1,8 @@
 # Description: This script is used to verify the affected system cores using 'pmtool show affinity' and runs 'mpstat' for those cores.
 
 import re
-import subprocess
 from firepower.cpu_usage.run_mpstat.run_mpstat import run_mpstat
+from core.utils import run_system_command
 
 
 def verify_affected_system_cores():
@@ -11,10 +11,7 @@ def verify_affected_system_cores():
     """
     try:
         # Execute the command to gather system core information
-        result = subprocess.run(["pmtool", "show", "affinity"],
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                text=True)
+        result = run_system_command(["pmtool", "show", "affinity"])
 
         # Check if the command executed successfully
         if result.returncode == 0:
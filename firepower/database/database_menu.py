@@ -1,16 +1,19 @@
 # Description: This file contains the database troubleshooting menu.
 
+from core.registry import lazy_command
 from core.utils import flush_stdin
-from firepower.database.em_peers.em_peers import em_peers
-from firepower.database.ssl_peers.ssl_peers import ssl_peers
-from firepower.database.fail_deployment.fail_deployment import fail_deployment
-from firepower.database.delete_notification.delete_notification import delete_notification
-from firepower.database.vdb_table.vdb_table import vdb_table
-from firepower.database.geodb_table.geodb_table import geodb_table
-from firepower.database.notifications_table.notifications_table import notifications_table
-from firepower.database.remove_peer.remove_peer import remove_peer
 from core.utils import display_formatted_menu
 
+# Feature modules are imported only when their menu entry is selected
+em_peers = lazy_command("firepower.database.em_peers.em_peers")
+ssl_peers = lazy_command("firepower.database.ssl_peers.ssl_peers")
+fail_deployment = lazy_command("firepower.database.fail_deployment.fail_deployment")
+delete_notification = lazy_command("firepower.database.delete_notification.delete_notification")
+vdb_table = lazy_command("firepower.database.vdb_table.vdb_table")
+geodb_table = lazy_command("firepower.database.geodb_table.geodb_table")
+notifications_table = lazy_command("firepower.database.notifications_table.notifications_table")
+remove_peer = lazy_command("firepower.database.remove_peer.remove_peer")
+
 def database_menu():
     # Map menu options to descriptions and their respective functions
     menu_options = {
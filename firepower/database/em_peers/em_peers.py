@@ -1,7 +1,6 @@
 # Description: This script is used to validate the EM_peers database table by querying the database for peer information.
 
-import subprocess
-from core.utils import validate_uuid
+from core.utils import validate_uuid, run_system_command
 
 def em_peers():
     """
@@ -47,13 +46,7 @@ def em_peers():
 
     try:
         # Execute the OmniQuery command and capture the output
-        result = subprocess.run(
-            query_command,
-            shell=True,  # Using shell=True to allow multi-part commands
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+        result = run_system_command(query_command)
 
         if result.returncode == 0:
             output = result.stdout.strip()
@@ -1,7 +1,6 @@
 # Description: This script allows the user to fail a deployment notification by setting the status to 'failed' (status=13).
 
-from core.utils import print_warning_box, validate_hex_uuid
-import subprocess
+from core.utils import print_warning_box, validate_hex_uuid, run_system_command
 
 def fail_deployment():
     """
@@ -38,15 +37,7 @@ def fail_deployment():
 
     try:
         # Execute the OmniQuery command and capture the output
-        result = subprocess.run(
-            query_command,
-            shell=True,  # Using shell=True to allow multi-part commands
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,  # Text mode to automatically decode
-            encoding='utf-8',  # UTF-8 encoding
-            errors='ignore'  # Ignore characters that can't be decoded
-        )
+        result = run_system_command(query_command)
 
         if result.returncode == 0:
             print(f"Deployment with UUID {uuid} successfully marked as failed.")
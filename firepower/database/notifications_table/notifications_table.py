@@ -1,6 +1,7 @@
 # Description: This script provides a function to query the notifications table in the Firepower database.
 
-import subprocess
+from core.utils import run_system_command
+
 
 def notifications_table():
     """
@@ -60,15 +61,7 @@ def notifications_table():
 
     try:
         # Execute the OmniQuery command and capture the output
-        result = subprocess.run(
-            query_command,
-            shell=True,  # Using shell=True to allow multi-part commands
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,  # Text mode to automatically decode
-            encoding='utf-8',  # Try UTF-8 encoding
-            errors='ignore'  # Ignore characters that can't be decoded
-        )
+        result = run_system_command(query_command)
 
         if result.returncode == 0:
             output = result.stdout.strip()
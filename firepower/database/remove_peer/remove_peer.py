@@ -1,7 +1,6 @@
 # Description: This script is used to remove a peer from the Firepower Management Center database using the remove_peer.pl script.
 
-from core.utils import print_warning_box, validate_hex_uuid
-import subprocess
+from core.utils import print_warning_box, validate_hex_uuid, run_system_command
 
 def remove_peer():
     """
@@ -39,15 +38,7 @@ def remove_peer():
 
     try:
         # Execute the command and capture the output
-        result = subprocess.run(
-            command,
-            shell=True,  # Using shell=True to allow the command to run
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,  # Text mode to automatically decode
-            encoding='utf-8',  # UTF-8 encoding
-            errors='ignore'  # Ignore characters that can't be decoded
-        )
+        result = run_system_command(command)
 
         if result.returncode == 0:
             print(f"Peer with UUID {uuid} successfully removed.")
@@ -1,6 +1,7 @@
 # Description: This script queries the database for SSL peer information.
 
-import subprocess
+from core.utils import run_system_command
+
 
 def ssl_peers():
     """
@@ -13,15 +14,7 @@ def ssl_peers():
 
     try:
         # Execute the OmniQuery command and capture the output with explicit encoding handling
-        result = subprocess.run(
-            query_command,
-            shell=True,  # Using shell=True to allow multi-part commands
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,  # Text mode to automatically decode
-            encoding='utf-8',  # Try UTF-8 encoding, fallback can be added if needed
-            errors='ignore'  # Ignore characters that can't be decoded
-        )
+        result = run_system_command(query_command)
 
         if result.returncode == 0:
             output = result.stdout.strip()
@@ -1,10 +1,15 @@
 # Description: This file contains the disk usage troubleshooting menu.
 
-from firepower.disk_usage.display_disk_usage.display_disk_usage import display_disk_usage
-from firepower.disk_usage.find_large_files.find_large_files import find_large_files
-from firepower.disk_usage.gather_deleted_files.gather_deleted_files import gather_deleted_files_info
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
 
+# Feature modules are imported only when their menu entry is selected
+display_disk_usage = lazy_command("firepower.disk_usage.display_disk_usage.display_disk_usage")
+find_large_files = lazy_command("firepower.disk_usage.find_large_files.find_large_files")
+gather_deleted_files_info = lazy_command(
+    "firepower.disk_usage.gather_deleted_files.gather_deleted_files", "gather_deleted_files_info"
+)
+
 
 def disk_usage_menu():
     # Map menu options to descriptions and their respective functions
@@ -1,6 +1,6 @@
 # Description: Display disk usage with 'df -TH'.
 
-import subprocess
+from core.utils import run_system_command
 
 
 def display_disk_usage():
@@ -8,7 +8,7 @@ def display_disk_usage():
     Display disk usage with 'df -TH'.
     """
     try:
-        result = subprocess.run(["df", "-TH"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        result = run_system_command(["df", "-TH"])
         print(result.stdout)
     except Exception as e:
         print(f"An error occurred while running 'df -TH': {e}")
@@ -1,6 +1,6 @@
 # Description: Find files greater than a user-specified size and display their sizes in a table.
 
-import subprocess
+from core.utils import run_system_command
 
 
 def find_large_files():
@@ -16,7 +16,7 @@ def find_large_files():
         print(f"\nFinding files greater than {size}...\n")
         find_command = f"find / -type f -size +{size} -exec ls -lh {{}} + 2>/dev/null | awk '{{print $9, $5}}'"
 
-        result = subprocess.run(find_command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        result = run_system_command(find_command)
 
         if result.stdout:
             # Parse the results and split into file paths and sizes
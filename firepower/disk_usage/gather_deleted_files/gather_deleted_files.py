@@ -1,7 +1,8 @@
 # Description: Gather information about deleted files with 'lsof | grep -i deleted' and save it to a file.
 
 import time
-import subprocess
+from core.retention import ensure_space
+from core.utils import run_system_command
 
 
 def gather_deleted_files_info():
@@ -13,8 +14,12 @@ def gather_deleted_files_info():
         current_time = time.strftime("%Y%m%d_%H%M%S")
         output_file = f"/var/common/{current_time}_deleted_files.txt"
 
+        # Older exports are evicted first, and nothing is written onto a nearly full disk
+        if not ensure_space("/var/common"):
+            return
+
         # Run the command to find deleted files
-        result = subprocess.run("lsof | grep -i deleted", shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        result = run_system_command("lsof | grep -i deleted")
 
         # Write the output to a file
         with open(output_file, 'w') as file:
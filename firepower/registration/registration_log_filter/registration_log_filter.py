@@ -1,6 +1,7 @@
 # Description: This script is used to search logs based on the UUID and IP address and output to a file.
 
 from core.utils import validate_uuid, validate_ip
+from core.profiling import profile_command
 import time
 import subprocess
 
@@ -51,7 +52,8 @@ def grep_logs():
         grep_command = f'grep -E "{uuid}|{ip_address}|sftunneld" /var/log/messages > {output_file}'
 
         # Run the grep command to search logs and write to the output file
-        subprocess.run(grep_command, shell=True, check=True)
+        with profile_command(grep_command, kind="system"):
+            subprocess.run(grep_command, shell=True, check=True)
 
         print(f"\n[+] Logs have been successfully saved to {output_file}")
     except subprocess.CalledProcessError as e:
@@ -1,13 +1,16 @@
 # Description: This script contains the registration troubleshooting menu.
 
+from core.registry import lazy_command
 from core.utils import flush_stdin
-from firepower.registration.verify_connectivity.verify_connectivity import verify_connectivity
-from firepower.registration.bandwidth_test.bandwidth_test import run_bandwidth_test
-from firepower.registration.sftunnel_conf.sftunnel_conf import sftunnel_conf
-from firepower.registration.sftunnel_json.sftunnel_json import sftunnel_json
-from firepower.registration.sftunnel_certificate.sftunnel_certificate import sftunnel_certificate
-from firepower.registration.registration_log_filter.registration_log_filter import grep_logs
-from firepower.database.em_peers.em_peers import em_peers
+
+# Feature modules are imported only when their menu entry is selected
+verify_connectivity = lazy_command("firepower.registration.verify_connectivity.verify_connectivity")
+run_bandwidth_test = lazy_command("firepower.registration.bandwidth_test.bandwidth_test", "run_bandwidth_test")
+sftunnel_conf = lazy_command("firepower.registration.sftunnel_conf.sftunnel_conf")
+sftunnel_json = lazy_command("firepower.registration.sftunnel_json.sftunnel_json")
+sftunnel_certificate = lazy_command("firepower.registration.sftunnel_certificate.sftunnel_certificate")
+grep_logs = lazy_command("firepower.registration.registration_log_filter.registration_log_filter", "grep_logs")
+em_peers = lazy_command("firepower.database.em_peers.em_peers")
 
 
 def registration_menu():
@@ -1,6 +1,6 @@
 # Description: This script is used to validate the sftunnel certificate by displaying its details.
 
-import subprocess
+from core.utils import run_system_command
 
 
 def sftunnel_certificate():
@@ -10,12 +10,7 @@ def sftunnel_certificate():
     print("Displaying the sftunnel certificate details...")
 
     try:
-        result = subprocess.run(
-            ["openssl", "x509", "-text", "-in", "/etc/sf/ca_root/cacert.pem"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+        result = run_system_command(["openssl", "x509", "-text", "-in", "/etc/sf/ca_root/cacert.pem"])
 
         if result.returncode == 0:
             print(result.stdout)  # Print the certificate details
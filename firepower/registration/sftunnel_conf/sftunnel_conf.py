@@ -1,6 +1,6 @@
 # Description: This script is used to verify the contents of the sftunnel.conf file by printing it.
 
-import subprocess
+from core.utils import run_system_command
 
 
 def sftunnel_conf():
@@ -9,12 +9,7 @@ def sftunnel_conf():
     """
     print("Displaying the contents of /etc/sf/sftunnel.conf...")
     try:
-        result = subprocess.run(
-            ["cat", "/etc/sf/sftunnel.conf"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+        result = run_system_command(["cat", "/etc/sf/sftunnel.conf"])
 
         if result.returncode == 0:
             print(result.stdout)  # Print the contents of the sftunnel.conf file
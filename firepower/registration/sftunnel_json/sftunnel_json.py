@@ -1,6 +1,6 @@
 # Description: Contains utility functions used by the other modules.
 
-import subprocess
+from core.utils import run_system_command
 
 
 def sftunnel_json():
@@ -33,12 +33,7 @@ def sftunnel_json():
 
     try:
         # Run the cat command to read the sftunnel.json file
-        result = subprocess.run(
-            ["cat", json_path],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+        result = run_system_command(["cat", json_path])
 
         if result.returncode == 0:
             print(result.stdout)  # Print the contents of the sftunnel.json file
@@ -4,6 +4,7 @@ import socket
 import subprocess
 import time
 import threading
+from core.utils import run_system_command
 
 
 def verify_connectivity():
@@ -67,13 +68,7 @@ def verify_connectivity():
         start_time = time.time()
 
         try:
-            result = subprocess.run(
-                ["telnet", server_ip, "8305"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=10  # Timeout after 10 seconds
-            )
+            result = run_system_command(["telnet", server_ip, "8305"], timeout=10)
 
             elapsed_time = time.time() - start_time
 
@@ -1,9 +1,20 @@
 # Description: This script is a simple menu-driven program that allows the user to access data dumps.
+# With --sample it runs the headless counter sampler instead of the menu, and with --resume it finishes the Show Tech
+# collections an earlier run did not complete. With --batch it runs the Show Tech collectors named in a job file without
+# any prompt and prints a JSON status document.
 
+import argparse
+import sys
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from menus.troubleshoot_menu import troubleshoot_menu
-from menus.data_dump_menu import data_dump_menu
-from menus.main_menu_help.main_menu_help import main_menu_help
+
+# Feature modules are imported only when their menu entry is selected
+troubleshoot_menu = lazy_command("menus.troubleshoot_menu")
+data_dump_menu = lazy_command("menus.data_dump_menu")
+main_menu_help = lazy_command("menus.main_menu_help.main_menu_help")
+run_sampler = lazy_command("core.sampler", "run_sampler")
+resume_pending = lazy_command("core.journal", "resume_pending")
+run_batch = lazy_command("core.batch", "run_batch")
 
 
 def main_menu():
@@ -35,5 +46,29 @@ def main_menu():
             print("\n[!] Invalid choice. Please enter a number between 0 and 3.")
 
 
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="FP Troubleshooting Helper (FPTH)")
+    parser.add_argument("--sample", nargs="?", const="", metavar="SAMPLERS",
+                        help="poll LINA counters in the background instead of showing the menu; optionally a "
+                             "'<sampler>=<seconds>,...' list (default: FPTH_SAMPLERS)")
+    parser.add_argument("--resume", action="store_true",
+                        help="finish the Show Tech collections interrupted by Ctrl-C, an SSH drop or a failover, "
+                             "collecting only the sections they did not complete")
+    parser.add_argument("--batch", metavar="JOB",
+                        help="run the collectors named in a job file ('-' for stdin) without prompts and print a "
+                             "JSON status document; the exit status is 0 only if every collector succeeded")
+    parser.add_argument("--duration", type=float, metavar="SECONDS",
+                        help="stop sampling after this many seconds (default: run until Ctrl-C)")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    main_menu()
+    arguments = parse_arguments()
+    if arguments.batch:
+        sys.exit(run_batch(arguments.batch))
+    elif arguments.sample is not None:
+        run_sampler(arguments.sample or None, arguments.duration)
+    elif arguments.resume:
+        resume_pending()
+    else:
+        main_menu()
@@ -1,24 +1,13 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
 
 
 def blocks_exhaustion_history(suppress_output=False, help_requested=False):
     """Retrieves and optionally displays the Blocks Exhaustion History using 'show blocks exhaustion history'."""
 
-    blocks_exhaustion_history_help_info = {
-        'command': 'show blocks exhaustion history',
-        'description': (
-            "Displays a history of memory block exhaustion events, including timestamps and block sizes "
-            "that ran out of memory. This command is useful for diagnosing memory allocation issues and "
-            "identifying patterns of memory depletion that may indicate a resource leak."
-        )
-    }
-
     # Handle help request
     if help_requested:
-        print("\n" + "=" * 80)
-        print(f"Help for: {blocks_exhaustion_history_help_info['command']}".center(80))
-        print("=" * 80)
-        print(f"\n{blocks_exhaustion_history_help_info['description']}\n")
+        print_help("blocks_exhaustion_history")
         return None  # Do not execute the command
 
     command = "show blocks exhaustion history"
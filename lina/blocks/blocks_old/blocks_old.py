@@ -1,24 +1,13 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
 
 
 def blocks_old(suppress_output=False, help_requested=False):
     """Retrieves and optionally displays the Blocks Old using 'show blocks old'."""
 
-    blocks_old_help_info = {
-        'command': 'show blocks old',
-        'description': (
-            "Displays a snapshot of the oldest allocated memory blocks in the system. "
-            "This command helps in identifying memory fragmentation and diagnosing potential "
-            "memory leaks by tracking which blocks have been held for an extended period."
-        )
-    }
-
     # Handle help request
     if help_requested:
-        print("\n" + "=" * 80)
-        print(f"Help for: {blocks_old_help_info['command']}".center(80))
-        print("=" * 80)
-        print(f"\n{blocks_old_help_info['description']}\n")
+        print_help("blocks_old")
         return None  # Do not execute the command
 
     command = "show blocks old"
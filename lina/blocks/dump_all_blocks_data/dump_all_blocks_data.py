@@ -1,17 +1,35 @@
 import os
-import tarfile
 from datetime import datetime
+from core.archive import open_archive
+from core.cli_stream import StreamedCliOutput
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.blocks.blocks.blocks import blocks
 from lina.blocks.blocks_exhaustion_snapsnot.blocks_exhaustion_snapshot import blocks_exhaustion_snapshot
 from lina.blocks.blocks_queue_history_core_local.blocks_queue_history_core_local import blocks_queue_history_core_local
 from lina.blocks.blocks_queue_history_detail.blocks_queue_history_detail import blocks_queue_history_detail
 from lina.blocks.blocks_old.blocks_old import blocks_old
-from lina.blocks.blocks_old_dump.blocks_old_dump import blocks_old_dump
 from lina.blocks.blocks_exhaustion_history.blocks_exhaustion_history import blocks_exhaustion_history
 
 
+# Sections of the dump (each written to its own <timestamp>_<name>.log archive member), in the order they are written
+COLLECTORS = [
+    ("blocks", blocks),
+    ("blocks_exhaustion_history", blocks_exhaustion_history),
+    ("blocks_exhaustion_snapshot", blocks_exhaustion_snapshot),
+    ("blocks_queue_history_core_local", blocks_queue_history_core_local),
+    ("blocks_queue_history_detail", blocks_queue_history_detail),
+    ("blocks_old", blocks_old),
+    ("blocks_old_dump", StreamedCliOutput("show blocks old dump")),
+]
+
+
+@journaled
+@budgeted
 def dump_all_blocks_data():
-    """Gathers output from all blocks-related commands, writes each to a separate file, and compresses them into a .tar.gz archive."""
+    """Gathers output from all blocks-related commands and writes each as a separate log into a .tar.gz archive."""
 
     # Define the directory path
     troubleshooting_dir = "/var/log/fp_troubleshooting_data"
@@ -25,50 +43,29 @@ def dump_all_blocks_data():
             print(f"[!] Error creating directory: {e}")
             return
 
-    # Generate timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    # Create the working directory named "<timestamp>_show_tech_blocks"
-    log_dir = os.path.join(troubleshooting_dir, f"{timestamp}_show_tech_blocks")
-
-    try:
-        os.makedirs(log_dir)  # Create the timestamped directory
-    except Exception as e:
-        print(f"[!] Error creating log directory: {e}")
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
         return
 
-    # Define commands and their corresponding functions
-    commands = {
-        "blocks": blocks,
-        "blocks_exhaustion_history": blocks_exhaustion_history,
-        "blocks_exhaustion_snapshot": blocks_exhaustion_snapshot,
-        "blocks_queue_history_core_local": blocks_queue_history_core_local,
-        "blocks_queue_history_detail": blocks_queue_history_detail,
-        "blocks_old": blocks_old,
-        "blocks_old_dump": blocks_old_dump
-    }
+    # Generate timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    # Execute each command and write to separate timestamped log files
-    for filename, function in commands.items():
-        file_path = os.path.join(log_dir, f"{timestamp}_{filename}.log")
-        try:
-            output = function(suppress_output=True)
-            with open(file_path, "w") as f:
-                f.write(output + "\n")
-            print(f"[+] Wrote output to: {file_path}")
-        except Exception as e:
-            print(f"[!] Error retrieving data for {filename}: {e}")
+    # Every log is a member of the "<timestamp>_show_tech_blocks" directory inside the archive
+    log_dir = f"{timestamp}_show_tech_blocks"
 
-    # Compress all logs into a .tar.gz archive with the required naming format
-    archive_path = os.path.join(troubleshooting_dir, f"{timestamp}_show_tech_blocks.tar.gz")
+    # Run the collectors concurrently, then stream each result into its own timestamped log in the archive
+    results = run_collectors(COLLECTORS)
     try:
-        with tarfile.open(archive_path, "w:gz") as tar:
-            tar.add(log_dir, arcname=os.path.basename(log_dir))
-        print(f"[+] Compressed logs into: {archive_path}")
-
-        # Cleanup: Remove the temporary log directory and files after compression
-        for file in os.listdir(log_dir):
-            os.remove(os.path.join(log_dir, file))  # Remove individual log files
-        os.rmdir(log_dir)  # Remove empty directory
+        with open_archive(os.path.join(troubleshooting_dir, log_dir)) as archive:
+            for filename, output in results:
+                member_name = f"{log_dir}/{timestamp}_{filename}.log"
+                with archive.member(member_name) as f:
+                    if isinstance(output, StreamedCliOutput):
+                        # Large outputs are streamed straight into the archive rather than held in memory
+                        output.write_to(f)
+                    else:
+                        f.write(output + "\n")
+                print(f"[+] Wrote output to: {member_name}")
+        print(f"[+] Compressed logs into: {archive.path}")
     except Exception as e:
         print(f"[!] Error compressing logs: {e}")
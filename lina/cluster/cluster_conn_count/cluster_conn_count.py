@@ -1,3 +1,4 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
 
 def cluster_conn_count(suppress_output=False, help_requested=False):
@@ -7,32 +8,9 @@ def cluster_conn_count(suppress_output=False, help_requested=False):
     If help_requested=True, it prints command information instead of executing the command.
     """
 
-    cluster_conn_count_help = {
-        'commands': ['show cluster info conn-distribution', 'show cluster conn count'],
-        'description': (
-            "Displays the total number of active connections within the cluster and their distribution across "
-            "cluster members. This helps in analyzing connection load balancing and troubleshooting uneven traffic "
-            "distribution issues."
-        ),
-        'example_output': """
-firepower/master# show cluster info conn-distribution 
-Unit            Total Conns (/sec)    Reg Conns (/sec)   Dir Conns (/sec)    Fwd Conns (/sec)
-RTP-FW2             5                   2                   3                   0                   
-RTP-FW1             5                   4                   1                   0                   
-
-firepower# show cluster conn count
-Total connections: 625
-        """
-    }
-
     # If help is requested, print help content and exit the function
     if help_requested:
-        print("\n" + "=" * 80)
-        print(f"Help for: {', '.join(cluster_conn_count_help['commands'])}".center(80))
-        print("=" * 80)
-        print(f"\n{cluster_conn_count_help['description']}\n")
-        print("Example Output:")
-        print(cluster_conn_count_help['example_output'])
+        print_help("cluster_conn_count")
         return None  # No actual command execution
 
     try:
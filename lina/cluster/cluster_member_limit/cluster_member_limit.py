@@ -1,4 +1,5 @@
 import re
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
 
 def cluster_member_limit(suppress_output=False, help_requested=False):
@@ -6,37 +7,9 @@ def cluster_member_limit(suppress_output=False, help_requested=False):
        If help_requested=True, it prints command information instead.
     """
 
-    cluster_member_limit_help = {
-        'command': 'show cluster info',
-        'description': (
-            "Displays the current cluster member limit, which defines the maximum number of "
-            "devices allowed in a cluster. This setting ensures proper resource distribution and "
-            "prevents issues such as NAT pool exhaustion in a clustered firewall deployment."
-        ),
-        'example_output': """
-> show cluster info
-Cluster asa_cluster1: On
-     Interface mode: spanned
- Cluster Member Limit : 16
-     This is "unit-1-1" in state MASTER
-         ID        : 0
-         Site ID   : 1
-         Version   : 9.17(1)
-         Serial No.: SN
-         CCL IP    : 10.10.10.1
-         CCL MAC   : dead.dead.dead
-         Module    : FPR4K-SM-24
-        """
-    }
-
     # If help is requested, print help content and exit the function
     if help_requested:
-        print("\n" + "=" * 80)
-        print(f"Help for: {cluster_member_limit_help['command']}".center(80))
-        print("=" * 80)
-        print(f"\n{cluster_member_limit_help['description']}\n")
-        print("Example Output:")
-        print(cluster_member_limit_help['example_output'])
+        print_help("cluster_member_limit")
         return None  # No actual command execution
 
     # Execute the Cluster Info command
@@ -1,3 +1,4 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
 
 def cluster_mtu(suppress_output=False, help_requested=False):
@@ -6,31 +7,9 @@ def cluster_mtu(suppress_output=False, help_requested=False):
     If help_requested=True, it prints command information instead of executing the command.
     """
 
-    cluster_mtu_help = {
-        'command': 'show running-config mtu',
-        'description': (
-            "Displays the configured Maximum Transmission Unit (MTU) settings for all interfaces, including "
-            "the Cluster Control Link (CCL). Proper MTU configuration ensures efficient packet transmission "
-            "without fragmentation. The CCL MTU should be set at least 100 bytes larger than data interfaces "
-            "to ensure stable cluster communication."
-        ),
-        'example_output': """
-firepower# show running-config | include mtu
-mtu inside 1500
-mtu outside 1500
-mtu dmz 1400
-mtu Cluster-Interface 1600
-        """
-    }
-
     # If help is requested, print help content and exit the function
     if help_requested:
-        print("\n" + "=" * 80)
-        print(f"Help for: {cluster_mtu_help['command']}".center(80))
-        print("=" * 80)
-        print(f"\n{cluster_mtu_help['description']}\n")
-        print("Example Output:")
-        print(cluster_mtu_help['example_output'])
+        print_help("cluster_mtu")
         return None  # No actual command execution
 
     # Execute command to retrieve MTU settings
@@ -1,3 +1,4 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
 
 
@@ -7,21 +8,9 @@ def cluster_traffic(suppress_output=False, help_requested=False):
     If help_requested=True, it prints command information instead of executing the command.
     """
 
-    cluster_traffic_help = {
-        'command': 'show cluster traffic',
-        'description': (
-            "Displays real-time and cumulative traffic statistics for the cluster. "
-            "This information helps analyze load distribution across cluster nodes, "
-            "monitor network throughput, and detect potential bottlenecks."
-        ),
-    }
-
     # If help is requested, print help content and exit the function
     if help_requested:
-        print("\n" + "=" * 80)
-        print(f"Help for: {cluster_traffic_help['command']}".center(80))
-        print("=" * 80)
-        print(f"\n{cluster_traffic_help['description']}\n")
+        print_help("cluster_traffic")
         return None  # No actual command execution
 
     try:
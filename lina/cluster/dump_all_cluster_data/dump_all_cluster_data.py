@@ -1,5 +1,9 @@
 import os
 from datetime import datetime
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.cluster.cluster_running_config.cluster_running_config import cluster_running_config
 from lina.cluster.cluster_member_limit.cluster_member_limit import cluster_member_limit
 from lina.cluster.cluster_nat_pool.cluster_nat_pool import cluster_nat_pool
@@ -12,6 +16,23 @@ from lina.cluster.cluster_cpu.cluster_cpu import cluster_cpu
 from lina.cluster.cluster_nat_pool.cluster_exec_nat_pool import cluster_exec_nat_pool
 
 
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("Cluster Running Config", cluster_running_config),
+    ("Cluster Member Limit", cluster_member_limit),
+    ("Cluster NAT Pool", cluster_nat_pool),
+    ("Cluster NAT Pool Detail (Cluster Exec)", cluster_exec_nat_pool),
+    ("Cluster Resource Usage", cluster_resource_usage),
+    ("Cluster MTU", cluster_mtu),
+    ("Cluster Conn Count", cluster_conn_count),
+    ("Cluster Xlate Count", cluster_xlate_count),
+    ("Cluster Traffic", cluster_traffic),
+    ("Cluster CPU", cluster_cpu),
+]
+
+
+@journaled
+@budgeted
 def dump_all_cluster_data():
     """Gathers output from all Cluster commands and writes them to a log file under /var/log/fp_troubleshooting_data."""
 
@@ -27,24 +48,17 @@ def dump_all_cluster_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_cluster_dump.log")
 
     try:
-        # Gather outputs
-        data_to_dump = [
-            ("Cluster Running Config", cluster_running_config(suppress_output=True)),
-            ("Cluster Member Limit", cluster_member_limit(suppress_output=True)),
-            ("Cluster NAT Pool", cluster_nat_pool(suppress_output=True)),
-            ("Cluster NAT Pool Detail (Cluster Exec)", cluster_exec_nat_pool(suppress_output=True)),
-            ("Cluster Resource Usage", cluster_resource_usage(suppress_output=True)),
-            ("Cluster MTU", cluster_mtu(suppress_output=True)),
-            ("Cluster Conn Count", cluster_conn_count(suppress_output=True)),
-            ("Cluster Xlate Count", cluster_xlate_count(suppress_output=True)),
-            ("Cluster Traffic", cluster_traffic(suppress_output=True)),
-            ("Cluster CPU", cluster_cpu(suppress_output=True))
-        ]
+        # Gather outputs concurrently; results come back in the order listed
+        data_to_dump = run_collectors(COLLECTORS)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
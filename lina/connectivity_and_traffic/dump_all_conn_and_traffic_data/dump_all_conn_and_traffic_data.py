@@ -1,7 +1,11 @@
 import os
 from datetime import datetime
+from core.cli_stream import StreamedCliOutput
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.connectivity_and_traffic.arp.arp import arp_dump
-from lina.connectivity_and_traffic.conn_detail.conn_detail import conn_detail_dump
 from lina.connectivity_and_traffic.sla_config.sla_config import sla_config
 from lina.connectivity_and_traffic.sla_operational_state.sla_operational_state import sla_operational_state
 from lina.connectivity_and_traffic.traffic.traffic import traffic
@@ -9,6 +13,20 @@ from lina.connectivity_and_traffic.perfmon.perfmon import perfmon
 from lina.connectivity_and_traffic.service_policy.service_policy import service_policy
 
 
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("ARP", arp_dump),
+    ("Conn Detail", StreamedCliOutput("show conn detail")),
+    ("SLA Config", sla_config),
+    ("SLA Operational State", sla_operational_state),
+    ("Traffic", traffic),
+    ("Perfmon", perfmon),
+    ("Service Policy", service_policy),
+]
+
+
+@journaled
+@budgeted
 def dump_all_conn_and_traffic_data():
     """Gathers output from all conn/traffic commands and writes them to a log file under /var/log/fp_troubleshooting_data."""
 
@@ -24,21 +42,17 @@ def dump_all_conn_and_traffic_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_conn_and_traffic_dump.log")
 
     try:
-        # Gather outputs
-        data_to_dump = [
-            ("ARP", arp_dump(suppress_output=True)),
-            ("Conn Detail", conn_detail_dump(suppress_output=True)),
-            ("SLA Config", sla_config(suppress_output=True)),
-            ("SLA Operational State", sla_operational_state(suppress_output=True)),
-            ("Traffic", traffic(suppress_output=True)),
-            ("Perfmon", perfmon(suppress_output=True)),
-            ("Service Policy", service_policy(suppress_output=True))
-        ]
+        # Gather outputs concurrently; results come back in the order listed
+        data_to_dump = run_collectors(COLLECTORS)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
@@ -46,7 +60,11 @@ def dump_all_conn_and_traffic_data():
                 f.write(f"{'=' * 80}\n")
                 f.write(f"{title}\n")
                 f.write(f"{'-' * 80}\n")
-                f.write(f"{output}\n")
+                if isinstance(output, StreamedCliOutput):
+                    # Large tables are streamed straight into the file rather than held in memory
+                    output.write_to(f)
+                else:
+                    f.write(f"{output}\n")
                 f.write(f"{'=' * 80}\n\n")
 
         print(f"\n[+] All Connectivity and Traffic data written to: {log_file}")
@@ -0,0 +1,51 @@
+# Description: This script collects every LINA Show Tech dump in a single parallel pass and writes them into one
+# consolidated archive under /var/log/fp_troubleshooting_data.
+
+from functools import partial
+from core.deadline import budgeted
+from core.journal import journaled
+from core.show_tech import run_show_tech
+from lina.show_version.show_version import show_version
+from lina.nat.dump_all_nat_data.dump_all_nat_data import COLLECTORS as NAT_COLLECTORS
+from lina.routing.global_routing.dump_all_route_data.dump_all_route_data import COLLECTORS as ROUTE_COLLECTORS
+from lina.routing.eigrp.dump_all_eigrp_data.dump_all_eigrp_data import COLLECTORS as EIGRP_COLLECTORS
+from lina.routing.ospf.dump_all_ospf_data.dump_all_ospf_data import COLLECTORS as OSPF_COLLECTORS
+from lina.routing.bgp.dump_all_bgp_data.dump_all_bgp_data import COLLECTORS as BGP_COLLECTORS
+from lina.routing.isis.dump_all_isis_data.dump_all_isis_data import COLLECTORS as ISIS_COLLECTORS
+from lina.routing.vrf.dump_all_vrf_data.dump_all_vrf_data import COLLECTORS as VRF_COLLECTORS
+from lina.vpn.anyconnect.dump_all_anyconnect_data.dump_all_anyconnect_data import COLLECTORS as ANYCONNECT_COLLECTORS
+from lina.vpn.s2s.dump_all_s2s_data.dump_all_s2s_data import COLLECTORS as S2S_COLLECTORS
+from lina.connectivity_and_traffic.dump_all_conn_and_traffic_data.dump_all_conn_and_traffic_data \
+    import COLLECTORS as CONN_AND_TRAFFIC_COLLECTORS
+from lina.failover.dump_all_failover_data.dump_all_failover_data import COLLECTORS as FAILOVER_COLLECTORS
+from lina.logging_and_monitoring.syslog.dump_all_syslog_data.dump_all_syslog_data import COLLECTORS as SYSLOG_COLLECTORS
+from lina.logging_and_monitoring.snmp.dump_all_snmp_data.dump_all_snmp_data import COLLECTORS as SNMP_COLLECTORS
+from lina.cluster.dump_all_cluster_data.dump_all_cluster_data import COLLECTORS as CLUSTER_COLLECTORS
+from lina.blocks.dump_all_blocks_data.dump_all_blocks_data import COLLECTORS as BLOCKS_COLLECTORS
+
+# Every dump in the consolidated archive, written as <timestamp>_<name>_dump.log in this order
+DUMPS = [
+    ("version", [("System Version", partial(show_version, suppress_output=True))]),
+    ("nat", NAT_COLLECTORS),
+    ("route", ROUTE_COLLECTORS),
+    ("eigrp", EIGRP_COLLECTORS),
+    ("ospf", OSPF_COLLECTORS),
+    ("bgp", BGP_COLLECTORS),
+    ("isis", ISIS_COLLECTORS),
+    ("vrf", VRF_COLLECTORS),
+    ("anyconnect", ANYCONNECT_COLLECTORS),
+    ("s2s", S2S_COLLECTORS),
+    ("conn_and_traffic", CONN_AND_TRAFFIC_COLLECTORS),
+    ("failover", FAILOVER_COLLECTORS),
+    ("syslog", SYSLOG_COLLECTORS),
+    ("snmp", SNMP_COLLECTORS),
+    ("cluster", CLUSTER_COLLECTORS),
+    ("blocks", BLOCKS_COLLECTORS),
+]
+
+
+@journaled
+@budgeted
+def dump_all_data():
+    """Gathers every Show Tech dump concurrently and writes them to a single .tar.gz archive."""
+    run_show_tech(DUMPS)
@@ -1,5 +1,9 @@
 import os
 from datetime import datetime
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.failover.failover_running_config.failover_running_config import failover_running_config
 from lina.failover.failover_state.failover_state import failover_state
 from lina.failover.failover.failover import failover
@@ -10,6 +14,21 @@ from lina.failover.failover_config_sync_status.failover_config_sync_status impor
 from lina.failover.failover_app_sync_stats.failover_app_sync_stats import failover_app_sync_stats
 
 
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("Failover Running Config", failover_running_config),
+    ("Failover State", failover_state),
+    ("Failover", failover),
+    ("Failover Details", failover_details),
+    ("Failover Interface", failover_interface),
+    ("Failover Descriptor", failover_descriptor),
+    ("Failover Config Sync Status", failover_config_sync_status),
+    ("Failover Application Sync Stats", failover_app_sync_stats),
+]
+
+
+@journaled
+@budgeted
 def dump_all_failover_data():
     """Gathers output from all failover-related commands and writes them to a log file under
     /var/log/fp_troubleshooting_data."""
@@ -26,22 +45,17 @@ def dump_all_failover_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_failover_dump.log")
 
     try:
         # Gather outputs in the requested order
-        data_to_dump = [
-            ("Failover Running Config", failover_running_config(suppress_output=True)),
-            ("Failover State", failover_state(suppress_output=True)),
-            ("Failover", failover(suppress_output=True)),
-            ("Failover Details", failover_details(suppress_output=True)),
-            ("Failover Interface", failover_interface(suppress_output=True)),
-            ("Failover Descriptor", failover_descriptor(suppress_output=True)),
-            ("Failover Config Sync Status", failover_config_sync_status(suppress_output=True)),
-            ("Failover Application Sync Stats", failover_app_sync_stats(suppress_output=True)),
-        ]
+        data_to_dump = run_collectors(COLLECTORS)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
@@ -1,3 +1,4 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
 
 
@@ -6,31 +7,9 @@ def failover_descriptor(suppress_output=False, help_requested=False):
        If help_requested=True, it prints the help information instead.
     """
 
-    failover_descriptor_help = {
-        'command': 'show failover descriptor',
-        'description': (
-            "Displays detailed information about the failover descriptors, including the local unit's descriptor, "
-            "peer descriptor, and stateful failover descriptor. This command is useful for verifying the sync state "
-            "between failover units."
-        ),
-        'example_output': """
-FTDv# show failover descriptor
-
-Failover Descriptor Information:
-   Local Descriptor:  FTDv-Primary (Up)
-   Peer Descriptor:   FTDv-Secondary (Up)
-   Stateful Failover Descriptor: Active
-        """
-    }
-
     # If help is requested, print help content and exit the function
     if help_requested:
-        print("\n" + "=" * 80)
-        print(f"📖 Help for: {failover_descriptor_help['command']}".center(80))
-        print("=" * 80)
-        print(f"\n{failover_descriptor_help['description']}\n")
-        print("Example Output:")
-        print(failover_descriptor_help['example_output'])
+        print_help("failover_descriptor")
         return None  # No actual command execution
 
     # Execute the Failover Descriptor command
@@ -1,60 +1,7 @@
-def logging_and_monitoring_help():
-    """Displays troubleshooting guidance for logging and monitoring-related issues."""
-
-    help_sections = {
-        "1. Verifying Logging & Monitoring Configuration": [
-            "🔹 Use `show running-config all logging` to check **Syslog settings, logging levels, and destinations**.",
-            "🔹 Use `show running-config all snmp-server` to confirm **SNMP server configurations**.",
-            "🔹 Example:",
-            "   1️⃣ Run: show running-config all logging (Verify logging settings)",
-            "   2️⃣ Run: show running-config all snmp-server (Ensure SNMP monitoring is correctly configured)",
-        ],
-        "2. Checking Syslog Message Flow": [
-            "🔹 Use `show log` to check the **buffered log messages**.",
-            "🔹 Use `show logging queue` to identify any **message backlogs or dropped logs**.",
-            "🔹 Example:",
-            "   1️⃣ Run: show log (Verify if logs are stored locally)",
-            "   2️⃣ Run: show logging queue (Check message queue status and processing rate)",
-        ],
-        "3. Troubleshooting SNMP Issues": [
-            "🔹 Use `show snmp-server statistics` to check **SNMP polling activity and errors**.",
-            "🔹 Use `show snmp-server host` to confirm the **configured SNMP hosts**.",
-            "🔹 Example:",
-            "   1️⃣ Run: show snmp-server statistics (Check for failed SNMP queries)",
-            "   2️⃣ Run: show snmp-server host (Verify SNMP destinations and allowed IPs)",
-        ],
-        "4. Debugging Syslog Rate Limits & Filtering": [
-            "🔹 Use `show logging dynamic-rate-limit` to check if **rate limiting is impacting logging**.",
-            "🔹 Use `show logging message` to verify if certain logs are **disabled or filtered out**.",
-            "🔹 Example:",
-            "   1️⃣ Run: show logging dynamic-rate-limit (Check for log throttling due to high traffic)",
-            "   2️⃣ Run: show logging message (Ensure the required log messages are enabled)",
-        ],
-        "5. Monitoring Unified Syslog & SNMP Clients": [
-            "🔹 Use `show logging unified-client` to check **which clients are registered for Syslog logs**.",
-            "🔹 Use `show snmp-server user` to list **SNMP users and authentication methods**.",
-            "🔹 Example:",
-            "   1️⃣ Run: show logging unified-client (Confirm if the Syslog collector is active)",
-            "   2️⃣ Run: show snmp-server user (Ensure SNMP authentication is correctly configured)",
-        ],
-        "6. Reviewing Performance & Logging Behavior": [
-            "🔹 Use `show perfmon` to check **logging and monitoring performance statistics**.",
-            "🔹 Use `show logging manager detail` to view **Syslog manager configurations and active log levels**.",
-            "🔹 Example:",
-            "   1️⃣ Run: show perfmon (Analyze system logging performance)",
-            "   2️⃣ Run: show logging manager detail (Check for logging-related misconfigurations)",
-        ],
-    }
+from core.help_catalogue import print_help
 
-    print("\n" + "=" * 80)
-    print("📘 Logging & Monitoring Help: Understanding Command Relationships 📘".center(80))
-    print("=" * 80)
 
-    for section, lines in help_sections.items():
-        print(f"\n🟢 {section}")
-        for line in lines:
-            print(f"   {line}")
+def logging_and_monitoring_help():
+    """Displays troubleshooting guidance for logging and monitoring-related issues."""
 
-    print("\n" + "=" * 80)
-    print("🔍 Tip: Use 'X?' to see help for a specific command (e.g., '3?' for SNMP Issues).")
-    print("=" * 80)
+    print_help("logging_and_monitoring_help")
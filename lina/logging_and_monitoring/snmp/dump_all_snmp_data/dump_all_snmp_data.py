@@ -1,5 +1,9 @@
 import os
 from datetime import datetime
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.logging_and_monitoring.snmp.snmp_config.snmp_config import snmp_config
 from lina.logging_and_monitoring.snmp.snmp_engineid.snmp_engineid import snmp_engineid
 from lina.logging_and_monitoring.snmp.snmp_group.snmp_group import snmp_group
@@ -8,6 +12,19 @@ from lina.logging_and_monitoring.snmp.snmp_user.snmp_user import snmp_user
 from lina.logging_and_monitoring.snmp.snmp_stats.snmp_stats import snmp_stats
 
 
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("SNMP Configuration", snmp_config),
+    ("SNMP Engine ID", snmp_engineid),
+    ("SNMP Group", snmp_group),
+    ("SNMP Host", snmp_host),
+    ("SNMP User", snmp_user),
+    ("SNMP Statistics", snmp_stats),
+]
+
+
+@journaled
+@budgeted
 def dump_all_snmp_data():
     """Gathers output from all SNMP-related commands and writes them to a log file under
     /var/log/fp_troubleshooting_data."""
@@ -24,20 +41,17 @@ def dump_all_snmp_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_snmp_dump.log")
 
     try:
-        # Gather outputs
-        data_to_dump = [
-            ("SNMP Configuration", snmp_config(suppress_output=True)),
-            ("SNMP Engine ID", snmp_engineid(suppress_output=True)),
-            ("SNMP Group", snmp_group(suppress_output=True)),
-            ("SNMP Host", snmp_host(suppress_output=True)),
-            ("SNMP User", snmp_user(suppress_output=True)),
-            ("SNMP Statistics", snmp_stats(suppress_output=True)),
-        ]
+        # Gather outputs concurrently; results come back in the order listed
+        data_to_dump = run_collectors(COLLECTORS)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
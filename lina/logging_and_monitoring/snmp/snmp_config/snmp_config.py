@@ -1,3 +1,4 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
 
 
@@ -6,38 +7,9 @@ def snmp_config(suppress_output=False, help_requested=False):
        If help_requested=True, it prints the help information instead.
     """
 
-    snmp_config_help = {
-        'command': 'show run all snmp-server',
-        'description': (
-            "This command displays the current **SNMP configuration** on the FTD.\n\n"
-            "**Usage Notes & Troubleshooting:**\n"
-            "- SNMP is used for **remote monitoring and management** of FTD devices.\n"
-            "- If SNMP is not working, ensure **SNMP communities, users, and traps are configured**.\n"
-            "- Use `show snmp engineID` to verify the SNMP Engine ID.\n"
-            "- Use `show snmp stats` to check for SNMP message processing errors.\n"
-            "- Ensure the **firewall allows SNMP traffic** (UDP 161 for queries, UDP 162 for traps)."
-        ),
-        'example_output': """
-FTDv# show run all snmp-server
-
-snmp-server enable
-snmp-server host inside 192.168.1.100 community MyCommunity
-snmp-server user SNMPUser v3 auth sha MyAuthPass priv aes 128 MyPrivPass
-snmp-server group SNMPv3Group v3 priv read ViewAll
-snmp-server location DataCenter-Rack4
-snmp-server contact admin@example.com
-snmp-server enable traps snmp authentication linkup linkdown
-        """
-    }
-
     # If help is requested, print help content and exit the function
     if help_requested:
-        print("\n" + "=" * 80)
-        print(f"📖 Help for: {snmp_config_help['command']}".center(80))
-        print("=" * 80)
-        print(f"\n{snmp_config_help['description']}\n")
-        print("Example Output:")
-        print(snmp_config_help['example_output'])
+        print_help("snmp_config")
         return None  # No actual command execution
 
     command = "show run all snmp-server"
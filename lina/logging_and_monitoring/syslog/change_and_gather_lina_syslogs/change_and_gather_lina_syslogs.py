@@ -2,8 +2,7 @@
 
 import time
 import shutil
-import subprocess
-from core.utils import get_and_parse_cli_output
+from core.utils import get_and_parse_cli_output, run_system_command
 
 
 def log_analysis():
@@ -52,7 +51,7 @@ def log_analysis():
 
     # Update the logging_and_monitoring level based on user input
     new_logging_command = f'LinaConfigTool "logging_and_monitoring buffered {logging_levels[log_level]}"'
-    subprocess.run(new_logging_command, shell=True, check=True)
+    run_system_command(new_logging_command, check=True)
     print(f"Setting logging_and_monitoring level: {logging_levels[log_level]}\nRunning command: {new_logging_command}")
 
     # Wait for the specified duration to allow logs to be gathered
@@ -103,4 +102,5 @@ def restore_original_config(initial_config, log_level, logging_levels):
         new_logging_command = f'LinaConfigTool "{initial_config.strip()}"'
 
     # Execute the command to restore or modify the logging_and_monitoring configuration
-    subprocess.run(new_logging_command, shell=True, check=True)
+    # (run_system_command drops the cached running-config, so later lookups see the change)
+    run_system_command(new_logging_command, check=True)
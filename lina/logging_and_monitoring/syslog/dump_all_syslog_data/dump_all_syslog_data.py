@@ -1,5 +1,9 @@
 import os
 from datetime import datetime
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.logging_and_monitoring.syslog.logging_config.logging_config import logging_config
 from lina.logging_and_monitoring.syslog.logging_queue.logging_queue import logging_queue
 from lina.logging_and_monitoring.syslog.logging_message.logging_message import logging_message
@@ -12,6 +16,21 @@ from lina.logging_and_monitoring.syslog.logging_unified_client_stats.logging_uni
 from lina.logging_and_monitoring.syslog.logging_buffered_output.logging_buffered_output import logging_buffered_output
 
 
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("Logging Configuration", logging_config),
+    ("Logging Queue", logging_queue),
+    ("Logging Message Details", logging_message),
+    ("Logging Manager Detail", logging_manager_detail),
+    ("Logging Dynamic Rate Limit", logging_dynamic_rate_limit),
+    ("Logging Unified Client", logging_unified_client),
+    ("Logging Unified Client Stats", logging_unified_client_stats),
+    ("Logging Buffered Output", logging_buffered_output),
+]
+
+
+@journaled
+@budgeted
 def dump_all_syslog_data():
     """Gathers output from all Syslog-related commands and writes them to a log file under
     /var/log/fp_troubleshooting_data."""
@@ -28,22 +47,17 @@ def dump_all_syslog_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_syslog_dump.log")
 
     try:
-        # Gather outputs
-        data_to_dump = [
-            ("Logging Configuration", logging_config(suppress_output=True)),
-            ("Logging Queue", logging_queue(suppress_output=True)),
-            ("Logging Message Details", logging_message(suppress_output=True)),
-            ("Logging Manager Detail", logging_manager_detail(suppress_output=True)),
-            ("Logging Dynamic Rate Limit", logging_dynamic_rate_limit(suppress_output=True)),
-            ("Logging Unified Client", logging_unified_client(suppress_output=True)),
-            ("Logging Unified Client Stats", logging_unified_client_stats(suppress_output=True)),
-            ("Logging Buffered Output", logging_buffered_output(suppress_output=True)),
-        ]
+        # Gather outputs concurrently; results come back in the order listed
+        data_to_dump = run_collectors(COLLECTORS)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
@@ -1,13 +1,30 @@
 import os
 from datetime import datetime
+from core.cli_stream import StreamedCliOutput
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.nat.nat_running_config.nat_running_config import nat_running_config
 from lina.nat.nat_detail.nat_detail import nat_detail
 from lina.nat.xlate_count.xlate_count import xlate_count
-from lina.nat.xlate_detail.xlate_detail import xlate_detail
 from lina.nat.nat_proxy_arp.nat_proxy_arp import nat_proxy_arp
 from lina.nat.nat_pool.nat_pool import nat_pool
 
 
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("NAT Running Config", nat_running_config),
+    ("NAT Detail Table", nat_detail),
+    ("NAT Proxy-ARP Table", nat_proxy_arp),
+    ("NAT Pool", nat_pool),
+    ("Xlate Count", xlate_count),
+    ("Xlate Detail Table", StreamedCliOutput("show xlate detail")),
+]
+
+
+@journaled
+@budgeted
 def dump_all_nat_data():
     """Gathers output from all NAT commands and writes them to a log file under /var/log/fp_troubleshooting_data."""
 
@@ -23,20 +40,17 @@ def dump_all_nat_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_nat_dump.log")
 
     try:
-        # Gather outputs
-        data_to_dump = [
-            ("NAT Running Config", nat_running_config(suppress_output=True)),
-            ("NAT Detail Table", nat_detail(suppress_output=True)),
-            ("NAT Proxy-ARP Table", nat_proxy_arp(suppress_output=True)),
-            ("NAT Pool", nat_pool(suppress_output=True)),
-            ("Xlate Count", xlate_count(suppress_output=True)),
-            ("Xlate Detail Table", xlate_detail(suppress_output=True))
-        ]
+        # Gather outputs concurrently; results come back in the order listed
+        data_to_dump = run_collectors(COLLECTORS)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
@@ -44,7 +58,11 @@ def dump_all_nat_data():
                 f.write(f"{'=' * 80}\n")
                 f.write(f"{title}\n")
                 f.write(f"{'-' * 80}\n")
-                f.write(f"{output}\n")
+                if isinstance(output, StreamedCliOutput):
+                    # Large tables are streamed straight into the file rather than held in memory
+                    output.write_to(f)
+                else:
+                    f.write(f"{output}\n")
                 f.write(f"{'=' * 80}\n\n")
 
         print(f"\n[+] All NAT data written to: {log_file}")
@@ -1,6 +1,9 @@
 import os
-import tarfile
+from core.archive import ArchiveWriter
+from core.retention import ensure_space
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
+from core.cli_stream import stream_cli_output
 
 
 def xlate_detail(suppress_output=False, help_requested=False):
@@ -9,32 +12,9 @@ def xlate_detail(suppress_output=False, help_requested=False):
     If help_requested=True, it prints the help information instead.
     """
 
-    xlate_detail_help = {
-        'command': 'show xlate detail',
-        'description': (
-            "Displays detailed information about current Network Address Translation (NAT) translations (xlates) on the FTD. "
-            "This includes protocol, source and destination addresses and ports, translation types, flags, idle times, and timeouts. "
-            "This command is useful for monitoring and troubleshooting NAT operations, providing insights into how internal addresses are being translated."
-        ),
-        'example_output': """
-        firepower# show xlate detail
-        3 in use, 8 most used
-        Flags: D - DNS, e - extended, I - identity, i - dynamic, r - portmap,
-               s - static, T - twice, N - net-to-net
-        NAT from inside:192.168.1.5/12345 to outside:203.0.113.5/54321 flags ri idle 0:00:10 timeout 0:00:50
-        NAT from inside:192.168.1.6/12346 to outside:203.0.113.6/54322 flags ri idle 0:00:20 timeout 0:00:40
-        NAT from inside:192.168.1.7/12347 to outside:203.0.113.7/54323 flags ri idle 0:00:30 timeout 0:00:30
-        """
-    }
-
     # If help is requested, print help content and exit the function
     if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {xlate_detail_help['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{xlate_detail_help['description']}\n")
-        print("Example Output:")
-        print(xlate_detail_help['example_output'])
+        print_help("xlate_detail")
         return None  # No actual command execution
 
     # Execute the 'show xlate detail' command
@@ -57,82 +37,55 @@ def xlate_detail(suppress_output=False, help_requested=False):
 def xlate_detail_interactive(suppress_output=False, help_requested=False):
     """
     Retrieves and optionally displays the Xlate Detail Table using 'show xlate detail'.
-    Provides an interactive option to print to screen or write to a compressed file.
-    If help_requested=True, it prints the help information instead.
+    Provides an interactive option to print to screen or write to a compressed file; either way the table is
+    streamed line by line and returned as text. If help_requested=True, it prints the help information instead.
     """
 
-    xlate_detail_help = {
-        'command': 'show xlate detail',
-        'description': (
-            "Displays detailed information about current Network Address Translation (NAT) translations (xlates) on the FTD. "
-            "This includes protocol, source and destination addresses and ports, translation types, flags, idle times, and timeouts. "
-            "This command is useful for monitoring and troubleshooting NAT operations, providing insights into how internal addresses are being translated."
-        ),
-        'example_output': """
-        firepower# show xlate detail
-        3 in use, 8 most used
-        Flags: D - DNS, e - extended, I - identity, i - dynamic, r - portmap,
-               s - static, T - twice, N - net-to-net
-        NAT from inside:192.168.1.5/12345 to outside:203.0.113.5/54321 flags ri idle 0:00:10 timeout 0:00:50
-        NAT from inside:192.168.1.6/12346 to outside:203.0.113.6/54322 flags ri idle 0:00:20 timeout 0:00:40
-        NAT from inside:192.168.1.7/12347 to outside:203.0.113.7/54323 flags ri idle 0:00:30 timeout 0:00:30
-        """
-    }
-
     # If help is requested, print help content and exit the function
     if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {xlate_detail_help['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{xlate_detail_help['description']}\n")
-        print("Example Output:")
-        print(xlate_detail_help['example_output'])
+        print_help("xlate_detail_interactive")
         return None  # No actual command execution
 
     # Execute the 'show xlate detail' command
     command = "show xlate detail"
     output_dir = "/var/common/fp_troubleshooting_data"
     try:
-        output = get_and_parse_cli_output(command)
-        if not suppress_output:
-            print("\n⚠ WARNING: The output of this command can be large and may take time to process. ⚠\n")
-            choice = input("Would you like to (1) print to screen or (2) write to file? Enter 1 or 2: ").strip()
-
-            if choice == "1":
-                print("\nXlate Detail Table Output:")
-                print("-" * 80)
-                print(output)
-                print("-" * 80)
-
-            elif choice == "2":
-                # Ensure directory exists
-                os.makedirs(output_dir, exist_ok=True)
+        if suppress_output:
+            return get_and_parse_cli_output(command)
 
-                filename = "xlate_detail_output.txt"
-                file_path = os.path.join(output_dir, filename)
+        print("\n⚠ WARNING: The output of this command can be large and may take time to process. ⚠\n")
+        choice = input("Would you like to (1) print to screen or (2) write to file? Enter 1 or 2: ").strip()
 
-                # Write output to file
-                with open(file_path, "w") as f:
-                    f.write(output)
+        if choice == "2":
+            # Ensure directory exists
+            os.makedirs(output_dir, exist_ok=True)
+            if not ensure_space(output_dir):
+                return None
 
-                # Compress file
-                tar_path = file_path + ".tar.gz"
-                with tarfile.open(tar_path, "w:gz") as tar:
-                    tar.add(file_path, arcname=filename)
+            filename = "xlate_detail_output.txt"
 
-                # Remove the original text file after compression
-                os.remove(file_path)
+            # Stream the output straight into the compressed archive, without a plain text copy on disk
+            lines = []
+            with ArchiveWriter(os.path.join(output_dir, filename)) as archive:
+                with archive.member(filename) as f:
+                    for line in stream_cli_output(command):
+                        f.write(line + "\n")
+                        lines.append(line)
 
-                print(f"✅ Output written and compressed to: {tar_path}")
+            print(f"✅ Output written and compressed to: {archive.path}")
+            return "\n".join(lines)
 
-            else:
-                print("Invalid choice. Defaulting to printing on screen.")
-                print("\nXlate Detail Table Output:")
-                print("-" * 80)
-                print(output)
-                print("-" * 80)
+        if choice != "1":
+            print("Invalid choice. Defaulting to printing on screen.")
 
-        return output
+        print("\nXlate Detail Table Output:")
+        print("-" * 80)
+        lines = []
+        for line in stream_cli_output(command):
+            print(line)
+            lines.append(line)
+        print("-" * 80)
+        return "\n".join(lines)
     except Exception as e:
         error_message = f"[!] Error: {e}"
         if not suppress_output:
@@ -1,5 +1,9 @@
 import os
 from datetime import datetime
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.routing.bgp.bgp_running_config.bgp_running_config import bgp_running_config
 from lina.routing.bgp.bgp_summary.bgp_summary import bgp_summary
 from lina.routing.bgp.bgp_neighbors.bgp_neighbors import bgp_neighbors
@@ -12,6 +16,23 @@ from lina.routing.bgp.bgp_advertised_routes.bgp_advertised_routes import bgp_adv
 from lina.routing.bgp.bgp_update_group.bgp_update_group import bgp_update_group
 
 
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("BGP Running Configuration", bgp_running_config),
+    ("BGP Summary", bgp_summary),
+    ("BGP Neighbors", bgp_neighbors),
+    ("BGP IPv4 Unicast", bgp_ipv4_unicast),
+    ("BGP CIDR-Only", bgp_cidr_only),
+    ("BGP Paths", bgp_paths),
+    ("BGP Pending Prefixes", bgp_pending_prefixes),
+    ("BGP RIB Failure", bgp_rib_failure),
+    ("BGP Advertised Routes", bgp_advertised_routes),
+    ("BGP Update-group", bgp_update_group),
+]
+
+
+@journaled
+@budgeted
 def dump_all_bgp_data():
     """Gathers output from all BGP commands and writes them to a log file under /var/log/fp_troubleshooting_data."""
 
@@ -27,24 +48,17 @@ def dump_all_bgp_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_bgp_dump.log")
 
     try:
-        # Gather outputs
-        data_to_dump = [
-            ("BGP Running Configuration", bgp_running_config(suppress_output=True)),
-            ("BGP Summary", bgp_summary(suppress_output=True)),
-            ("BGP Neighbors", bgp_neighbors(suppress_output=True)),
-            ("BGP IPv4 Unicast", bgp_ipv4_unicast(suppress_output=True)),
-            ("BGP CIDR-Only", bgp_cidr_only(suppress_output=True)),
-            ("BGP Paths", bgp_paths(suppress_output=True)),
-            ("BGP Pending Prefixes", bgp_pending_prefixes(suppress_output=True)),
-            ("BGP RIB Failure", bgp_rib_failure(suppress_output=True)),
-            ("BGP Advertised Routes", bgp_advertised_routes(suppress_output=True)),
-            ("BGP Update-group", bgp_update_group(suppress_output=True))
-        ]
+        # Gather outputs concurrently; results come back in the order listed
+        data_to_dump = run_collectors(COLLECTORS)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
@@ -2,6 +2,10 @@
 
 import os
 from datetime import datetime
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.routing.eigrp.eigrp_events.eigrp_events import eigrp_events
 from lina.routing.eigrp.eigrp_interfaces.eigrp_interfaces import eigrp_interfaces
 from lina.routing.eigrp.eigrp_neighbors.eigrp_neighbors import eigrp_neighbors
@@ -11,6 +15,20 @@ from lina.routing.eigrp.eigrp_routing_table.eigrp_routing_table import eigrp_rou
 from lina.routing.eigrp.eigrp_running_config.eigrp_running_config import eigrp_running_config
 
 
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("EIGRP Running Configuration", eigrp_running_config),
+    ("EIGRP Events", eigrp_events),
+    ("EIGRP Interfaces", eigrp_interfaces),
+    ("EIGRP Neighbors", eigrp_neighbors),
+    ("EIGRP Topology", eigrp_topology),
+    ("EIGRP Traffic", eigrp_traffic),
+    ("EIGRP Routing Table", eigrp_routing_table),
+]
+
+
+@journaled
+@budgeted
 def dump_all_eigrp_data():
     """Gathers output from all EIGRP commands and writes them to a log file under /var/log/fp_troubleshooting_data."""
 
@@ -26,21 +44,17 @@ def dump_all_eigrp_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_eigrp_dump.log")
 
     try:
-        # Gather outputs
-        data_to_dump = [
-            ("EIGRP Running Configuration", eigrp_running_config(suppress_output=True)),
-            ("EIGRP Events", eigrp_events(suppress_output=True)),
-            ("EIGRP Interfaces", eigrp_interfaces(suppress_output=True)),
-            ("EIGRP Neighbors", eigrp_neighbors(suppress_output=True)),
-            ("EIGRP Topology", eigrp_topology(suppress_output=True)),
-            ("EIGRP Traffic", eigrp_traffic(suppress_output=True)),
-            ("EIGRP Routing Table", eigrp_routing_table(suppress_output=True)),
-        ]
+        # Gather outputs concurrently; results come back in the order listed
+        data_to_dump = run_collectors(COLLECTORS)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
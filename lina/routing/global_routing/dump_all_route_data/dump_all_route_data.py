@@ -1,10 +1,26 @@
 import os
+from functools import partial
 from datetime import datetime
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.routing.global_routing.running_config_all.running_config_all import running_config_all
 from lina.routing.global_routing.show_route_all.show_route_all import show_route_all
 from lina.routing.global_routing.asp_table_routing_all.asp_table_routing_all import asp_table_routing_all
 
 
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("Route Running Configuration", partial(running_config_all, config_type="route")),
+    ("Router Running Configuration", partial(running_config_all, config_type="router")),
+    ("Show Route All", show_route_all),
+    ("ASP Table Routing All", asp_table_routing_all),
+]
+
+
+@journaled
+@budgeted
 def dump_all_route_data():
     """Gathers output from all Route-related commands and writes them to a log file under
     /var/log/fp_troubleshooting_data."""
@@ -21,18 +37,17 @@ def dump_all_route_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_route_dump.log")
 
     try:
-        # Gather outputs
-        data_to_dump = [
-            ("Route Running Configuration", running_config_all(suppress_output=True, config_type="route")),
-            ("Router Running Configuration", running_config_all(suppress_output=True, config_type="router")),
-            ("Show Route All", show_route_all(suppress_output=True)),
-            ("ASP Table Routing All", asp_table_routing_all(suppress_output=True)),
-        ]
+        # Gather outputs concurrently; results come back in the order listed
+        data_to_dump = run_collectors(COLLECTORS)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
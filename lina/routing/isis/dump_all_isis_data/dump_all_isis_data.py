@@ -1,5 +1,9 @@
 import os
 from datetime import datetime
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.routing.isis.isis_database.isis_database import isis_database
 from lina.routing.isis.isis_hostname.isis_hostname import isis_hostname
 from lina.routing.isis.isis_lsp_log.isis_lsp_log import isis_lsp_log
@@ -10,6 +14,21 @@ from lina.routing.isis.isis_spf_log.isis_spf_log import isis_spf_log
 from lina.routing.isis.isis_topology.isis_topology import isis_topology
 
 
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("ISIS Running Config", isis_running_config),
+    ("ISIS Database", isis_database),
+    ("ISIS Hostname", isis_hostname),
+    ("ISIS LSP Log", isis_lsp_log),
+    ("ISIS Neighbors", isis_neighbors),
+    ("ISIS RIB", isis_rib),
+    ("ISIS SPF Log", isis_spf_log),
+    ("ISIS Topology", isis_topology),
+]
+
+
+@journaled
+@budgeted
 def dump_all_isis_data():
     """Gathers output from all ISIS commands and writes them to a log file under /var/log/fp_troubleshooting_data."""
 
@@ -25,22 +44,17 @@ def dump_all_isis_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_isis_dump.log")
 
     try:
-        # Gather outputs
-        data_to_dump = [
-            ("ISIS Running Config", isis_running_config(suppress_output=True)),
-            ("ISIS Database", isis_database(suppress_output=True)),
-            ("ISIS Hostname", isis_hostname(suppress_output=True)),
-            ("ISIS LSP Log", isis_lsp_log(suppress_output=True)),
-            ("ISIS Neighbors", isis_neighbors(suppress_output=True)),
-            ("ISIS RIB", isis_rib(suppress_output=True)),
-            ("ISIS SPF Log", isis_spf_log(suppress_output=True)),
-            ("ISIS Topology", isis_topology(suppress_output=True)),
-        ]
+        # Gather outputs concurrently; results come back in the order listed
+        data_to_dump = run_collectors(COLLECTORS)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
@@ -1,3 +1,4 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
 
 
@@ -6,30 +7,9 @@ def isis_hostname(suppress_output=False, help_requested=False):
        If help_requested=True, it prints the help information instead.
     """
 
-    isis_hostname_help = {
-        'command': 'show isis hostname',
-        'description': (
-            "Displays the hostnames assigned to ISIS system IDs. This command helps in mapping system IDs "
-            "to human-readable names, making it easier to interpret ISIS neighbor relationships and topology."
-        ),
-        'example_output': """
-ISIS Hostname Mapping:
-
-System ID             Hostname
-1921.6800.1001.00     R1
-1921.6800.1002.00     R2
-1921.6800.1003.00     R3
-        """
-    }
-
     # If help is requested, print help content and exit the function
     if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {isis_hostname_help['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{isis_hostname_help['description']}\n")
-        print("Example Output:")
-        print(isis_hostname_help['example_output'])
+        print_help("isis_hostname")
         return None  # No actual command execution
 
     # Execute the ISIS Hostname command
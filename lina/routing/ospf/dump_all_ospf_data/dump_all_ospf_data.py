@@ -1,5 +1,9 @@
 import os
 from datetime import datetime
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.routing.ospf.ospf_running_config.ospf_running_config import ospf_running_config
 from lina.routing.ospf.ospf_all.ospf_all import ospf_all
 from lina.routing.ospf.ospf_border_routers.ospf_border_routers import ospf_border_routers
@@ -13,6 +17,24 @@ from lina.routing.ospf.ospf_statistics.ospf_statistics import ospf_statistics
 from lina.routing.ospf.ospf_traffic.ospf_traffic import ospf_traffic
 
 
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("OSPF Running Configuration", ospf_running_config),
+    ("OSPF All", ospf_all),
+    ("OSPF Border Routers", ospf_border_routers),
+    ("OSPF Database", ospf_database),
+    ("OSPF Events", ospf_events),
+    ("OSPF Interface", ospf_interface),
+    ("OSPF Neighbor", ospf_neighbor),
+    ("OSPF NSF", ospf_nsf),
+    ("OSPF RIB", ospf_rib),
+    ("OSPF Statistics", ospf_statistics),
+    ("OSPF Traffic", ospf_traffic),
+]
+
+
+@journaled
+@budgeted
 def dump_all_ospf_data():
     """Gathers output from all OSPF commands and writes them to a log file under /var/log/fp_troubleshooting_data."""
 
@@ -28,25 +50,17 @@ def dump_all_ospf_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_ospf_dump.log")
 
     try:
-        # Gather outputs
-        data_to_dump = [
-            ("OSPF Running Configuration", ospf_running_config(suppress_output=True)),
-            ("OSPF All", ospf_all(suppress_output=True)),
-            ("OSPF Border Routers", ospf_border_routers(suppress_output=True)),
-            ("OSPF Database", ospf_database(suppress_output=True)),
-            ("OSPF Events", ospf_events(suppress_output=True)),
-            ("OSPF Interface", ospf_interface(suppress_output=True)),
-            ("OSPF Neighbor", ospf_neighbor(suppress_output=True)),
-            ("OSPF NSF", ospf_nsf(suppress_output=True)),
-            ("OSPF RIB", ospf_rib(suppress_output=True)),
-            ("OSPF Statistics", ospf_statistics(suppress_output=True)),
-            ("OSPF Traffic", ospf_traffic(suppress_output=True)),
-        ]
+        # Gather outputs concurrently; results come back in the order listed
+        data_to_dump = run_collectors(COLLECTORS)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
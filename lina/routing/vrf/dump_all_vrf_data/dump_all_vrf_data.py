@@ -1,5 +1,9 @@
 import os
 from datetime import datetime
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
 from lina.routing.vrf.vrf_running_config.vrf_running_config import vrf_running_config
 from lina.routing.vrf.vrf.vrf import vrf
 from lina.routing.vrf.vrf_counters.vrf_counters import vrf_counters
@@ -8,6 +12,19 @@ from lina.routing.vrf.vrf_lock.vrf_lock import vrf_lock
 from lina.routing.vrf.vrf_tableid.vrf_tableid import vrf_tableid
 
 
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("VRF Running Configuration", vrf_running_config),
+    ("VRF Information", vrf),
+    ("VRF Counters", vrf_counters),
+    ("VRF Detail", vrf_detail),
+    ("VRF Lock", vrf_lock),
+    ("VRF Table ID", vrf_tableid),
+]
+
+
+@journaled
+@budgeted
 def dump_all_vrf_data():
     """Gathers output from all VRF commands and writes them to a log file under /var/log/fp_troubleshooting_data."""
 
@@ -23,20 +40,17 @@ def dump_all_vrf_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_vrf_dump.log")
 
     try:
-        # Gather outputs
-        data_to_dump = [
-            ("VRF Running Configuration", vrf_running_config(suppress_output=True)),
-            ("VRF Information", vrf(suppress_output=True)),
-            ("VRF Counters", vrf_counters(suppress_output=True)),
-            ("VRF Detail", vrf_detail(suppress_output=True)),
-            ("VRF Lock", vrf_lock(suppress_output=True)),
-            ("VRF Table ID", vrf_tableid(suppress_output=True)),
-        ]
+        # Gather outputs concurrently; results come back in the order listed
+        data_to_dump = run_collectors(COLLECTORS)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
@@ -1,3 +1,4 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
 
 
@@ -6,29 +7,9 @@ def vrf_counters(suppress_output=False, help_requested=False):
        If help_requested=True, it prints the help information instead.
     """
 
-    vrf_counters_help = {
-        'command': 'show vrf counters',
-        'description': (
-            "Displays VRF-related traffic counters, including packet and byte statistics per VRF. "
-            "This command helps in monitoring traffic flow between VRFs and diagnosing connectivity issues."
-        ),
-        'example_output': """
-VRF Counters:
-
-VRF Name        In-Packets    In-Bytes     Out-Packets   Out-Bytes  
-VRF1            12345         6789012      23456         8901234
-VRF2            54321         2345678      65432         4567890
-        """
-    }
-
     # If help is requested, print help content and exit the function
     if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {vrf_counters_help['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{vrf_counters_help['description']}\n")
-        print("Example Output:")
-        print(vrf_counters_help['example_output'])
+        print_help("vrf_counters")
         return None  # No actual command execution
 
     # Execute the VRF Counters command
@@ -1,3 +1,4 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
 
 
@@ -6,42 +7,9 @@ def vrf_running_config(suppress_output=False, help_requested=False):
        'show running-config all vrf' command. If help_requested=True, it prints the help information instead.
     """
 
-    vrf_running_config_help = {
-        'command': 'show running-config all vrf',
-        'description': (
-            "Displays the full VRF running configuration, including defined VRFs, Route Distinguisher (RD) values, "
-            "associated interfaces, and routing protocol settings per VRF. This command is essential for verifying "
-            "VRF-based network segmentation."
-        ),
-        'example_output': """
-VRF Running Configuration:
-
-vrf definition VRF1
- rd 100:1
- !
- address-family ipv4
-  route-target export 100:1
-  route-target import 100:1
-  exit-address-family
- !
-vrf definition VRF2
- rd 200:1
- !
- address-family ipv4
-  route-target export 200:1
-  route-target import 200:1
-  exit-address-family
-        """
-    }
-
     # If help is requested, print help content and exit the function
     if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {vrf_running_config_help['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{vrf_running_config_help['description']}\n")
-        print("Example Output:")
-        print(vrf_running_config_help['example_output'])
+        print_help("vrf_running_config")
         return None  # No actual command execution
 
     # Execute the VRF Running Configuration command
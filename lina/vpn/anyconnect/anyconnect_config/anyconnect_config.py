@@ -1,43 +1,26 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output, print_section
+from core.running_config import get_running_config_output
+import io
 import re
 
 
-def anyconnect_config(tunnel_group, help_requested=False):
-    """Retrieves and displays AnyConnect configuration details for a given tunnel group.
-       If help_requested=True, it prints the help information instead.
+def anyconnect_config(tunnel_group, suppress_output=False, help_requested=False):
+    """Retrieves and displays AnyConnect configuration details for a given tunnel group, and returns them as text.
+       If suppress_output=True, nothing is printed. If help_requested=True, it prints the help information instead.
     """
 
-    anyconnect_config_help = {
-        'command': 'show running-config all tunnel-group <group>',
-        'description': (
-            "Displays the complete configuration of a specified AnyConnect tunnel group, including associated "
-            "group policies, authentication settings, address pools, and split-tunneling configurations."
-        ),
-        'example_output': """
-tunnel-group AnyConnectGroup general-attributes
- address-pool VPN_POOL
- default-group-policy AC-GroupPolicy
- authentication-server-group LDAP
-tunnel-group AnyConnectGroup webvpn-attributes
- group-alias AC-VPN enable
-        """
-    }
-
     if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {anyconnect_config_help['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{anyconnect_config_help['description']}\n")
-        print("Example Output:")
-        print(anyconnect_config_help['example_output'])
+        print_help("anyconnect_config")
         return None  # No actual execution
 
-    print("\n")
-    print("-" * 80)
-    print(f"*** AnyConnect Configuration for {tunnel_group} ***".center(80))
+    out = io.StringIO()
+    print("\n", file=out)
+    print("-" * 80, file=out)
+    print(f"*** AnyConnect Configuration for {tunnel_group} ***".center(80), file=out)
 
-    tunnel_output = get_and_parse_cli_output(f"show running-config all tunnel-group {tunnel_group}")
-    print_section(f"Tunnel Group Configuration for {tunnel_group}", tunnel_output)
+    tunnel_output = get_running_config_output(f"show running-config all tunnel-group {tunnel_group}")
+    print_section(f"Tunnel Group Configuration for {tunnel_group}", tunnel_output, file=out)
 
     address_pool_match = re.search(r"address-pool (\S+)", tunnel_output)
     group_policy_match = re.search(r"default-group-policy (\S+)", tunnel_output)
@@ -47,17 +30,18 @@ tunnel-group AnyConnectGroup webvpn-attributes
     group_policy = group_policy_match.group(1) if group_policy_match else None
     auth_server = auth_server_match.group(1) if auth_server_match else None
 
+    group_policy_output = ""
     if group_policy:
-        group_policy_output = get_and_parse_cli_output(f"show running-config all group-policy {group_policy}")
-        print_section(f"Group Policy Configuration for {tunnel_group}", group_policy_output)
+        group_policy_output = get_running_config_output(f"show running-config all group-policy {group_policy}")
+        print_section(f"Group Policy Configuration for {tunnel_group}", group_policy_output, file=out)
 
     if auth_server:
         if auth_server.lower() != "local":
-            auth_server_output = get_and_parse_cli_output(f"show running-config aaa-server {auth_server}")
-            print_section(f"AAA Server Configuration ({auth_server})", auth_server_output)
+            auth_server_output = get_running_config_output(f"show running-config aaa-server {auth_server}")
+            print_section(f"AAA Server Configuration ({auth_server})", auth_server_output, file=out)
         else:
-            local_user_output = get_and_parse_cli_output("show running-config username")
-            print_section("Local User Configuration", local_user_output)
+            local_user_output = get_running_config_output("show running-config username")
+            print_section("Local User Configuration", local_user_output, file=out)
 
     split_tunnel_enabled = []
     acl_configs = []
@@ -73,29 +57,35 @@ tunnel-group AnyConnectGroup webvpn-attributes
             split_tunnel_enabled.append(f"- {policy_type.replace('-', ' ').title()} Disabled")
 
     if split_tunnel_enabled:
-        print_section("Split-Tunnel Policy Overview", "\n".join(split_tunnel_enabled))
+        print_section("Split-Tunnel Policy Overview", "\n".join(split_tunnel_enabled), file=out)
 
     for acl_name, acl_output in acl_configs:
-        print_section(f"Split-Tunnel ACL Configuration ({acl_name})", acl_output)
+        print_section(f"Split-Tunnel ACL Configuration ({acl_name})", acl_output, file=out)
 
     vpn_filter_match = re.search(r"vpn-filter value (\S+)", group_policy_output)
     if vpn_filter_match:
         acl_name = vpn_filter_match.group(1)
         acl_output = get_and_parse_cli_output(f"show access-list {acl_name}")
-        print_section(f"VPN-FILTER Configuration (ACL: {acl_name})", acl_output)
+        print_section(f"VPN-FILTER Configuration (ACL: {acl_name})", acl_output, file=out)
     else:
-        print("*** VPN-FILTER *** [DISABLED]")
-        print("-" * 80 + "\n")
+        print("*** VPN-FILTER *** [DISABLED]", file=out)
+        print("-" * 80 + "\n", file=out)
 
     if address_pool:
-        ip_pool_output = get_and_parse_cli_output(f"show running-config ip local pool {address_pool}")
-        print_section(f"IP Local Pool Configuration for {tunnel_group}", ip_pool_output)
+        ip_pool_output = get_running_config_output(f"show running-config ip local pool {address_pool}")
+        print_section(f"IP Local Pool Configuration for {tunnel_group}", ip_pool_output, file=out)
 
-    sysopt_output = get_and_parse_cli_output("show running-config all sysopt | include vpn")
-    print_section("Sysopt Configuration (related to VPN)", sysopt_output)
+    sysopt_output = get_running_config_output("show running-config all sysopt | include vpn")
+    print_section("Sysopt Configuration (related to VPN)", sysopt_output, file=out)
 
-    print("NOTE: This script does not gather NAT configuration. Manual verification is required for NAT-exemption")
-    print("and/or Hairpin NAT statements to ensure they are configured properly.\n")
+    print("NOTE: This script does not gather NAT configuration. Manual verification is required for NAT-exemption",
+          file=out)
+    print("and/or Hairpin NAT statements to ensure they are configured properly.\n", file=out)
+
+    output = out.getvalue()
+    if not suppress_output:
+        print(output, end="")
+    return output
 
 
 def anyconnect_config_dump(suppress_output=False, help_requested=False):
@@ -103,33 +93,8 @@ def anyconnect_config_dump(suppress_output=False, help_requested=False):
        If help_requested=True, it prints the help information instead.
     """
 
-    anyconnect_config_dump_help = {
-        'command': 'show running-config all (tunnel-group, group-policy, webvpn, etc.)',
-        'description': (
-            "Dumps a comprehensive set of configurations related to AnyConnect, including tunnel groups, "
-            "group policies, WebVPN settings, IP pools, sysopt settings, and SSL configurations."
-        ),
-        'example_output': """
-webvpn
- enable outside
- anyconnect enable
- tunnel-group-list enable
-
-group-policy AC-GroupPolicy internal
- group-policy AC-GroupPolicy attributes
-  wins-server none
-  dns-server value 8.8.8.8 8.8.4.4
-  vpn-session-timeout none
-        """
-    }
-
     if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {anyconnect_config_dump_help['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{anyconnect_config_dump_help['description']}\n")
-        print("Example Output:")
-        print(anyconnect_config_dump_help['example_output'])
+        print_help("anyconnect_config_dump")
         return None  # No actual execution
 
     commands = {
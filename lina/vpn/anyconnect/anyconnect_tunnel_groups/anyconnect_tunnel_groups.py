@@ -1,3 +1,4 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output, display_formatted_menu
 from menus.anyconnect_menu import anyconnect_menu
 
@@ -10,36 +11,8 @@ def anyconnect_tunnel_groups(help_requested=False):
     Returns the selected tunnel group name or all tunnel groups if Enter is pressed.
     """
 
-    anyconnect_menu_help_info = {
-            'command': 'AnyConnect (Secure Client) VPN Menu',
-            'description': (
-                "The AnyConnect VPN Menu provides options for managing and troubleshooting "
-                "remote-access VPNs using Cisco AnyConnect (Secure Client). Users can view tunnel "
-                "group configurations, check session details, analyze SSL settings, and debug VPN-related "
-                "issues such as authentication failures and certificate errors."
-            ),
-            'example_output': """
-================================================================================
-================= AnyConnect Menu - Selected Group: test_group =================
-================================================================================
-1) AnyConnect Configuration
-2) VPN Session Database
-3) Crypto CA Data
-4) SSL Data
-5) Crypto Accelerator Data
-6) AnyConnect Help
-0) Exit
-================================================================================
-            """
-
-    }
     if help_requested:
-        print("\n" + "=" * 80)
-        print(f"📖 Help for: {anyconnect_menu_help_info['command']}".center(80))
-        print("=" * 80)
-        print(f"\n{anyconnect_menu_help_info['description']}\n")
-        print("Example Output:")
-        print(anyconnect_menu_help_info['example_output'])
+        print_help("anyconnect_tunnel_groups")
         return None
 
     command = "show running-config tunnel-group | include type remote-access"
@@ -1,15 +1,35 @@
 import os
 from datetime import datetime
-from lina.vpn.anyconnect.anyconnect_config.anyconnect_config import anyconnect_config_dump
-from lina.vpn.anyconnect.vpn_sessiondb_anyconnect.vpn_sessiondb_anyconnect import vpn_sessiondb_anyconnect_dump
+from functools import partial
+from core.deadline import budgeted
+from core.executor import run_collectors
+from core.journal import journaled
+from core.retention import ensure_space
+from lina.vpn.anyconnect.anyconnect_config.anyconnect_config import anyconnect_config, anyconnect_config_dump
+from lina.vpn.anyconnect.vpn_sessiondb_anyconnect.vpn_sessiondb_anyconnect import (
+    vpn_sessiondb_anyconnect,
+    vpn_sessiondb_anyconnect_dump
+)
 from lina.vpn.anyconnect.crypto_ca_data.crypto_ca_data import crypto_ca_data
 from lina.vpn.anyconnect.ssl_data.ssl_data import ssl_data
 from lina.vpn.anyconnect.anyconnect_crypto_accelerator_data.anyconnect_crypto_accelerator_data import anyconnect_crypto_accelerator_data
 
 
-def dump_all_anyconnect_data():
+# Sections of the dump, in the order they are written
+COLLECTORS = [
+    ("AnyConnect Configuration", anyconnect_config_dump),
+    ("VPN Session Database", vpn_sessiondb_anyconnect_dump),
+    ("Crypto CA Data", crypto_ca_data),
+    ("SSL Data", ssl_data),
+    ("Crypto Accelerator Data", anyconnect_crypto_accelerator_data),
+]
+
+
+@journaled
+@budgeted
+def dump_all_anyconnect_data(tunnel_groups=None):
     """Gathers output from all AnyConnect-related commands and writes them to a log file under
-    /var/log/fp_troubleshooting_data."""
+    /var/log/fp_troubleshooting_data. For every tunnel group given, its configuration and sessions are added."""
 
     # Define the directory path
     troubleshooting_dir = "/var/log/fp_troubleshooting_data"
@@ -23,19 +43,21 @@ def dump_all_anyconnect_data():
             print(f"[!] Error creating directory: {e}")
             return
 
+    # Evict old runs under the retention budget, and never write onto a nearly full disk
+    if not ensure_space(troubleshooting_dir):
+        return
+
     # Generate timestamp for the log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(troubleshooting_dir, f"{timestamp}_anyconnect_dump.log")
 
     try:
-        # Gather outputs
-        data_to_dump = [
-            ("AnyConnect Configuration", anyconnect_config_dump(suppress_output=True)),
-            ("VPN Session Database", vpn_sessiondb_anyconnect_dump(suppress_output=True)),
-            ("Crypto CA Data", crypto_ca_data(suppress_output=True)),
-            ("SSL Data", ssl_data(suppress_output=True)),
-            ("Crypto Accelerator Data", anyconnect_crypto_accelerator_data(suppress_output=True))
-        ]
+        # Gather outputs concurrently; results come back in the order listed
+        collectors = list(COLLECTORS)
+        for group in tunnel_groups or []:
+            collectors.append((f"AnyConnect Configuration for {group}", partial(anyconnect_config, group)))
+            collectors.append((f"VPN Session Database for {group}", partial(vpn_sessiondb_anyconnect, group)))
+        data_to_dump = run_collectors(collectors)
 
         # Write all outputs to the log file
         with open(log_file, "w") as f:
@@ -1,68 +1,192 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
+import re
 
+IPSEC_SA_DETAIL_COMMAND = "show crypto ipsec sa detail"
 
-def crypto_ipsec_sa_detail(selected_peers, help_requested=False):
-    """Retrieves and displays detailed IPSec Security Association (SA) information for selected peers.
-       If help_requested=True, it prints the help information instead.
+# '#<counter>: <value>' pairs of the counter lines, and the byte counters some releases print per SA
+_COUNTER_PATTERN = re.compile(r"#([^:,#]+?):\s*(\d+)")
+_BYTES_PATTERN = re.compile(r"bytes (encrypt|decrypt)ed\s*:\s*(\d+)")
+_LIFETIME_PATTERN = re.compile(r"remaining key lifetime \(kB/sec\):\s*\((\d+)/(\d+)\)")
+
+# Detail counters of packets dropped on the way out ('(send)') or in ('(rcv)') besides these
+_DROP_COUNTERS = ("pkts verify failed",)
+
+
+def _peer_address(line):
+    """Returns the peer of a 'current_peer: <ip>[:<port>]' line."""
+    address = line.split(":", 1)[1].strip().split()[0]
+    # IPv4 peers can be printed with the NAT-T port; IPv6 addresses contain several colons
+    return address.rsplit(":", 1)[0] if address.count(":") == 1 else address
+
+
+def partition_ipsec_sa_by_peer(output):
     """
+    Splits 'show crypto ipsec sa detail' output into {peer IP: text of that peer's SAs} in one pass.
+    Every 'Crypto map tag:' block goes to the peer named by its 'current_peer:' line, preceded by the
+    'interface:' line it was listed under.
+    """
+    peers = {}
+    peer_interfaces = {}
+    interface_line = None
+    block = []
+    block_peer = None
+
+    def close_block():
+        if block and block_peer is not None:
+            lines = peers.setdefault(block_peer, [])
+            if interface_line and peer_interfaces.get(block_peer) != interface_line:
+                peer_interfaces[block_peer] = interface_line
+                lines.append(interface_line)
+            lines.extend(block)
 
-    crypto_ipsec_sa_detail_help = {
-        'command': 'show crypto ipsec sa peer <IP> detail',
-        'description': (
-            "Displays detailed information about the IPSec Security Associations (SAs) for a specified peer. "
-            "This includes encryption/authentication algorithms, tunnel mode, lifetimes, inbound and outbound SPI values, "
-            "packets encrypted/decrypted, and error statistics. This command is crucial for debugging IPSec tunnel connectivity issues."
-        ),
-        'example_output': """
-peer: 192.168.1.2 port 500
-    Crypto map tag: outside_map, seq num: 10, local addr: 172.16.1.1
-  access-list inside_outside_acl permit ip 10.1.1.0 255.255.255.0 10.2.2.0 255.255.255.0
-    local ident (addr/mask/prot/port): (10.1.1.0/255.255.255.0/0/0)
-    remote ident (addr/mask/prot/port): (10.2.2.0/255.255.255.0/0/0)
-    current_peer: 192.168.1.2
-    inbound ESP SAs: 
-      SPI: 0xAABBCCDD (27398)
-         transform: esp-aes-256 esp-sha-hmac 
-         in use settings: Tunnel, UDP Encapsulation
-         lifetime: 28800 seconds, 4608000 kilobytes
-         bytes decrypted: 1234567
-         packets decrypted: 12345, dropped: 0
-    outbound ESP SAs: 
-      SPI: 0x11223344 (9823)
-         transform: esp-aes-256 esp-sha-hmac 
-         in use settings: Tunnel, UDP Encapsulation
-         lifetime: 28800 seconds, 4608000 kilobytes
-         bytes encrypted: 2345678
-         packets encrypted: 23456, dropped: 0
-        """
+    for line in output.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("interface:"):
+            close_block()
+            interface_line, block, block_peer = stripped, [], None
+        elif stripped.startswith("Crypto map tag:"):
+            close_block()
+            block, block_peer = [line], None
+        elif block:
+            block.append(line)
+            if stripped.startswith("current_peer:") and block_peer is None:
+                block_peer = _peer_address(stripped)
+    close_block()
+
+    return {peer: "\n".join(lines).rstrip("\n") for peer, lines in peers.items()}
+
+
+def _new_record(interface, line):
+    tag, _, seq = line.split(":", 1)[1].partition(", seq num:")
+    return {
+        "peer": None, "interface": interface, "crypto_map": tag.strip(), "seq": seq.split(",")[0].strip(),
+        "local_ident": None, "remote_ident": None, "spi": None, "inbound_spi": None, "transform": None,
+        "pkts_encrypt": 0, "pkts_decrypt": 0, "bytes_encrypt": None, "bytes_decrypt": None,
+        "drops": 0, "drop_counters": {}, "inbound_kb_left": None, "outbound_kb_left": None, "seconds_left": None,
     }
 
+
+def _finish_record(record, counters):
+    record["pkts_encrypt"] = counters.get("pkts encrypt", 0)
+    record["pkts_decrypt"] = counters.get("pkts decrypt", 0)
+    drop_counters = {name: value for name, value in counters.items()
+                     if value and (name.endswith(("(send)", "(rcv)")) or name in _DROP_COUNTERS)}
+    record["drop_counters"] = drop_counters
+    # '#send errors' and '#recv errors' already total the detail counters where both are printed
+    if "send errors" in counters or "recv errors" in counters:
+        record["drops"] = counters.get("send errors", 0) + counters.get("recv errors", 0)
+    else:
+        record["drops"] = sum(drop_counters.values())
+    return record
+
+
+def parse_ipsec_sa_records(output):
+    """
+    Parses 'show crypto ipsec sa detail' output into one compact record per SA (crypto map entry and proxy pair):
+    peer, interface, crypto map and sequence, outbound 'spi' and 'inbound_spi', transform, packets encrypted and
+    decrypted, bytes encrypted and decrypted (None where LINA does not print them), total 'drops' with the non-zero
+    'drop_counters' behind them, and the kB left in the inbound and outbound SA lifetimes and the seconds left in
+    the shorter one.
+    """
+    records = []
+    interface = record = direction = None
+    counters = {}
+
+    for line in output.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith("interface:"):
+            interface = stripped.split(":", 1)[1].strip()
+        elif stripped.startswith("Crypto map tag:"):
+            if record is not None:
+                records.append(_finish_record(record, counters))
+            record, direction, counters = _new_record(interface, stripped), None, {}
+        elif record is None:
+            continue
+        elif stripped.startswith("#"):
+            counters.update((name.strip(), int(value)) for name, value in _COUNTER_PATTERN.findall(stripped))
+        elif stripped.startswith("current_peer:"):
+            record["peer"] = record["peer"] or _peer_address(stripped)
+        elif stripped.startswith("local ident"):
+            record["local_ident"] = stripped.rsplit(":", 1)[1].strip()
+        elif stripped.startswith("remote ident"):
+            record["remote_ident"] = stripped.rsplit(":", 1)[1].strip()
+        elif stripped.startswith("current outbound spi:"):
+            record["spi"] = stripped.split(":", 1)[1].strip()
+        elif stripped.startswith("current inbound spi"):
+            record["inbound_spi"] = stripped.split(":", 1)[1].strip()
+        elif stripped.endswith("esp sas:") or stripped.endswith("ah sas:"):
+            direction = stripped.split()[0]
+        elif stripped.startswith("transform:"):
+            record["transform"] = record["transform"] or stripped.split(":", 1)[1].replace("no compression", "").strip()
+        elif "remaining key lifetime" in stripped:
+            match = _LIFETIME_PATTERN.search(stripped)
+            if match and direction in ("inbound", "outbound"):
+                record[f"{direction}_kb_left"] = int(match.group(1))
+                seconds = int(match.group(2))
+                if record["seconds_left"] is None or seconds < record["seconds_left"]:
+                    record["seconds_left"] = seconds
+        else:
+            match = _BYTES_PATTERN.search(stripped)
+            if match:
+                record[f"bytes_{match.group(1)}"] = int(match.group(2))
+
+    if record is not None:
+        records.append(_finish_record(record, counters))
+    # Crypto map entries without an SA (no 'current_peer') are not SAs
+    return [record for record in records if record["peer"]]
+
+
+def fetch_ipsec_sa_records():
+    """Runs 'show crypto ipsec sa detail' once and returns its per-SA records."""
+    return parse_ipsec_sa_records(get_and_parse_cli_output(IPSEC_SA_DETAIL_COMMAND))
+
+
+def fetch_ipsec_sa_by_peer():
+    """Runs 'show crypto ipsec sa detail' once and returns its SAs partitioned by peer IP."""
+    return partition_ipsec_sa_by_peer(get_and_parse_cli_output(IPSEC_SA_DETAIL_COMMAND))
+
+
+def crypto_ipsec_sa_detail(selected_peers, suppress_output=False, help_requested=False, sa_by_peer=None):
+    """Retrieves and displays detailed IPSec Security Association (SA) information for selected peers, and returns
+       the output of every peer as one text. If suppress_output=True, nothing is printed.
+       If help_requested=True, it prints the help information instead.
+
+       All peers are answered from a single 'show crypto ipsec sa detail'; pass sa_by_peer (from
+       fetch_ipsec_sa_by_peer) to share one fetch between several calls.
+    """
+
     # If help is requested, display help content instead of executing the command
     if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {crypto_ipsec_sa_detail_help['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{crypto_ipsec_sa_detail_help['description']}\n")
-        print("Example Output:")
-        print(crypto_ipsec_sa_detail_help['example_output'])
+        print_help("crypto_ipsec_sa_detail")
         return None  # No actual command execution
 
-    # Execute the Crypto IPSec SA Detail command for each selected peer
     try:
+        if sa_by_peer is None:
+            sa_by_peer = fetch_ipsec_sa_by_peer()
+
+        outputs = []
         for peer in selected_peers:
             ip_address = peer[0]  # Extract the IP address from the peer tuple
-            command = f"show crypto ipsec sa peer {ip_address} detail"
-            output = get_and_parse_cli_output(command)
+            output = sa_by_peer.get(ip_address, f"There are no ipsec sas for peer {ip_address}")
 
-            print(f"\nCrypto IPSec SA Detail Output for {ip_address}:".center(80))
-            print(f"Command: {command}".center(80))
-            print("-" * 80)
-            print(output)
-            print("-" * 80)
+            text = "\n".join([
+                f"\nCrypto IPSec SA Detail Output for {ip_address}:".center(80),
+                f"Command: {IPSEC_SA_DETAIL_COMMAND} (peer {ip_address})".center(80),
+                "-" * 80,
+                output,
+                "-" * 80,
+            ]) + "\n"
+            if not suppress_output:
+                print(text, end="")
+            outputs.append(text)
 
-        return output
+        return "".join(outputs)
 
     except Exception as e:
         error_message = f"[!] Error: {e}"
-        print(error_message)
+        if not suppress_output:
+            print(error_message)
         return error_message
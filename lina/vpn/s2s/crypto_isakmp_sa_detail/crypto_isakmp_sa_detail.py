@@ -1,4 +1,104 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
+import re
+
+ISAKMP_SA_DETAIL_COMMAND = "show crypto isakmp sa detail"
+IKEV2_SA_COMMAND = "show crypto ikev2 sa"
+
+# States of an established IKE SA; every other state is still negotiating (or being torn down)
+IKEV1_UP_STATES = ("MM_ACTIVE", "AM_ACTIVE")
+IKEV2_UP_STATES = ("READY",)
+
+_IKEV1_PEER = re.compile(r"^\d+\s+IKE Peer:\s*(\S+)")
+_IKEV1_FIELD = re.compile(r"\b(Type|Role|State)\s*:\s*(\S+)")
+_IKEV2_SESSION = re.compile(r"Session-id:\s*\d+,\s*Status:\s*([^,\s]+).*?CHILD count:\s*(\d+)")
+# '<tunnel-id> <local>/<port> <remote>/<port> [<fvrf>/<ivrf>] <status> <role>'; ASA and FTD print no VRF column
+_IKEV2_TUNNEL = re.compile(r"^(\d+)\s+\S+/\d+\s+(\S+)/\d+\s+(?:\S+/\S+\s+)?(\S+)\s+(\S+)")
+# Any other line starting with a tunnel ID is an SA row the pattern above could not read
+_IKEV2_ROW = re.compile(r"^\d+\s")
+
+
+def _peer_address(address):
+    # IPv4 peers can be printed with the port; IPv6 addresses contain several colons
+    return address.rsplit(":", 1)[0] if address.count(":") == 1 else address
+
+
+def _ike_sa(peer, ike_version, state, role, up_states):
+    return {"peer": peer, "ike": ike_version, "state": state, "role": role, "up": state in up_states,
+            "session_status": None, "child_sas": None}
+
+
+def parse_ike_sas(output, section="ikev1", unparsed=None):
+    """
+    Parses 'show crypto isakmp sa detail' or 'show crypto ikev2 sa' output into one record per IKE SA: peer, IKE
+    version, state, role, whether the SA is established ('up') and, for IKEv2, the session status and the number
+    of child SAs. Lines before an 'IKEv1 SAs:' / 'IKEv2 SAs:' header belong to section.
+    If a list is given as unparsed, the SA rows that could not be read are appended to it.
+
+    For example, the ASA / FTD IKEv2 row '1660475165  10.10.10.1/500  10.20.20.1/500  READY  INITIATOR' (no VRF
+    column) under 'Session-id:1, Status:UP-ACTIVE, IKE count:1, CHILD count:1' gives peer '10.20.20.1', state
+    'READY', role 'initiator', up, and 1 child SA.
+    """
+    if unparsed is None:
+        unparsed = []
+    sas = []
+    sa = session = session_line = None
+    session_rows = 0
+
+    def close_session():
+        # A session whose tunnel row was not read (nor reported as unreadable) is unparsed as a whole
+        if session_line is not None and not session_rows:
+            unparsed.append(session_line)
+
+    for line in output.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith("IKEv1 SAs"):
+            section, sa = "ikev1", None
+            continue
+        if stripped.startswith("IKEv2 SAs"):
+            section, sa = "ikev2", None
+            continue
+
+        if section == "ikev1":
+            match = _IKEV1_PEER.match(stripped)
+            if match:
+                sa = _ike_sa(_peer_address(match.group(1)), "ikev1", None, None, IKEV1_UP_STATES)
+                sas.append(sa)
+            elif "IKE Peer" in stripped:
+                sa = None
+                unparsed.append(stripped)
+            elif sa is not None:
+                for name, value in _IKEV1_FIELD.findall(stripped):
+                    if name == "State":
+                        sa["state"], sa["up"] = value, value in IKEV1_UP_STATES
+                    elif name == "Role":
+                        sa["role"] = value
+            continue
+
+        if stripped.startswith("Session-id:"):
+            close_session()
+            match = _IKEV2_SESSION.search(stripped)
+            session = (match.group(1), int(match.group(2))) if match else None
+            session_line, session_rows, sa = stripped, 0, None
+            continue
+        match = _IKEV2_TUNNEL.match(stripped)
+        if match:
+            sa = _ike_sa(match.group(2), "ikev2", match.group(3), match.group(4).lower(), IKEV2_UP_STATES)
+            if session is not None:
+                sa["session_status"], sa["child_sas"] = session
+            sas.append(sa)
+            session_rows += 1
+        elif _IKEV2_ROW.match(stripped):
+            sa = None
+            session_rows += 1
+            unparsed.append(stripped)
+        elif stripped.startswith("Child sa:") and sa is not None and session is None:
+            # Without a session line, count the child SAs listed under the tunnel
+            sa["child_sas"] = (sa["child_sas"] or 0) + 1
+    close_session()
+    return sas
 
 
 def crypto_isakmp_sa_detail(suppress_output=False, help_requested=False):
@@ -6,38 +106,13 @@ def crypto_isakmp_sa_detail(suppress_output=False, help_requested=False):
        If help_requested=True, it prints the help information instead.
     """
 
-    crypto_isakmp_sa_detail_help = {
-        'command': 'show crypto isakmp sa detail',
-        'description': (
-            "Displays detailed information about IKEv1 (ISAKMP) and IKEv2 security associations (SAs), "
-            "including peer IP addresses, current state, encryption methods, hashing algorithms, "
-            "authentication methods, and lifetime details. This command is essential for troubleshooting "
-            "IKE phase 1 negotiations and ensuring that ISAKMP SAs are established correctly."
-        ),
-        'example_output': """
-IPv4 Crypto ISAKMP SA
-dst             src             state          conn-id status
-192.168.1.1     192.168.1.2     QM_IDLE        1001    ACTIVE
-  Encr: AES-CBC, Hash: SHA, Auth: preshared, Lifetime: 86400 sec
-  Lifetime Remaining: 43200 sec
-  NAT-T: Not Detected, DPd: N/A
-        """
-    }
-
     # If help is requested, display help content instead of executing the command
     if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {crypto_isakmp_sa_detail_help['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{crypto_isakmp_sa_detail_help['description']}\n")
-        print("Example Output:")
-        print(crypto_isakmp_sa_detail_help['example_output'])
+        print_help("crypto_isakmp_sa_detail")
         return None
 
-    command = "show crypto isakmp sa detail"
-
     try:
-        output = get_and_parse_cli_output(command)
+        output = get_and_parse_cli_output(ISAKMP_SA_DETAIL_COMMAND)
 
         if not suppress_output:
             print("\n" + "=" * 80)
@@ -1,165 +1,176 @@
 import os
-import re
 import io
-import tarfile
-from contextlib import redirect_stdout
+import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from core.utils import get_and_parse_cli_output, ip_sort_key
-from lina.vpn.s2s.s2s_config.s2s_config import (
-    s2s_ikev1_vti_config,
-    s2s_ikev1_policy_based_config,
-    s2s_ikev2_vti_config,
-    s2s_ikev2_policy_based_config
-)
+from core.archive import open_archive
+from core.cli_cache import shared_responses
+from core.cli_stream import StreamedCliOutput
+from core.deadline import budgeted, cancel_commands
+from core.executor import MAX_PARALLEL_COMMANDS
+from core.journal import current_journal, journaled
+from core.retention import ensure_space
+from lina.vpn.s2s.s2s_config.s2s_config import s2s_config, s2s_peer_configs
+from lina.vpn.s2s.s2s_peer_index.s2s_peer_index import S2SPeerIndex
 from lina.vpn.s2s.s2s_crypto_accelerator_data.s2s_crypto_accelerator_data import s2s_crypto_accelerator_data
 from lina.vpn.s2s.crypto_isakmp_sa_detail.crypto_isakmp_sa_detail import crypto_isakmp_sa_detail
-from lina.vpn.s2s.crypto_ipsec_sa_detail.crypto_ipsec_sa_detail import crypto_ipsec_sa_detail
+from lina.vpn.s2s.crypto_ipsec_sa_detail.crypto_ipsec_sa_detail import crypto_ipsec_sa_detail, fetch_ipsec_sa_by_peer
+from lina.vpn.s2s.ike_sa_health.ike_sa_health import ike_sa_health
 
+# Sections the consolidated Show Tech archive holds for Site-to-Site VPN (this dump writes one file per peer instead)
+COLLECTORS = [
+    ("Site-to-Site Peer Configuration", s2s_peer_configs),
+    ("IKE SA Health Summary", ike_sa_health),
+    ("Crypto ISAKMP SA Detail", crypto_isakmp_sa_detail),
+    ("Crypto IPSec SA Detail", StreamedCliOutput("show crypto ipsec sa detail")),
+]
 
-def dump_s2s_tunnel_groups():
+
+@journaled
+@budgeted
+def dump_s2s_tunnel_groups(peers=None):
     """
     Gathers all IPSec S2S tunnels, identifies IKE version, and categorizes as Policy-Based or VTI.
-    Stores all tunnel groups in memory without user interaction.
+    Stores all tunnel groups in memory without user interaction. If peers is given, only those peer IPs are dumped.
     """
-    command = "show running-config tunnel-group | include type ipsec-l2l"
-    cli_output = get_and_parse_cli_output(command)
-
-    # Store categories
-    ikev1_policy_based = []
-    ikev1_vti = []
-    ikev2_policy_based = []
-    ikev2_vti = []
-
-    # Gather unique IPs
-    tunnel_groups = sorted(set([line.split()[1] for line in cli_output.splitlines() if line.startswith("tunnel-group")]), key=ip_sort_key)
-
-    # Process each IP
-    for ip in tunnel_groups:
-        tunnel_output = get_and_parse_cli_output(f"show running-config tunnel-group {ip}")
-
-        # Determine IKE version
-        ikev1 = bool(re.search(r"ikev1 pre-shared-key", tunnel_output))
-        ikev2 = bool(re.search(r"ikev2 (remote|local)-authentication pre-shared-key", tunnel_output))
-
-        # Check for Virtual Tunnel Interface
-        vti_output = get_and_parse_cli_output("show running-config interface | begin Tunnel")
-        vti_match = re.search(rf"tunnel destination {re.escape(ip)}", vti_output)
-
-        # Check for Policy-Based VPN
-        policy_output = get_and_parse_cli_output("show running-config crypto map")
-        policy_match = re.search(rf"set peer {re.escape(ip)}", policy_output)
-
-        # Categorize and append tuples with (IP, IKE version, VPN type)
-        if ikev1:
-            if vti_match:
-                ikev1_vti.append((ip, 'ikev1', 'vti'))
-            if policy_match:
-                ikev1_policy_based.append((ip, 'ikev1', 'policy'))
-
-        if ikev2:
-            if vti_match:
-                ikev2_vti.append((ip, 'ikev2', 'vti'))
-            if policy_match:
-                ikev2_policy_based.append((ip, 'ikev2', 'policy'))
-
-    # Store all tunnel groups in memory
-    selected_peers = ikev1_policy_based + ikev1_vti + ikev2_policy_based + ikev2_vti
-
-    # Proceed with data dump for all selected peers
-    dump_s2s_menu(selected_peers)
-
-    # Compress and clean up files
-    compress_and_cleanup()
-
-
-def dump_s2s_menu(selected_peers):
+    # One read of the tunnel-group, interface and crypto map configuration classifies every peer
+    index = S2SPeerIndex.fetch()
+    if peers:
+        for ip in sorted(set(peers) - set(index.peers)):
+            print(f"[!] No site-to-site tunnel group for peer {ip}")
+    selected_peers = index.selected_peers(peers or None)
+
+    # Proceed with data dump for all selected peers, streaming every peer's file straight into the archive
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    troubleshooting_dir = "/var/log/fp_troubleshooting_data"
+    try:
+        os.makedirs(troubleshooting_dir, exist_ok=True)
+        # Evict old runs under the retention budget, and never write onto a nearly full disk
+        if not ensure_space(troubleshooting_dir):
+            return
+        with open_archive(os.path.join(troubleshooting_dir, f"{timestamp}_s2s_data")) as archive:
+            dump_s2s_menu(selected_peers, archive, index)
+        print(f"Data has been successfully compressed and saved to {archive.path}")
+    except Exception as e:
+        print(f"[!] Error writing S2S archive: {e}")
+
+
+def dump_s2s_menu(selected_peers, archive, peer_index=None):
     """
     Processes Site-to-Site VPN-related tasks for all selected peers without user interaction.
-    Gathers and stores the data in memory.
+    Peers are collected concurrently and each peer's data is written to the archive, in order, as soon as it has
+    been gathered.
+
+    Device-wide sections (ISAKMP SAs, crypto accelerator) are collected once and copied into every peer's dump,
+    the IPSec SAs of every peer come from a single 'show crypto ipsec sa detail', and any other command several
+    peers need (sysopt, shared ACLs, ...) is sent to LINA only once.
+
+    Every completed peer is checkpointed in the dump's journal, so a resumed run only collects the peers that
+    an interrupted run did not get to.
     """
-    for peer in selected_peers:
-        ip_address, ike_version, vpn_type = peer
-        peer_data = {}
-
-        # Capture output for configuration (suppressing console output)
-        buffer = io.StringIO()
-        with redirect_stdout(buffer):
-            if ike_version == 'ikev1' and vpn_type == 'vti':
-                s2s_ikev1_vti_config(ip_address)
-            elif ike_version == 'ikev1' and vpn_type == 'policy':
-                s2s_ikev1_policy_based_config(ip_address)
-            elif ike_version == 'ikev2' and vpn_type == 'vti':
-                s2s_ikev2_vti_config(ip_address)
-            elif ike_version == 'ikev2' and vpn_type == 'policy':
-                s2s_ikev2_policy_based_config(ip_address)
-
-        peer_data['configuration'] = buffer.getvalue()
-
-        # Suppress output for IPSec SA Detail
-        buffer_ipsec = io.StringIO()
-        with redirect_stdout(buffer_ipsec):
-            crypto_ipsec_sa_detail([peer])
-        peer_data['ipsec_sa_detail'] = buffer_ipsec.getvalue()
-
-        # Suppress output for ISAKMP SA Detail
-        buffer_isakmp = io.StringIO()
-        with redirect_stdout(buffer_isakmp):
-            crypto_isakmp_sa_detail()
-        peer_data['isakmp_sa_detail'] = buffer_isakmp.getvalue()
-
-        # Suppress output for Crypto Accelerator Data
-        buffer_crypto = io.StringIO()
-        with redirect_stdout(buffer_crypto):
-            s2s_crypto_accelerator_data()
-        peer_data['crypto_accelerator_data'] = buffer_crypto.getvalue()
-
-        # Save data for the peer
-        save_peer_data(ip_address, peer_data)
-
-
-def save_output_to_file(ip_address, data):
+    journal = current_journal()
+    with shared_responses() as stats:
+        pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_COMMANDS, thread_name_prefix="fpth-s2s")
+        try:
+            stored_global_data = journal.get("s2s:global") if journal is not None else None
+            if stored_global_data is not None:
+                global_data = json.loads(stored_global_data)
+            else:
+                global_data = collect_global_data()
+                if journal is not None:
+                    journal.record("s2s:global", json.dumps(global_data))
+
+            pending_peers = []
+            for peer in selected_peers:
+                stored_peer_data = journal.get(peer_key(peer)) if journal is not None else None
+                if stored_peer_data is not None:
+                    archive.add_text(peer_member_name(peer[0]), stored_peer_data)
+                else:
+                    pending_peers.append(peer)
+
+            # One 'show crypto ipsec sa detail', split by peer, answers the IPSec SA section of every peer
+            sa_by_peer = None
+            if pending_peers:
+                try:
+                    sa_by_peer = fetch_ipsec_sa_by_peer()
+                except Exception as e:
+                    print(f"[!] Error collecting the IPSec SAs: {e}")
+            pending = [(peer, pool.submit(collect_peer_data, peer, peer_index, sa_by_peer)) for peer in pending_peers]
+
+            for peer, future in pending:
+                try:
+                    peer_data = future.result()
+                except Exception as e:
+                    # Not checkpointed, so a resumed run collects the peer again
+                    print(f"[!] Error collecting peer {peer[0]}: {e}")
+                    continue
+                peer_data.update(global_data)
+                content = save_peer_data(peer[0], peer_data, archive)
+                if journal is not None:
+                    journal.record(peer_key(peer), content)
+        except KeyboardInterrupt:
+            # Keep the peers already saved; the archive is still built from them
+            print("\n[!] Interrupted: cancelling running commands and keeping the peers that completed...")
+            cancel_commands()
+            if journal is not None:
+                journal.mark_incomplete()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        if journal is not None:
+            journal.check_interrupted()
+
+    print(f"[+] {stats['commands']} CLI commands run for {len(selected_peers)} peers "
+          f"({stats['shared']} repeated requests answered from a single execution)")
+
+
+def peer_key(peer):
+    """Returns the journal key of a peer."""
+    return "s2s:peer:" + ":".join(peer)
+
+
+def collect_global_data():
     """
-    Saves specific data type output directly to a file for a given peer.
+    Gathers the sections that are the same for every peer (ISAKMP SA detail and crypto accelerator data).
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_path = f"/var/log/fp_troubleshooting_data/{ip_address}_{timestamp}_s2s_dump.txt"
-    with open(file_path, 'a') as f:
-        if isinstance(data, dict):
-            for key, value in data.items():
-                f.write(f"{key}: {value}\n")
-        else:
-            f.write(data if isinstance(data, str) else str(data))
-        f.write("\n\n")
+    return {
+        "isakmp_sa_detail": crypto_isakmp_sa_detail(suppress_output=True),
+        "crypto_accelerator_data": s2s_crypto_accelerator_data(suppress_output=True),
+    }
 
 
-def save_peer_data(ip_address, data):
+def collect_peer_data(peer, peer_index=None, sa_by_peer=None):
     """
-    Saves collected peer data into a single file.
+    Gathers the configuration and IPSec SA details for a single peer and returns them as a dict of sections.
+    The peer's VTI interfaces are taken from peer_index, and its SAs from sa_by_peer, when given.
     """
+    ip_address, ike_version, vpn_type = peer
+    vti_interfaces = peer_index.vti_interfaces.get(ip_address, []) if peer_index is not None else None
+    return {
+        "configuration": s2s_config(ip_address, ike_version, vpn_type, suppress_output=True,
+                                    vti_interfaces=vti_interfaces),
+        "ipsec_sa_detail": crypto_ipsec_sa_detail([peer], suppress_output=True, sa_by_peer=sa_by_peer),
+    }
+
+
+def peer_member_name(ip_address):
+    """Returns the archive member name of a peer's dump file."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_path = f"/var/log/fp_troubleshooting_data/{ip_address}_{timestamp}_s2s_dump.txt"
-    with open(file_path, 'w') as f:
-        for key, value in data.items():
-            if isinstance(value, dict):
-                for sub_key, sub_value in value.items():
-                    f.write(f"{sub_key}: {sub_value}\n")
-            else:
-                f.write(value if isinstance(value, str) else str(value))
-            f.write("\n\n")
+    return f"{ip_address}_{timestamp}_s2s_dump.txt"
 
 
-def compress_and_cleanup():
+def save_peer_data(ip_address, data, archive):
     """
-    Compresses all S2S dump files into a single archive and removes the original files.
+    Saves collected peer data into a single archive member and returns the saved content.
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    base_dir = "/var/log/fp_troubleshooting_data/"
-    archive_name = f"{base_dir}{timestamp}_s2s_data.tar.gz"
-
-    with tarfile.open(archive_name, "w:gz") as tar:
-        for file in os.listdir(base_dir):
-            if file.endswith("_s2s_dump.txt"):
-                tar.add(os.path.join(base_dir, file), arcname=file)
-                os.remove(os.path.join(base_dir, file))
+    buffer = io.StringIO()
+    for key, value in data.items():
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                buffer.write(f"{sub_key}: {sub_value}\n")
+        else:
+            buffer.write(value if isinstance(value, str) else str(value))
+        buffer.write("\n\n")
 
-    print(f"Data has been successfully compressed and saved to {archive_name}")
+    content = buffer.getvalue()
+    archive.add_text(peer_member_name(ip_address), content)
+    return content
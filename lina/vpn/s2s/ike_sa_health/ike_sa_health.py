@@ -0,0 +1,199 @@
+# Description: This file implements the IKE SA health summary for Site-to-Site VPN headends. It reads the IKE SAs
+# from 'show crypto isakmp sa detail' and 'show crypto ikev2 sa', the child SAs from the 'current_peer' lines of
+# 'show crypto ipsec sa', and joins them by peer with the L2L tunnel groups of the S2S peer index. Every configured
+# peer is then reported as down (no IKE SA), stuck in negotiation, up without child SAs, or up. Where the IKE output
+# holds SA rows the parser could not read, peers without a parsed SA are reported as unknown rather than down.
+#
+# The commands and the configuration are fetched concurrently, and the outputs are parsed in one pass each into
+# tables keyed by peer, so the join is one dictionary lookup per peer and thousands of peers take milliseconds.
+
+import io
+from functools import partial
+from core.executor import run_commands
+from core.help_catalogue import print_help
+from core.utils import get_and_parse_cli_output, ip_sort_key
+from lina.vpn.s2s.crypto_isakmp_sa_detail.crypto_isakmp_sa_detail import (
+    IKEV2_SA_COMMAND, ISAKMP_SA_DETAIL_COMMAND, parse_ike_sas,
+)
+from lina.vpn.s2s.s2s_config.s2s_config import IKE_LABELS
+from lina.vpn.s2s.s2s_peer_index.s2s_peer_index import S2SPeerIndex
+
+IPSEC_PEERS_COMMAND = "show crypto ipsec sa | include current_peer"
+
+# (category, title), in the order they are reported
+HEALTH_CATEGORIES = (
+    ("down", "Configured but Down (no IKE SA)"),
+    ("unparsed", "Unknown (IKE SA Rows Not Parsed)"),
+    ("negotiating", "Stuck in Negotiation"),
+    ("no_child_sa", "IKE Up without Child SAs"),
+    ("up", "Up with Child SAs"),
+    ("unconfigured", "IKE SAs without an L2L Tunnel Group"),
+)
+
+# Categories listed peer by peer; healthy peers are only counted
+LISTED_CATEGORIES = ("down", "unparsed", "negotiating", "no_child_sa", "unconfigured")
+
+# Categories of configured peers
+CONFIGURED_CATEGORIES = ("down", "unparsed", "negotiating", "no_child_sa", "up")
+
+
+def _sort_key(ip):
+    # IPv4 peers in numeric order, then anything else (IPv6, names) as text
+    try:
+        return 0, ip_sort_key(ip), ""
+    except ValueError:
+        return 1, (), ip
+
+
+def ike_sa_table(sas):
+    """
+    Indexes parse_ike_sas() records into {peer: {IKE version: record}}. Where a peer has several SAs of one version
+    (during a rekey, or listed by both commands), an established SA wins, then the one with more child SAs.
+    """
+    table = {}
+    for sa in sas:
+        entry = table.setdefault(sa["peer"], {})
+        current = entry.get(sa["ike"])
+        if current is None or (sa["up"], sa["child_sas"] or 0) > (current["up"], current["child_sas"] or 0):
+            entry[sa["ike"]] = sa
+    return table
+
+
+def ipsec_peer_counts(output):
+    """Counts the IPSec SAs (crypto map entries with an SA) of every peer in 'current_peer:' lines."""
+    counts = {}
+    for line in output.splitlines():
+        _, separator, address = line.partition("current_peer:")
+        if separator and address.strip():
+            address = address.split()[0]
+            peer = address.rsplit(":", 1)[0] if address.count(":") == 1 else address
+            counts[peer] = counts.get(peer, 0) + 1
+    return counts
+
+
+def _row_addresses(rows):
+    """Returns the addresses ('a.b.c.d', with any '/port' or ':port' dropped) found in unparsed SA rows."""
+    addresses = set()
+    for row in rows:
+        for token in row.replace(",", " ").split():
+            address = token.split("/", 1)[0]
+            addresses.add(address.rsplit(":", 1)[0] if address.count(":") == 1 else address)
+    return addresses
+
+
+def classify_ike_health(peer_index, sa_table, ipsec_counts, peers=None, unparsed=()):
+    """
+    Returns {category: [row, ...]} for HEALTH_CATEGORIES, each row a dict of peer, IKE versions, state and child
+    SAs, sorted by peer. If peers is given, only those peers are classified and no 'unconfigured' SAs are listed.
+
+    unparsed holds the SA rows parse_ike_sas() could not read. A peer without a parsed SA that such a row names is
+    reported as 'unparsed' instead of 'down', and so is every peer without a parsed SA if a row names no peer.
+    """
+    health = {category: [] for category, _ in HEALTH_CATEGORIES}
+    configured = peer_index.peers if peers is None else {ip: peer_index.peers[ip] for ip in peers
+                                                         if ip in peer_index.peers}
+
+    unparsed_addresses = _row_addresses(unparsed)
+    # A row naming no configured peer could belong to any of them
+    unattributed = any(not (_row_addresses([row]) & configured.keys()) for row in unparsed)
+
+    for ip, peer in configured.items():
+        sas = list(sa_table.get(ip, {}).values())
+        if not sas:
+            ike = "/".join(IKE_LABELS[version] for version in ("ikev1", "ikev2") if peer[version]) or "-"
+            category = "unparsed" if unattributed or ip in unparsed_addresses else "down"
+            health[category].append({"peer": ip, "ike": ike, "state": "-" if category == "down" else "?",
+                                     "child_sas": ipsec_counts.get(ip, 0)})
+            continue
+
+        established = [sa for sa in sas if sa["up"]]
+        row = {"peer": ip, "ike": "/".join(IKE_LABELS[sa["ike"]] for sa in (established or sas)),
+               "state": "/".join(sa["state"] or "-" for sa in (established or sas))}
+        if established:
+            row["child_sas"] = max([sa["child_sas"] or 0 for sa in established] + [ipsec_counts.get(ip, 0)])
+            health["up" if row["child_sas"] else "no_child_sa"].append(row)
+        else:
+            row["child_sas"] = ipsec_counts.get(ip, 0)
+            health["negotiating"].append(row)
+
+    if peers is None:
+        for ip in sa_table.keys() - configured.keys():
+            sas = list(sa_table[ip].values())
+            health["unconfigured"].append({
+                "peer": ip, "ike": "/".join(IKE_LABELS[sa["ike"]] for sa in sas),
+                "state": "/".join(sa["state"] or "-" for sa in sas),
+                "child_sas": max([sa["child_sas"] or 0 for sa in sas] + [ipsec_counts.get(ip, 0)]),
+            })
+
+    for rows in health.values():
+        rows.sort(key=lambda row: _sort_key(row["peer"]))
+    return health
+
+
+def scan_ike_sa_health(peers=None):
+    """
+    Fetches the IKE SAs, child SAs and peer configuration concurrently and returns classify_ike_health() for the
+    given peer IPs (every configured peer if None).
+    """
+    tasks = [
+        S2SPeerIndex.fetch,
+        partial(get_and_parse_cli_output, ISAKMP_SA_DETAIL_COMMAND),
+        partial(get_and_parse_cli_output, IKEV2_SA_COMMAND),
+        partial(get_and_parse_cli_output, IPSEC_PEERS_COMMAND),
+    ]
+    peer_index, isakmp_output, ikev2_output, ipsec_output = run_commands(tasks, lambda task: task())
+
+    unparsed = []
+    sas = parse_ike_sas(isakmp_output, "ikev1", unparsed) + parse_ike_sas(ikev2_output, "ikev2", unparsed)
+    return classify_ike_health(peer_index, ike_sa_table(sas), ipsec_peer_counts(ipsec_output), peers, unparsed)
+
+
+def format_ike_health(health):
+    """Formats a health report as text: the count of every category, then the peers of the unhealthy ones."""
+    out = io.StringIO()
+    configured = sum(len(health[category]) for category in CONFIGURED_CATEGORIES)
+    print("-" * 80, file=out)
+    print(f"IKE SA Health Summary ({configured} configured peers)".center(80), file=out)
+    print("-" * 80, file=out)
+    for category, title in HEALTH_CATEGORIES:
+        print(f"{title + ':':<45} {len(health[category]):>6}", file=out)
+    if health["unparsed"]:
+        print("[!] Some IKE SA rows could not be parsed; the peers they may belong to are reported as unknown, "
+              "not down.", file=out)
+
+    for category, title in HEALTH_CATEGORIES:
+        rows = health[category]
+        if category not in LISTED_CATEGORIES or not rows:
+            continue
+        print("\n" + "-" * 80, file=out)
+        print(f"{title} ({len(rows)})".center(80), file=out)
+        print("-" * 80, file=out)
+        print(f"{'Peer':<40} {'IKE':<12} {'State':<18} {'Child SAs':>9}", file=out)
+        out.write("".join(f"{row['peer']:<40} {row['ike']:<12} {row['state']:<18} {row['child_sas']:>9}\n"
+                          for row in rows))
+    print("-" * 80, file=out)
+    return out.getvalue()
+
+
+def ike_sa_health(selected_peers=None, suppress_output=False, help_requested=False):
+    """Reports the IKE SA health of the selected peers (every configured peer if None) and returns it as text.
+       If suppress_output=True, nothing is printed. If help_requested=True, it prints the help information instead.
+    """
+
+    # If help is requested, display help content instead of executing the commands
+    if help_requested:
+        print_help("ike_sa_health")
+        return None
+
+    try:
+        peers = [peer[0] for peer in selected_peers] if selected_peers else None
+        text = format_ike_health(scan_ike_sa_health(peers))
+        if not suppress_output:
+            print(text)
+        return text
+
+    except Exception as e:
+        error_message = f"[!] Error: {e}"
+        if not suppress_output:
+            print(error_message)
+        return error_message
@@ -0,0 +1,174 @@
+# Description: This file implements the IPSec SA throughput monitor. It polls 'show crypto ipsec sa detail' on an
+# interval, parses every sample into per-SA records and prints, for every interval, the busiest tunnels by Mbps and
+# pps and every tunnel whose drop counters moved, so hot or dropping tunnels stand out on headends with thousands
+# of SAs.
+#
+# LINA prints packet counters for every SA but byte counters only on some releases. Where they are missing, Mbps is
+# estimated from the kB consumed from the SA's lifetime, which only works while the SPI stays the same; across a
+# rekey the interval has no Mbps for that tunnel.
+
+import time
+from core.deadline import cancel_commands, collection_budget, is_cancelled
+from core.help_catalogue import print_help
+from lina.vpn.s2s.crypto_ipsec_sa_detail.crypto_ipsec_sa_detail import fetch_ipsec_sa_records
+
+DEFAULT_INTERVAL = 10.0
+MIN_INTERVAL = 2.0
+
+# Tunnels listed per interval, busiest first
+TOP_TUNNELS = 20
+
+
+def _tunnel_key(record):
+    return (record["peer"], record["crypto_map"], record["seq"], record["local_ident"], record["remote_ident"])
+
+
+def _delta(before, after, field):
+    """Growth of a cumulative counter, or None if it is missing or went down (the counters were cleared)."""
+    if before[field] is None or after[field] is None or after[field] < before[field]:
+        return None
+    return after[field] - before[field]
+
+
+def _bytes(before, after, direction):
+    delta = _delta(before, after, f"bytes_{direction}")
+    if delta is not None:
+        return delta
+    # Without byte counters, the kB consumed from the lifetime of the same SA
+    spi_field, kb_field = ("spi", "outbound_kb_left") if direction == "encrypt" else ("inbound_spi", "inbound_kb_left")
+    if before[spi_field] != after[spi_field] or before[kb_field] is None or after[kb_field] is None:
+        return None
+    return max(before[kb_field] - after[kb_field], 0) * 1024
+
+
+def ipsec_sa_rates(previous, current, elapsed):
+    """
+    Compares two samples of parse_ipsec_sa_records() taken elapsed seconds apart and returns one entry per tunnel
+    present in both: Mbps and pps out (encrypted) and in (decrypted), and the drops of the interval with the
+    counters behind them. Rates that cannot be computed (counters cleared, SA rekeyed without byte counters) are
+    None.
+    """
+    previous_by_key = {_tunnel_key(record): record for record in previous}
+    rates = []
+    if elapsed <= 0:
+        return rates
+
+    for record in current:
+        before = previous_by_key.get(_tunnel_key(record))
+        if before is None:
+            continue
+
+        entry = {"peer": record["peer"], "spi": record["spi"], "interface": record["interface"],
+                 "crypto_map": f"{record['crypto_map']} {record['seq']}", "rekeyed": before["spi"] != record["spi"],
+                 "seconds_left": record["seconds_left"]}
+        for direction, suffix in (("encrypt", "out"), ("decrypt", "in")):
+            byte_count = _bytes(before, record, direction)
+            packets = _delta(before, record, f"pkts_{direction}")
+            entry[f"mbps_{suffix}"] = None if byte_count is None else byte_count * 8 / elapsed / 1e6
+            entry[f"pps_{suffix}"] = None if packets is None else packets / elapsed
+
+        entry["drops"] = _delta(before, record, "drops")
+        entry["drop_counters"] = {name: value - before["drop_counters"].get(name, 0)
+                                  for name, value in record["drop_counters"].items()
+                                  if value > before["drop_counters"].get(name, 0)}
+        rates.append(entry)
+    return rates
+
+
+def _total(entry, prefix):
+    return (entry[f"{prefix}_out"] or 0) + (entry[f"{prefix}_in"] or 0)
+
+
+def _format_rate(value, digits):
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+def _print_table(title, entries):
+    print(f"\n{title}")
+    print(f"{'Peer':<16} {'Outbound SPI':<12} {'Mbps out':>9} {'Mbps in':>9} {'pps out':>9} {'pps in':>9} "
+          f"{'Drops':>7} {'Lifetime':>9}")
+    print("-" * 88)
+    for entry in entries:
+        lifetime = "-" if entry["seconds_left"] is None else f"{entry['seconds_left']}s"
+        spi = f"{entry['spi'] or '-'}{'*' if entry['rekeyed'] else ''}"
+        print(f"{entry['peer']:<16} {spi:<12} {_format_rate(entry['mbps_out'], 2):>9} "
+              f"{_format_rate(entry['mbps_in'], 2):>9} {_format_rate(entry['pps_out'], 0):>9} "
+              f"{_format_rate(entry['pps_in'], 0):>9} {_format_rate(entry['drops'], 0):>7} {lifetime:>9}")
+
+
+def print_ipsec_sa_rates(rates, elapsed, top=TOP_TUNNELS):
+    """Prints the busiest tunnels of an interval and every tunnel that dropped packets in it."""
+    total_mbps = sum(_total(entry, "mbps") for entry in rates)
+    total_pps = sum(_total(entry, "pps") for entry in rates)
+    total_drops = sum(entry["drops"] or 0 for entry in rates)
+    print("\n" + "=" * 88)
+    print(f"[+] {time.strftime('%H:%M:%S')} - {len(rates)} tunnels over {elapsed:.1f}s: {total_mbps:.2f} Mbps, "
+          f"{total_pps:.0f} pps, {total_drops} drops")
+
+    busiest = sorted(rates, key=lambda entry: (_total(entry, "mbps"), _total(entry, "pps")), reverse=True)[:top]
+    _print_table(f"Top {len(busiest)} tunnels by throughput ('*' marks an SA rekeyed during the interval):", busiest)
+
+    dropping = sorted((entry for entry in rates if entry["drops"]), key=lambda entry: entry["drops"], reverse=True)
+    if dropping:
+        _print_table(f"[!] {len(dropping)} tunnels dropped packets:", dropping)
+        for entry in dropping:
+            if entry["drop_counters"]:
+                reasons = ", ".join(f"{name} +{value}" for name, value in entry["drop_counters"].items())
+                print(f"    {entry['peer']}: {reasons}")
+
+
+def _ask_interval():
+    answer = input(f"Polling interval in seconds (Enter for {DEFAULT_INTERVAL:g}): ").strip()
+    try:
+        return max(float(answer), MIN_INTERVAL) if answer else DEFAULT_INTERVAL
+    except ValueError:
+        print(f"[!] Invalid interval, using {DEFAULT_INTERVAL:g} seconds.")
+        return DEFAULT_INTERVAL
+
+
+def ipsec_sa_monitor(selected_peers=None, interval=None, samples=None, help_requested=False):
+    """Polls the IPSec SAs of the selected peers (all peers if None) every interval seconds (asked if None) and
+       prints per-tunnel Mbps, pps and drops for every interval, until Ctrl-C or after samples intervals.
+       Returns the rates of the last interval. If help_requested=True, it prints the help information instead.
+    """
+
+    # If help is requested, display help content instead of polling
+    if help_requested:
+        print_help("ipsec_sa_monitor")
+        return None
+
+    interval = _ask_interval() if interval is None else max(interval, MIN_INTERVAL)
+    peers = {peer[0] for peer in selected_peers} if selected_peers else None
+    print(f"[+] Polling 'show crypto ipsec sa detail' every {interval:g}s. Press Ctrl-C to stop.")
+
+    previous = previous_time = None
+    rates = []
+    intervals = 0
+
+    # No overall budget: the monitor runs until Ctrl-C
+    with collection_budget(0):
+        try:
+            while not is_cancelled() and (samples is None or intervals < samples):
+                started = time.monotonic()
+                try:
+                    records = fetch_ipsec_sa_records()
+                except Exception as e:
+                    print(f"[!] Error polling the IPSec SAs: {e}")
+                else:
+                    if peers is not None:
+                        records = [record for record in records if record["peer"] in peers]
+                    if previous is not None:
+                        rates = ipsec_sa_rates(previous, records, started - previous_time)
+                        print_ipsec_sa_rates(rates, started - previous_time)
+                        intervals += 1
+                    else:
+                        print(f"[+] First sample: {len(records)} SAs. Rates follow after {interval:g}s.")
+                    previous, previous_time = records, started
+
+                if samples is None or intervals < samples:
+                    time.sleep(max(0.0, started + interval - time.monotonic()))
+        except KeyboardInterrupt:
+            print("\n[!] Stopping the IPSec SA monitor...")
+            cancel_commands()
+
+    return rates
@@ -1,346 +1,207 @@
+from core.executor import run_commands
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output, print_section
+from core.running_config import get_running_config_output
+from lina.vpn.s2s.s2s_peer_index.s2s_peer_index import S2SPeerIndex
+import io
 import re
 
-
-def s2s_ikev1_policy_based_config(ip_address, help_requested=False):
-    """Retrieves IKEv1 policy-based configuration details for a given peer IP.
-       If help_requested=True, it prints the help information instead.
+IKE_LABELS = {"ikev1": "IKEv1", "ikev2": "IKEv2"}
+VPN_TYPE_LABELS = {"policy": "Policy-Based", "vti": "VTI"}
+
+# Per IKE version: the crypto map / IPSec profile line naming the IPSec policy, its section title and the command
+# showing it
+IPSEC_POLICIES = {
+    "ikev1": (
+        "set ikev1 transform-set",
+        "Transform-Set Configuration",
+        "show running-config crypto | include crypto ipsec ikev1 transform-set {}",
+    ),
+    "ikev2": (
+        "set ikev2 ipsec-proposal",
+        "IPSec Proposal Configuration",
+        "show running-config crypto | include crypto ipsec ikev2 ipsec-proposal {}|protocol esp encryption|protocol esp integrity",
+    ),
+}
+
+
+def _ipsec_policy_sections(ike_version, config):
+    """Returns the transform-set / IPSec proposal section the crypto map or IPSec profile config points to."""
+    keyword, title, command = IPSEC_POLICIES[ike_version]
+    match = re.search(rf"{keyword} (\S+)", config)
+    if not match:
+        return []
+    return [(f"{title}: {match.group(1)}", get_running_config_output(command.format(match.group(1))))]
+
+
+def s2s_config_sections(ip_address, ike_version, vpn_type, vti_interfaces=None):
     """
+    Resolves the configuration chain of one peer (tunnel group, group policy, then crypto map, ACL and transform
+    set / IPSec proposal, or tunnel interface, IPSec profile and route) and returns it as (title, output) sections.
 
-    help_info = {
-        'command': 'show running-config tunnel-group <peer_ip>',
-        'description': (
-            "Displays the configuration of an IKEv1 policy-based Site-to-Site VPN tunnel. "
-            "Includes tunnel-group settings, crypto map, access lists, and transform sets."
-        ),
-        'example_output': """
-tunnel-group 192.168.1.1 type ipsec-l2l
-tunnel-group 192.168.1.1 ipsec-attributes
- peer-id-validate nocheck
- isakmp keepalive threshold 10 retry 2
- default-group-policy GroupPolicy1
-crypto map outside_map 1 set peer 192.168.1.1
-crypto map outside_map 1 match address ACL_VPN
-crypto map outside_map 1 set ikev1 transform-set TS1
-        """
-    }
-
-    # If help is requested, display it and return
-    if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {help_info['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{help_info['description']}\n")
-        print("Example Output:")
-        print(help_info['example_output'])
-        return None  # No actual command execution
-
-    # Execute the actual configuration retrieval
-    print("\n")
-    print("-" * 80)
-    print(f"*** IKEv1 Policy-Based Configuration for {ip_address} ***".center(80))
+    vti_interfaces lists the tunnel interfaces whose destination is the peer; they are looked up when not given.
+    """
+    sections = []
 
-    tunnel_output = get_and_parse_cli_output(f"show running-config tunnel-group {ip_address}")
-    print_section(f"Tunnel Group Configuration for {ip_address}", tunnel_output)
+    tunnel_output = get_running_config_output(f"show running-config tunnel-group {ip_address}")
+    sections.append((f"Tunnel Group Configuration for {ip_address}", tunnel_output))
 
     group_policy_match = re.search(r"default-group-policy (\S+)", tunnel_output)
     if group_policy_match:
         group_policy = group_policy_match.group(1)
-        group_policy_output = get_and_parse_cli_output(f"show running-config group-policy {group_policy}")
-        print_section(f"Group Policy Configuration for {group_policy}", group_policy_output)
-
-    crypto_map_output = get_and_parse_cli_output(f"show running-config crypto map | include {ip_address}")
-    print_section(f"Crypto Map Configuration for {ip_address}", crypto_map_output)
-
-    crypto_map_match = re.search(r"crypto map (\S+) (\d+) set peer", crypto_map_output)
-    if crypto_map_match:
-        crypto_map_name, crypto_map_number = crypto_map_match.groups()
-        crypto_map_details = get_and_parse_cli_output(
-            f"show running-config crypto map | include {crypto_map_name} {crypto_map_number}"
-        )
-        print_section(f"Detailed Crypto Map Configuration: {crypto_map_name} {crypto_map_number}", crypto_map_details)
-
-        acl_match = re.search(r"match address (\S+)", crypto_map_details)
-        if acl_match:
-            acl_name = acl_match.group(1)
-            acl_output = get_and_parse_cli_output(f"show access-list {acl_name}")
-            print_section(f"Access-List Configuration: {acl_name}", acl_output)
-
-        transform_set_match = re.search(r"set ikev1 transform-set (\S+)", crypto_map_details)
-        if transform_set_match:
-            transform_set = transform_set_match.group(1)
-            transform_set_output = get_and_parse_cli_output(
-                f"show running-config crypto | include crypto ipsec ikev1 transform-set {transform_set}"
+        group_policy_output = get_running_config_output(f"show running-config group-policy {group_policy}")
+        sections.append((f"Group Policy Configuration for {group_policy}", group_policy_output))
+
+    if vpn_type == "policy":
+        crypto_map_output = get_running_config_output(f"show running-config crypto map | include {ip_address}")
+        sections.append((f"Crypto Map Configuration for {ip_address}", crypto_map_output))
+
+        crypto_map_match = re.search(r"crypto map (\S+) (\d+) set peer", crypto_map_output)
+        if crypto_map_match:
+            crypto_map_name, crypto_map_number = crypto_map_match.groups()
+            crypto_map_details = get_running_config_output(
+                f"show running-config crypto map | include crypto map {crypto_map_name} {crypto_map_number}"
             )
-            print_section(f"Transform-Set Configuration: {transform_set}", transform_set_output)
+            sections.append((f"Detailed Crypto Map Configuration: {crypto_map_name} {crypto_map_number}",
+                             crypto_map_details))
 
-    ikev1_output = get_and_parse_cli_output("show running-config crypto ikev1")
-    print_section("IKEv1 Configuration", ikev1_output)
-    sysopt_output = get_and_parse_cli_output("show running-config all sysopt | include vpn")
-    print_section("Sysopt Configuration (related to VPN)", sysopt_output)
+            acl_match = re.search(r"match address (\S+)", crypto_map_details)
+            if acl_match:
+                acl_name = acl_match.group(1)
+                acl_output = get_and_parse_cli_output(f"show access-list {acl_name}")
+                sections.append((f"Access-List Configuration: {acl_name}", acl_output))
 
-    print("NOTE: This script does not gather NAT configuration. Manual verification is required for NAT-exemption")
-    print("and/or Hairpin NAT statements to ensure they are configured properly.\n")
+            sections.extend(_ipsec_policy_sections(ike_version, crypto_map_details))
+    else:
+        if vti_interfaces is None:
+            vti_interfaces = S2SPeerIndex.fetch().vti_interfaces.get(ip_address, [])
 
-
-def s2s_ikev1_vti_config(ip_address, help_requested=False):
-    """Retrieves IKEv1 VTI configuration details for a given peer IP.
-       If help_requested=True, it prints the help information instead.
-    """
-
-    help_info = {
-        'command': 'show running-config interface TunnelX | include tunnel destination <peer_ip>',
-        'description': (
-            "Displays the configuration of an IKEv1 Virtual Tunnel Interface (VTI) for a given peer. "
-            "Includes tunnel-group settings, interface configurations, IPSec profile details, and route settings."
-        ),
-        'example_output': """
-interface Tunnel10
- nameif vti10
- tunnel source GigabitEthernet0/0
- tunnel destination 192.168.1.1
- tunnel protection ipsec profile IKEv1_PROFILE
-crypto ipsec profile IKEv1_PROFILE
- set ikev1 transform-set TRANSFORM1
-        """
-    }
-
-    # If help is requested, display it and return
-    if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {help_info['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{help_info['description']}\n")
-        print("Example Output:")
-        print(help_info['example_output'])
-        return None  # No actual command execution
-
-    # Execute the actual configuration retrieval
-    print("\n")
-    print("-" * 80)
-    print(f"*** IKEv1 VTI Configuration for {ip_address} ***".center(80))
-
-    tunnel_output = get_and_parse_cli_output(f"show running-config tunnel-group {ip_address}")
-    print_section(f"Tunnel Group Configuration for {ip_address}", tunnel_output)
-
-    group_policy_match = re.search(r"default-group-policy (\S+)", tunnel_output)
-    if group_policy_match:
-        group_policy = group_policy_match.group(1)
-        group_policy_output = get_and_parse_cli_output(f"show running-config group-policy {group_policy}")
-        print_section(f"Group Policy Configuration for {group_policy}", group_policy_output)
-
-    interface_output = get_and_parse_cli_output("show running-config interface | begin Tunnel")
-    interface_sections = re.findall(r"interface (Tunnel\S+)([\s\S]*?)(?=^interface|\Z)", interface_output, re.MULTILINE)
-
-    for interface, config in interface_sections:
-        if re.search(rf"tunnel destination {re.escape(ip_address)}", config):
-            tunnel_interface = interface
-            tunnel_interface_output = get_and_parse_cli_output(f"show running-config interface {tunnel_interface}")
-            print_section(f"Tunnel Interface Configuration for {tunnel_interface}", tunnel_interface_output)
+        for tunnel_interface in vti_interfaces:
+            tunnel_interface_output = get_running_config_output(f"show running-config interface {tunnel_interface}")
+            sections.append((f"Tunnel Interface Configuration for {tunnel_interface}", tunnel_interface_output))
 
             ipsec_profile_match = re.search(r"tunnel protection ipsec profile (\S+)", tunnel_interface_output)
             if ipsec_profile_match:
                 ipsec_profile = ipsec_profile_match.group(1)
-                ipsec_profile_output = get_and_parse_cli_output(
-                    f"show running-config crypto | include {ipsec_profile}|set ikev1 transform-set"
+                ipsec_profile_output = get_running_config_output(
+                    f"show running-config crypto | include crypto ipsec profile {ipsec_profile}|"
+                    f"{IPSEC_POLICIES[ike_version][0]}"
                 )
-                print_section(f"IPSec Profile Configuration: {ipsec_profile}", ipsec_profile_output)
-
-                transform_set_match = re.search(r"set ikev1 transform-set (\S+)", ipsec_profile_output)
-                if transform_set_match:
-                    transform_set = transform_set_match.group(1)
-                    transform_set_output = get_and_parse_cli_output(
-                        f"show running-config crypto | include crypto ipsec ikev1 transform-set {transform_set}"
-                    )
-                    print_section(f"Transform-Set Configuration: {transform_set}", transform_set_output)
+                sections.append((f"IPSec Profile Configuration: {ipsec_profile}", ipsec_profile_output))
+                sections.extend(_ipsec_policy_sections(ike_version, ipsec_profile_output))
 
             nameif_match = re.search(r"nameif (\S+)", tunnel_interface_output)
             if nameif_match:
                 nameif = nameif_match.group(1)
-                route_output = get_and_parse_cli_output(f"show running-config route | include {nameif}")
-                print_section(f"Route Configuration for {nameif}", route_output)
-
-    ikev1_output = get_and_parse_cli_output("show running-config crypto ikev1")
-    print_section("IKEv1 Configuration", ikev1_output)
-    sysopt_output = get_and_parse_cli_output("show running-config all sysopt | include vpn")
-    print_section("Sysopt Configuration (related to VPN)", sysopt_output)
+                route_output = get_running_config_output(f"show running-config route | include {nameif}")
+                sections.append((f"Route Configuration for {nameif}", route_output))
 
-    print("NOTE: This script does not gather NAT configuration. Manual verification is required for NAT-exemption")
-    print("and/or Hairpin NAT statements to ensure they are configured properly.\n")
+    ike_output = get_running_config_output(f"show running-config crypto {ike_version}")
+    sections.append((f"{IKE_LABELS[ike_version]} Configuration", ike_output))
+    sysopt_output = get_running_config_output("show running-config all sysopt | include vpn")
+    sections.append(("Sysopt Configuration (related to VPN)", sysopt_output))
+    return sections
 
 
-def s2s_ikev2_policy_based_config(ip_address, help_requested=False):
-    """Retrieves IKEv2 Policy-Based configuration details for a given peer IP.
-       If help_requested=True, it prints the help information instead.
+def s2s_config(ip_address, ike_version, vpn_type, suppress_output=False, vti_interfaces=None):
+    """
+    Collects the configuration of one peer and returns it formatted as text; it is also printed unless
+    suppress_output=True.
     """
-
-    # Help Information
-    s2s_ikev2_policy_based_config_help = {
-        'command': 'show running-config crypto map | include <peer_ip>',
-        'description': (
-            "Displays the policy-based VPN configuration for a specified IKEv2 peer. "
-            "Includes tunnel-group settings, crypto map entries, access-list rules, "
-            "IPSec proposal settings, and sysopt configurations."
-        ),
-        'example_output': """
-crypto map outside_map 10 match address ACL_VPN
-crypto map outside_map 10 set peer 192.168.1.1
-crypto map outside_map 10 set ikev2 ipsec-proposal AES-GCM
-crypto map outside_map interface outside
-        """
-    }
-
-    # If help is requested, print help content and exit the function
-    if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {s2s_ikev2_policy_based_config_help['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{s2s_ikev2_policy_based_config_help['description']}\n")
-        print("Example Output:")
-        print(s2s_ikev2_policy_based_config_help['example_output'])
-        return None  # No actual command execution
-
-    # Normal function execution
     if ip_address is None:
-        print("[!] Error: No IP address provided.")
+        if not suppress_output:
+            print("[!] Error: No IP address provided.")
         return None
 
-    print("\n")
-    print("-" * 80)
-    print(f"*** IKEv2 Policy-Based Configuration for {ip_address} ***".center(80))
+    label = f"{IKE_LABELS[ike_version]} {VPN_TYPE_LABELS[vpn_type]}"
+    out = io.StringIO()
+    print("\n", file=out)
+    print("-" * 80, file=out)
+    print(f"*** {label} Configuration for {ip_address} ***".center(80), file=out)
+    for title, output in s2s_config_sections(ip_address, ike_version, vpn_type, vti_interfaces):
+        print_section(title, output, file=out)
+    print("NOTE: This script does not gather NAT configuration. Manual verification is required for NAT-exemption",
+          file=out)
+    print("and/or Hairpin NAT statements to ensure they are configured properly.\n", file=out)
 
-    tunnel_output = get_and_parse_cli_output(f"show running-config tunnel-group {ip_address}")
-    print_section(f"Tunnel Group Configuration for {ip_address}", tunnel_output)
+    text = out.getvalue()
+    if not suppress_output:
+        print(text, end="")
+    return text
 
-    group_policy_match = re.search(r"default-group-policy (\S+)", tunnel_output)
-    if group_policy_match:
-        group_policy = group_policy_match.group(1)
-        group_policy_output = get_and_parse_cli_output(f"show running-config group-policy {group_policy}")
-        print_section(f"Group Policy Configuration for {group_policy}", group_policy_output)
-
-    crypto_map_output = get_and_parse_cli_output(f"show running-config crypto map | include {ip_address}")
-    print_section(f"Crypto Map Configuration for {ip_address}", crypto_map_output)
-
-    crypto_map_match = re.search(r"crypto map (\S+) (\d+) set peer", crypto_map_output)
-    if crypto_map_match:
-        crypto_map_name, crypto_map_number = crypto_map_match.groups()
-        crypto_map_details = get_and_parse_cli_output(
-            f"show running-config crypto map | include crypto map {crypto_map_name} {crypto_map_number}"
-        )
-        print_section(f"Detailed Crypto Map Configuration: {crypto_map_name} {crypto_map_number}", crypto_map_details)
-
-        acl_match = re.search(r"match address (\S+)", crypto_map_details)
-        if acl_match:
-            acl_name = acl_match.group(1)
-            acl_output = get_and_parse_cli_output(f"show access-list {acl_name}")
-            print_section(f"Access-List Configuration: {acl_name}", acl_output)
-
-        ipsec_proposal_match = re.search(r"set ikev2 ipsec-proposal (\S+)", crypto_map_details)
-        if ipsec_proposal_match:
-            ipsec_proposal = ipsec_proposal_match.group(1)
-            ipsec_proposal_output = get_and_parse_cli_output(
-                f"show running-config crypto | include crypto ipsec ikev2 ipsec-proposal {ipsec_proposal}|protocol esp encryption|protocol esp integrity"
-            )
-            print_section(f"IPSec Proposal Configuration: {ipsec_proposal}", ipsec_proposal_output)
 
-    ikev2_output = get_and_parse_cli_output("show running-config crypto ikev2")
-    print_section("IKEv2 Configuration", ikev2_output)
-    sysopt_output = get_and_parse_cli_output("show running-config all sysopt | include vpn")
-    print_section("Sysopt Configuration (related to VPN)", sysopt_output)
+def collect_s2s_configs(peers, peer_index=None):
+    """
+    Collects the configuration of several (ip, IKE version, VPN type) peers concurrently and returns the texts in
+    the same order. A peer whose collection fails gets an '[!] Error' text instead.
+    """
+    def collect(peer):
+        ip_address, ike_version, vpn_type = peer
+        vti_interfaces = peer_index.vti_interfaces.get(ip_address, []) if peer_index is not None else None
+        try:
+            return s2s_config(ip_address, ike_version, vpn_type, suppress_output=True, vti_interfaces=vti_interfaces)
+        except Exception as e:
+            return f"[!] Error collecting the configuration of {ip_address}: {e}"
+
+    return run_commands(peers, collect)
+
 
-    print("NOTE: This script does not gather NAT configuration. Manual verification is required for NAT-exemption")
-    print("and/or Hairpin NAT statements to ensure they are configured properly.\n")
+def s2s_peer_configs(suppress_output=False):
+    """Collects the configuration of every Site-to-Site peer concurrently and returns it as one text."""
+    peer_index = S2SPeerIndex.fetch()
+    text = "".join(collect_s2s_configs(peer_index.selected_peers(), peer_index)) or "No site-to-site peers found."
+    if not suppress_output:
+        print(text)
+    return text
 
 
-def s2s_ikev2_vti_config(ip_address, help_requested=False):
-    """Retrieves IKEv2 VTI configuration details for a given peer IP.
+def s2s_ikev1_policy_based_config(ip_address, suppress_output=False, help_requested=False):
+    """Retrieves IKEv1 policy-based configuration details for a given peer IP and returns them as text.
        If help_requested=True, it prints the help information instead.
     """
 
-    # Help Information
-    s2s_ikev2_vti_config_help = {
-        'command': 'show running-config interface | begin Tunnel',
-        'description': (
-            "Displays the IKEv2 VTI (Virtual Tunnel Interface) configuration for a specified peer IP. "
-            "Includes tunnel-group settings, interface configurations, IPsec profile details, "
-            "IPsec proposal settings, and sysopt configurations."
-        ),
-        'example_output': """
-interface Tunnel100
- nameif VTI100
- ip address 192.168.10.1 255.255.255.252
- tunnel source GigabitEthernet0/0
- tunnel destination 203.0.113.2
- tunnel mode ipsec ipv4
- tunnel protection ipsec profile VTI_PROFILE
-crypto ipsec profile VTI_PROFILE
- set ikev2 ipsec-proposal AES-GCM
-        """
-    }
-
-    # If help is requested, print help content and exit the function
+    # If help is requested, display it and return
     if help_requested:
-        print("\n" + "-" * 80)
-        print(f"Help for: {s2s_ikev2_vti_config_help['command']}".center(80))
-        print("-" * 80)
-        print(f"\n{s2s_ikev2_vti_config_help['description']}\n")
-        print("Example Output:")
-        print(s2s_ikev2_vti_config_help['example_output'])
+        print_help("s2s_ikev1_policy_based_config")
         return None  # No actual command execution
 
-    # Normal function execution
-    if ip_address is None:
-        print("[!] Error: No IP address provided.")
-        return None
+    return s2s_config(ip_address, "ikev1", "policy", suppress_output)
 
-    print("\n")
-    print("-" * 80)
-    print(f"*** IKEv2 VTI Configuration for {ip_address} ***".center(80))
 
-    tunnel_output = get_and_parse_cli_output(f"show running-config tunnel-group {ip_address}")
-    print_section(f"Tunnel Group Configuration for {ip_address}", tunnel_output)
+def s2s_ikev1_vti_config(ip_address, suppress_output=False, help_requested=False):
+    """Retrieves IKEv1 VTI configuration details for a given peer IP and returns them as text.
+       If help_requested=True, it prints the help information instead.
+    """
 
-    group_policy_match = re.search(r"default-group-policy (\S+)", tunnel_output)
-    if group_policy_match:
-        group_policy = group_policy_match.group(1)
-        group_policy_output = get_and_parse_cli_output(f"show running-config group-policy {group_policy}")
-        print_section(f"Group Policy Configuration for {group_policy}", group_policy_output)
+    # If help is requested, display it and return
+    if help_requested:
+        print_help("s2s_ikev1_vti_config")
+        return None  # No actual command execution
 
-    interface_output = get_and_parse_cli_output("show running-config interface | begin Tunnel")
-    interface_sections = re.findall(r"interface (Tunnel\S+)([\s\S]*?)(?=^interface|\Z)", interface_output, re.MULTILINE)
+    return s2s_config(ip_address, "ikev1", "vti", suppress_output)
 
-    for interface, config in interface_sections:
-        if re.search(rf"tunnel destination {re.escape(ip_address)}", config):
-            tunnel_interface = interface
-            tunnel_interface_output = get_and_parse_cli_output(f"show running-config interface {tunnel_interface}")
-            print_section(f"Tunnel Interface Configuration for {tunnel_interface}", tunnel_interface_output)
 
-            ipsec_profile_match = re.search(r"tunnel protection ipsec profile (\S+)", tunnel_interface_output)
-            if ipsec_profile_match:
-                ipsec_profile = ipsec_profile_match.group(1)
-                ipsec_profile_output = get_and_parse_cli_output(
-                    f"show running-config crypto | include crypto ipsec profile {ipsec_profile}|set ikev2 ipsec-proposal"
-                )
-                print_section(f"IPSec Profile Configuration: {ipsec_profile}", ipsec_profile_output)
+def s2s_ikev2_policy_based_config(ip_address, suppress_output=False, help_requested=False):
+    """Retrieves IKEv2 Policy-Based configuration details for a given peer IP and returns them as text.
+       If help_requested=True, it prints the help information instead.
+    """
 
-                ipsec_proposal_match = re.search(r"set ikev2 ipsec-proposal (\S+)", ipsec_profile_output)
-                if ipsec_proposal_match:
-                    ipsec_proposal = ipsec_proposal_match.group(1)
-                    ipsec_proposal_output = get_and_parse_cli_output(
-                        f"show running-config crypto | include crypto ipsec ikev2 ipsec-proposal {ipsec_proposal}|protocol esp encryption|protocol esp integrity"
-                    )
-                    print_section(f"IPSec Proposal Configuration: {ipsec_proposal}", ipsec_proposal_output)
+    # If help is requested, print help content and exit the function
+    if help_requested:
+        print_help("s2s_ikev2_policy_based_config")
+        return None  # No actual command execution
+
+    return s2s_config(ip_address, "ikev2", "policy", suppress_output)
 
-            nameif_match = re.search(r"nameif (\S+)", tunnel_interface_output)
-            if nameif_match:
-                nameif = nameif_match.group(1)
-                route_output = get_and_parse_cli_output(f"show running-config route | include {nameif}")
-                print_section(f"Route Configuration for {nameif}", route_output)
 
-    ikev2_output = get_and_parse_cli_output("show running-config crypto ikev2")
-    print_section("IKEv2 Configuration", ikev2_output)
-    sysopt_output = get_and_parse_cli_output("show running-config all sysopt | include vpn")
-    print_section("Sysopt Configuration (related to VPN)", sysopt_output)
+def s2s_ikev2_vti_config(ip_address, suppress_output=False, help_requested=False):
+    """Retrieves IKEv2 VTI configuration details for a given peer IP and returns them as text.
+       If help_requested=True, it prints the help information instead.
+    """
+
+    # If help is requested, print help content and exit the function
+    if help_requested:
+        print_help("s2s_ikev2_vti_config")
+        return None  # No actual command execution
 
-    print("NOTE: This script does not gather NAT configuration. Manual verification is required for NAT-exemption")
-    print("and/or Hairpin NAT statements to ensure they are configured properly.\n")
+    return s2s_config(ip_address, "ikev2", "vti", suppress_output)
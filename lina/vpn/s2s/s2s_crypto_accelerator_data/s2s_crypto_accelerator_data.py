@@ -1,3 +1,4 @@
+from core.help_catalogue import print_help
 from core.utils import get_and_parse_cli_output
 
 
@@ -6,82 +7,9 @@ def s2s_crypto_accelerator_data(suppress_output=False, help_requested=False):
        If help_requested=True, it prints the help information instead.
     """
 
-    crypto_accelerator_help = {
-        'commands': {
-            "show crypto accelerator load-balance ipsec": (
-                "Displays how IPSec load balancing is distributed across hardware crypto accelerators. "
-                "Useful for verifying load distribution efficiency in multi-core platforms."
-            ),
-            "show crypto accelerator load-balance detail": (
-                "Provides a detailed breakdown of each hardware accelerator's contribution to IPSec processing. "
-                "Useful for debugging unbalanced crypto loads."
-            ),
-            "show crypto accelerator statistics": (
-                "Displays statistical data, including packets encrypted/decrypted and offloaded to hardware. "
-                "Useful for analyzing cryptographic performance."
-            ),
-            "show crypto accelerator status": (
-                "Shows whether crypto hardware acceleration is enabled or disabled, and provides version details. "
-                "Essential for verifying system capabilities."
-            ),
-            "show crypto accelerator usage detail": (
-                "Provides an in-depth view of each crypto accelerator's session and resource utilization. "
-                "Useful for capacity planning and troubleshooting."
-            )
-        },
-        'example_output': {
-            "show crypto accelerator load-balance ipsec": """
-Crypto accelerator load balance for IPSec:
-   Core 0:  250 packets, 500000 bytes
-   Core 1:  300 packets, 600000 bytes
-   Core 2:  280 packets, 560000 bytes
-   Core 3:  270 packets, 540000 bytes
-            """,
-            "show crypto accelerator load-balance detail": """
-Crypto accelerator load balance detail:
-   Core 0:  Sessions: 5, Packets: 250, Bytes: 500000
-   Core 1:  Sessions: 6, Packets: 300, Bytes: 600000
-   Core 2:  Sessions: 5, Packets: 280, Bytes: 560000
-   Core 3:  Sessions: 4, Packets: 270, Bytes: 540000
-            """,
-            "show crypto accelerator statistics": """
-Crypto accelerator statistics:
-   Encrypted packets: 120000
-   Decrypted packets: 118000
-   Hardware offload: 99.8%
-   Failed packets: 50
-            """,
-            "show crypto accelerator status": """
-Crypto accelerator status:
-   Hardware acceleration: Enabled
-   Firmware version: 2.3.1
-   Crypto cores: 4 active
-            """,
-            "show crypto accelerator usage detail": """
-Crypto accelerator usage detail:
-   Core 0: Active sessions: 5, Utilization: 70%
-   Core 1: Active sessions: 6, Utilization: 75%
-   Core 2: Active sessions: 5, Utilization: 72%
-   Core 3: Active sessions: 4, Utilization: 68%
-            """
-        }
-    }
-
-    # ✅ Fix: If help is requested, iterate over all commands
+    # If help is requested, print help content and exit the function
     if help_requested:
-        print("\n" + "=" * 80)
-        print(f"📖 Crypto Accelerator Data Help".center(80))
-        print("=" * 80)
-
-        for command, description in crypto_accelerator_help['commands'].items():
-            print(f"\n🔹 Command: {command}")
-            print(f"   {description}")
-
-            example_output = crypto_accelerator_help['example_output'].get(command, "No example available.")
-            print("\nExample Output:")
-            print(example_output)
-            print("-" * 80)
-
+        print_help("s2s_crypto_accelerator_data")
         return None  # Prevent actual execution
 
     # ✅ Normal Execution (Not Help Mode)
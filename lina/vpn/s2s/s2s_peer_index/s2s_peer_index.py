@@ -0,0 +1,110 @@
+# Description: This file builds the Site-to-Site peer index the S2S menu and dump use to classify their peers. It
+# reads the tunnel-group, interface and crypto map configuration once each and maps every ipsec-l2l peer IP to its
+# IKE versions, the VTI interfaces whose tunnel destination it is and the crypto map entries that set it as a peer,
+# so classifying every peer costs one pass over each configuration instead of a scan per peer.
+
+from core.running_config import get_running_config_output
+from core.utils import ip_sort_key
+
+# (IKE version, VPN type, title), in the order peers are listed and dumped
+CATEGORIES = (
+    ("ikev1", "policy", "IKEv1 Policy-Based Tunnels"),
+    ("ikev1", "vti", "IKEv1 VTI Tunnels"),
+    ("ikev2", "policy", "IKEv2 Policy-Based Tunnels"),
+    ("ikev2", "vti", "IKEv2 VTI Tunnels"),
+)
+
+
+def _blocks(config):
+    """Yields every top-level configuration line as (tokens, sub-mode lines)."""
+    tokens, lines = None, []
+    for line in config.splitlines():
+        if line and not line[0].isspace():
+            if tokens:
+                yield tokens, lines
+            tokens, lines = line.split(), []
+        elif line.strip():
+            lines.append(line.strip())
+    if tokens:
+        yield tokens, lines
+
+
+class S2SPeerIndex:
+    """Site-to-Site peers by IP: IKE versions, VTI interfaces and crypto map entries."""
+
+    def __init__(self, tunnel_group_config, interface_config, crypto_map_config):
+        self.peers = {}
+
+        # 'tunnel-group <ip> type ipsec-l2l', then the pre-shared keys in 'tunnel-group <ip> ipsec-attributes'
+        for tokens, lines in _blocks(tunnel_group_config):
+            if tokens[0] != "tunnel-group" or len(tokens) < 3:
+                continue
+            if tokens[2:] == ["type", "ipsec-l2l"]:
+                self._peer(tokens[1])["l2l"] = True
+            for line in lines:
+                if line.startswith("ikev1 pre-shared-key"):
+                    self._peer(tokens[1])["ikev1"] = True
+                elif line.startswith(("ikev2 remote-authentication pre-shared-key",
+                                      "ikev2 local-authentication pre-shared-key")):
+                    self._peer(tokens[1])["ikev2"] = True
+
+        self.vti_interfaces = {}
+        for tokens, lines in _blocks(interface_config):
+            if tokens[0] != "interface" or len(tokens) < 2:
+                continue
+            for line in lines:
+                words = line.split()
+                if words[:2] == ["tunnel", "destination"] and len(words) > 2:
+                    self.vti_interfaces.setdefault(words[2], []).append(tokens[1])
+
+        # 'crypto map <name> <sequence> set peer <ip> [<ip> ...]'
+        self.crypto_map_entries = {}
+        for tokens, _ in _blocks(crypto_map_config):
+            if tokens[:2] == ["crypto", "map"] and tokens[4:6] == ["set", "peer"]:
+                for ip in tokens[6:]:
+                    self.crypto_map_entries.setdefault(ip, []).append((tokens[2], tokens[3]))
+
+        # Only l2l tunnel groups count as peers; the PSK blocks of other tunnel groups are dropped again
+        for ip in [ip for ip, peer in self.peers.items() if not peer["l2l"]]:
+            del self.peers[ip]
+        for ip, peer in self.peers.items():
+            peer["vti_interfaces"] = self.vti_interfaces.get(ip, [])
+            peer["crypto_map_entries"] = self.crypto_map_entries.get(ip, [])
+
+    def _peer(self, ip):
+        peer = self.peers.get(ip)
+        if peer is None:
+            peer = self.peers[ip] = {"l2l": False, "ikev1": False, "ikev2": False}
+        return peer
+
+    @classmethod
+    def fetch(cls):
+        """Builds the index from one read of each configuration."""
+        return cls(
+            get_running_config_output("show running-config tunnel-group"),
+            get_running_config_output("show running-config interface"),
+            get_running_config_output("show running-config crypto map"),
+        )
+
+    def categorize(self, peers=None):
+        """
+        Returns {(IKE version, VPN type): [(ip, IKE version, VPN type), ...]} for the CATEGORIES, each list sorted
+        by IP. A peer with both a VTI and a crypto map entry is listed in both. If peers is given, only those IPs.
+        """
+        categories = {(ike_version, vpn_type): [] for ike_version, vpn_type, _ in CATEGORIES}
+        selected = self.peers if peers is None else {ip: self.peers[ip] for ip in peers if ip in self.peers}
+        for ip in sorted(selected, key=ip_sort_key):
+            peer = selected[ip]
+            for ike_version in ("ikev1", "ikev2"):
+                if not peer[ike_version]:
+                    continue
+                if peer["crypto_map_entries"]:
+                    categories[(ike_version, "policy")].append((ip, ike_version, "policy"))
+                if peer["vti_interfaces"]:
+                    categories[(ike_version, "vti")].append((ip, ike_version, "vti"))
+        return categories
+
+    def selected_peers(self, peers=None):
+        """Returns the (ip, IKE version, VPN type) tuples of every category in CATEGORIES order."""
+        categories = self.categorize(peers)
+        return [peer for ike_version, vpn_type, _ in CATEGORIES for peer in categories[(ike_version, vpn_type)]]
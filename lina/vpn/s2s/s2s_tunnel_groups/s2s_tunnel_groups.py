@@ -1,5 +1,5 @@
-import re
-from core.utils import get_and_parse_cli_output
+from core.help_catalogue import print_help
+from lina.vpn.s2s.s2s_peer_index.s2s_peer_index import CATEGORIES, S2SPeerIndex
 from menus.s2s_menu import s2s_menu
 
 
@@ -9,72 +9,16 @@ def ip_sort_key(ip):
 
 def s2s_tunnel_groups(help_requested=False):
 
-    s2s_menu_help_info = {
-        'command': 'Site-to-Site VPN Menu',
-        'description': (
-            "The Site-to-Site VPN Menu provides options for viewing and troubleshooting "
-            "various aspects of site-to-site IPSec VPNs, including tunnel configurations, "
-            "ISAKMP/IPSec SA details, and crypto accelerator statistics. Use this menu to "
-            "inspect tunnel statuses, troubleshoot connectivity issues, and analyze VPN-related "
-            "crypto hardware acceleration."
-        ),
-        'example_output': """
-    ============================= Site-to-Site VPN Menu =============================
-    1) Site-to-Site Configuration
-    2) Crypto ISAKMP SA Detail
-    3) Crypto IPSec SA Detail
-    4) Crypto Accelerator Data
-    5) Site-to-Site Help
-    0) Exit
-    ================================================================================
-            """
-    }
     if help_requested:
-        print("\n" + "=" * 80)
-        print(f"📖 Help for: {s2s_menu_help_info['command']}".center(80))
-        print("=" * 80)
-        print(f"\n{s2s_menu_help_info['description']}\n")
-        print("Example Output:")
-        print(s2s_menu_help_info['example_output'])
+        print_help("s2s_tunnel_groups")
         return None
 
-    command = "show running-config tunnel-group | include type ipsec-l2l"
-    cli_output = get_and_parse_cli_output(command)
-
-    ikev1_policy_based = []
-    ikev1_vti = []
-    ikev2_policy_based = []
-    ikev2_vti = []
+    # One read of the tunnel-group, interface and crypto map configuration classifies every peer
+    peer_index = S2SPeerIndex.fetch()
+    categories = peer_index.categorize()
+    selected_peers = peer_index.selected_peers()
     selection_mapping = {}
 
-    tunnel_groups = sorted(set([line.split()[1] for line in cli_output.splitlines() if line.startswith("tunnel-group")]), key=ip_sort_key)
-
-    for ip in tunnel_groups:
-        tunnel_output = get_and_parse_cli_output(f"show running-config tunnel-group {ip}")
-        ikev1 = bool(re.search(r"ikev1 pre-shared-key", tunnel_output))
-        ikev2 = bool(re.search(r"ikev2 (remote|local)-authentication pre-shared-key", tunnel_output))
-
-        vti_output = get_and_parse_cli_output("show running-config interface | begin Tunnel")
-        vti_match = re.search(rf"tunnel destination {re.escape(ip)}", vti_output)
-
-        policy_output = get_and_parse_cli_output("show running-config crypto map")
-        policy_match = re.search(rf"set peer {re.escape(ip)}", policy_output)
-
-        if ikev1:
-            if vti_match:
-                ikev1_vti.append((ip, 'ikev1', 'vti'))
-            if policy_match:
-                ikev1_policy_based.append((ip, 'ikev1', 'policy'))
-
-        if ikev2:
-            if vti_match:
-                ikev2_vti.append((ip, 'ikev2', 'vti'))
-            if policy_match:
-                ikev2_policy_based.append((ip, 'ikev2', 'policy'))
-
-    selected_peers = ikev1_policy_based + ikev1_vti + ikev2_policy_based + ikev2_vti
-
-
     index = 1
     def display_section(title, items, start_index):
         print("\n")
@@ -93,10 +37,8 @@ def s2s_tunnel_groups(help_requested=False):
         print("-" * 80 + "\n")
         return index
 
-    index = display_section("IKEv1 Policy-Based Tunnels", ikev1_policy_based, index)
-    index = display_section("IKEv1 VTI Tunnels", ikev1_vti, index)
-    index = display_section("IKEv2 Policy-Based Tunnels", ikev2_policy_based, index)
-    index = display_section("IKEv2 VTI Tunnels", ikev2_vti, index)
+    for ike_version, vpn_type, title in CATEGORIES:
+        index = display_section(title, categories[(ike_version, vpn_type)], index)
 
     while True:
         choice = input("Select an option (0 to exit, Enter for All): ").strip()
@@ -1,10 +1,15 @@
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.vpn.anyconnect.anyconnect_config.anyconnect_config import anyconnect_config
-from lina.vpn.anyconnect.vpn_sessiondb_anyconnect.vpn_sessiondb_anyconnect import vpn_sessiondb_anyconnect
-from lina.vpn.anyconnect.crypto_ca_data.crypto_ca_data import crypto_ca_data
-from lina.vpn.anyconnect.ssl_data.ssl_data import ssl_data
-from lina.vpn.anyconnect.anyconnect_help.anyconnect_help import anyconnect_help
-from lina.vpn.anyconnect.anyconnect_crypto_accelerator_data.anyconnect_crypto_accelerator_data import anyconnect_crypto_accelerator_data
+
+# Feature modules are imported only when their menu entry is selected
+anyconnect_config = lazy_command("lina.vpn.anyconnect.anyconnect_config.anyconnect_config")
+vpn_sessiondb_anyconnect = lazy_command("lina.vpn.anyconnect.vpn_sessiondb_anyconnect.vpn_sessiondb_anyconnect")
+crypto_ca_data = lazy_command("lina.vpn.anyconnect.crypto_ca_data.crypto_ca_data")
+ssl_data = lazy_command("lina.vpn.anyconnect.ssl_data.ssl_data")
+anyconnect_help = lazy_command("lina.vpn.anyconnect.anyconnect_help.anyconnect_help")
+anyconnect_crypto_accelerator_data = lazy_command(
+    "lina.vpn.anyconnect.anyconnect_crypto_accelerator_data.anyconnect_crypto_accelerator_data"
+)
 
 
 def anyconnect_menu(selected_group, tunnel_groups=[]):
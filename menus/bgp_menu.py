@@ -1,17 +1,20 @@
 # Description: This script contains the BGP menu and its associated functions.
 
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.routing.bgp.bgp_running_config.bgp_running_config import bgp_running_config
-from lina.routing.bgp.bgp_summary.bgp_summary import bgp_summary
-from lina.routing.bgp.bgp_neighbors.bgp_neighbors import bgp_neighbors
-from lina.routing.bgp.bgp_ipv4_unicast.bgp_ipv4_unicast import bgp_ipv4_unicast
-from lina.routing.bgp.bgp_cidr_only.bgp_cidr_only import bgp_cidr_only
-from lina.routing.bgp.bgp_paths.bgp_paths import bgp_paths
-from lina.routing.bgp.bgp_pending_prefixes.bgp_pending_prefixes import bgp_pending_prefixes
-from lina.routing.bgp.bgp_rib_failure.bgp_rib_failure import bgp_rib_failure
-from lina.routing.bgp.bgp_help.bgp_help import bgp_help
-from lina.routing.bgp.bgp_advertised_routes.bgp_advertised_routes import bgp_advertised_routes
-from lina.routing.bgp.bgp_update_group.bgp_update_group import bgp_update_group
+
+# Feature modules are imported only when their menu entry is selected
+bgp_running_config = lazy_command("lina.routing.bgp.bgp_running_config.bgp_running_config")
+bgp_summary = lazy_command("lina.routing.bgp.bgp_summary.bgp_summary")
+bgp_neighbors = lazy_command("lina.routing.bgp.bgp_neighbors.bgp_neighbors")
+bgp_ipv4_unicast = lazy_command("lina.routing.bgp.bgp_ipv4_unicast.bgp_ipv4_unicast")
+bgp_cidr_only = lazy_command("lina.routing.bgp.bgp_cidr_only.bgp_cidr_only")
+bgp_paths = lazy_command("lina.routing.bgp.bgp_paths.bgp_paths")
+bgp_pending_prefixes = lazy_command("lina.routing.bgp.bgp_pending_prefixes.bgp_pending_prefixes")
+bgp_rib_failure = lazy_command("lina.routing.bgp.bgp_rib_failure.bgp_rib_failure")
+bgp_help = lazy_command("lina.routing.bgp.bgp_help.bgp_help")
+bgp_advertised_routes = lazy_command("lina.routing.bgp.bgp_advertised_routes.bgp_advertised_routes")
+bgp_update_group = lazy_command("lina.routing.bgp.bgp_update_group.bgp_update_group")
 
 
 def bgp_menu():
@@ -1,14 +1,19 @@
 # Description: This script contains the Blocks menu and its associated functions.
 
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.blocks.blocks.blocks import blocks
-from lina.blocks.blocks_exhaustion_history.blocks_exhaustion_history import blocks_exhaustion_history
-from lina.blocks.blocks_exhaustion_snapsnot.blocks_exhaustion_snapshot import blocks_exhaustion_snapshot
-from lina.blocks.blocks_queue_history_core_local.blocks_queue_history_core_local import blocks_queue_history_core_local
-from lina.blocks.blocks_queue_history_detail.blocks_queue_history_detail import blocks_queue_history_detail
-from lina.blocks.blocks_old.blocks_old import blocks_old
-from lina.blocks.blocks_old_dump.blocks_old_dump import blocks_old_dump
-from lina.blocks.blocks_help.blocks_help import blocks_help
+
+# Feature modules are imported only when their menu entry is selected
+blocks = lazy_command("lina.blocks.blocks.blocks")
+blocks_exhaustion_history = lazy_command("lina.blocks.blocks_exhaustion_history.blocks_exhaustion_history")
+blocks_exhaustion_snapshot = lazy_command("lina.blocks.blocks_exhaustion_snapsnot.blocks_exhaustion_snapshot")
+blocks_queue_history_core_local = lazy_command(
+    "lina.blocks.blocks_queue_history_core_local.blocks_queue_history_core_local"
+)
+blocks_queue_history_detail = lazy_command("lina.blocks.blocks_queue_history_detail.blocks_queue_history_detail")
+blocks_old = lazy_command("lina.blocks.blocks_old.blocks_old")
+blocks_old_dump = lazy_command("lina.blocks.blocks_old_dump.blocks_old_dump")
+blocks_help = lazy_command("lina.blocks.blocks_help.blocks_help")
 
 
 def blocks_menu():
@@ -1,17 +1,20 @@
 # Description: This script contains the Cluster menu and its associated functions.
 
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.cluster.cluster_running_config.cluster_running_config import cluster_running_config
-from lina.cluster.cluster_member_limit.cluster_member_limit import cluster_member_limit
-from lina.cluster.cluster_nat_pool.cluster_nat_pool import cluster_nat_pool
-from lina.cluster.cluster_nat_pool.cluster_exec_nat_pool import cluster_exec_nat_pool
-from lina.cluster.cluster_resource_usage.cluster_resource_usage import cluster_resource_usage
-from lina.cluster.cluster_mtu.cluster_mtu import cluster_mtu
-from lina.cluster.cluster_conn_count.cluster_conn_count import cluster_conn_count
-from lina.cluster.cluster_xlate_count.cluster_xlate_count import cluster_xlate_count
-from lina.cluster.cluster_traffic.cluster_traffic import cluster_traffic
-from lina.cluster.cluster_cpu.cluster_cpu import cluster_cpu
-from lina.cluster.cluster_help.cluster_help import cluster_help
+
+# Feature modules are imported only when their menu entry is selected
+cluster_running_config = lazy_command("lina.cluster.cluster_running_config.cluster_running_config")
+cluster_member_limit = lazy_command("lina.cluster.cluster_member_limit.cluster_member_limit")
+cluster_nat_pool = lazy_command("lina.cluster.cluster_nat_pool.cluster_nat_pool")
+cluster_exec_nat_pool = lazy_command("lina.cluster.cluster_nat_pool.cluster_exec_nat_pool")
+cluster_resource_usage = lazy_command("lina.cluster.cluster_resource_usage.cluster_resource_usage")
+cluster_mtu = lazy_command("lina.cluster.cluster_mtu.cluster_mtu")
+cluster_conn_count = lazy_command("lina.cluster.cluster_conn_count.cluster_conn_count")
+cluster_xlate_count = lazy_command("lina.cluster.cluster_xlate_count.cluster_xlate_count")
+cluster_traffic = lazy_command("lina.cluster.cluster_traffic.cluster_traffic")
+cluster_cpu = lazy_command("lina.cluster.cluster_cpu.cluster_cpu")
+cluster_help = lazy_command("lina.cluster.cluster_help.cluster_help")
 
 
 def cluster_menu():
@@ -1,14 +1,19 @@
 # Description: This script contains the Connectivity and Traffic menu and its associated functions.
 
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.connectivity_and_traffic.arp.arp import arp
-from lina.connectivity_and_traffic.conn_detail.conn_detail import conn_detail
-from lina.connectivity_and_traffic.sla_config.sla_config import sla_config
-from lina.connectivity_and_traffic.sla_operational_state.sla_operational_state import sla_operational_state
-from lina.connectivity_and_traffic.traffic.traffic import traffic
-from lina.connectivity_and_traffic.perfmon.perfmon import perfmon
-from lina.connectivity_and_traffic.service_policy.service_policy import service_policy
-from lina.connectivity_and_traffic.connectivity_and_traffic_help.connectivity_and_traffic_help import connectivity_and_traffic_help
+
+# Feature modules are imported only when their menu entry is selected
+arp = lazy_command("lina.connectivity_and_traffic.arp.arp")
+conn_detail = lazy_command("lina.connectivity_and_traffic.conn_detail.conn_detail")
+sla_config = lazy_command("lina.connectivity_and_traffic.sla_config.sla_config")
+sla_operational_state = lazy_command("lina.connectivity_and_traffic.sla_operational_state.sla_operational_state")
+traffic = lazy_command("lina.connectivity_and_traffic.traffic.traffic")
+perfmon = lazy_command("lina.connectivity_and_traffic.perfmon.perfmon")
+service_policy = lazy_command("lina.connectivity_and_traffic.service_policy.service_policy")
+connectivity_and_traffic_help = lazy_command(
+    "lina.connectivity_and_traffic.connectivity_and_traffic_help.connectivity_and_traffic_help"
+)
 
 
 def connectivity_and_traffic_menu():
@@ -41,6 +41,14 @@ def data_dump_help():
        - Dumps memory block statistics, tracking usage, exhaustion events, and 
          potential memory leaks affecting performance.
 
+    10. **Collect Everything**: 
+        - Runs every dump above in a single parallel pass, running commands shared between dumps only once, 
+          and writes all of them into one consolidated .tar.gz archive.
+
+    11. **Stored Runs**: 
+        - With FPTH_DEDUP_STORE=1, dumps are kept in a deduplicated store where unchanged sections take no extra 
+          disk space. This option turns any stored run back into a normal .tar.gz archive.
+
     **How These Options Help**:
 
     - **Device Information & NAT Dump** provide general system and network translation insights.
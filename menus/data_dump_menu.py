@@ -1,19 +1,25 @@
 # Description: This script is a simple menu-driven program that allows the user to dump various data for Cisco Firepower
 # devices.
 
-from lina.nat.dump_all_nat_data.dump_all_nat_data import dump_all_nat_data
-from lina.show_version.show_version import show_version
-from menus.routing_dump_menu import routing_dump_menu
-from menus.vpn_dump_menu import vpn_dump_menu
-from lina.failover.dump_all_failover_data.dump_all_failover_data import dump_all_failover_data
-from menus.logging_and_monitoring_dump_menu import logging_and_monitoring_dump_menu
-from lina.cluster.dump_all_cluster_data.dump_all_cluster_data import dump_all_cluster_data
-from lina.blocks.dump_all_blocks_data.dump_all_blocks_data import dump_all_blocks_data
-from lina.connectivity_and_traffic.dump_all_conn_and_traffic_data.dump_all_conn_and_traffic_data \
-    import dump_all_conn_and_traffic_data
-from menus.data_dump_help.data_dump_help import data_dump_help
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
 
+# Feature modules are imported only when their menu entry is selected
+dump_all_nat_data = lazy_command("lina.nat.dump_all_nat_data.dump_all_nat_data")
+show_version = lazy_command("lina.show_version.show_version")
+routing_dump_menu = lazy_command("menus.routing_dump_menu")
+vpn_dump_menu = lazy_command("menus.vpn_dump_menu")
+dump_all_failover_data = lazy_command("lina.failover.dump_all_failover_data.dump_all_failover_data")
+logging_and_monitoring_dump_menu = lazy_command("menus.logging_and_monitoring_dump_menu")
+dump_all_cluster_data = lazy_command("lina.cluster.dump_all_cluster_data.dump_all_cluster_data")
+dump_all_blocks_data = lazy_command("lina.blocks.dump_all_blocks_data.dump_all_blocks_data")
+dump_all_conn_and_traffic_data = lazy_command(
+    "lina.connectivity_and_traffic.dump_all_conn_and_traffic_data.dump_all_conn_and_traffic_data"
+)
+dump_all_data = lazy_command("lina.dump_all_data.dump_all_data")
+stored_runs_menu = lazy_command("menus.stored_runs_menu")
+data_dump_help = lazy_command("menus.data_dump_help.data_dump_help")
+
 
 def data_dump_menu():
     menu_options = {
@@ -26,7 +32,9 @@ def data_dump_menu():
         "7": ("Show Tech - Logging and Monitoring", logging_and_monitoring_dump_menu),
         "8": ("Show Tech - Clustering", dump_all_cluster_data),
         "9": ("Show Tech - Block Memory", dump_all_blocks_data),
-        "10": ("Show Tech - Help Menu", data_dump_help),
+        "10": ("Show Tech - Collect Everything (single archive)", dump_all_data),
+        "11": ("Show Tech - Stored Runs (materialize to archive)", stored_runs_menu),
+        "12": ("Show Tech - Help Menu", data_dump_help),
         "0": ("Exit", None),
     }
 
@@ -35,7 +43,7 @@ def data_dump_menu():
         options_display = {key: description for key, (description, _) in menu_options.items()}
         display_formatted_menu("Show Tech Menu", options_display)
 
-        choice = input("Select an option (0-10): ").strip()
+        choice = input("Select an option (0-12): ").strip()
 
         if choice in menu_options:
             description, function = menu_options[choice]
@@ -48,4 +56,4 @@ def data_dump_menu():
                 print("\nExiting to FPTH menu...")
                 break
         else:
-            print("\n[!] Invalid choice. Please enter a number between 0 and 10.")
+            print("\n[!] Invalid choice. Please enter a number between 0 and 12.")
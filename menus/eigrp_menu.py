@@ -1,14 +1,17 @@
 # Description: This script contains the EIGRP menu and its associated functions.
 
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.routing.eigrp.eigrp_events.eigrp_events import eigrp_events
-from lina.routing.eigrp.eigrp_interfaces.eigrp_interfaces import eigrp_interfaces
-from lina.routing.eigrp.eigrp_neighbors.eigrp_neighbors import eigrp_neighbors
-from lina.routing.eigrp.eigrp_topology.eigrp_topology import eigrp_topology
-from lina.routing.eigrp.eigrp_traffic.eigrp_traffic import eigrp_traffic
-from lina.routing.eigrp.eigrp_routing_table.eigrp_routing_table import eigrp_routing_table
-from lina.routing.eigrp.eigrp_help.eigrp_help import eigrp_help
-from lina.routing.eigrp.eigrp_running_config.eigrp_running_config import eigrp_running_config
+
+# Feature modules are imported only when their menu entry is selected
+eigrp_events = lazy_command("lina.routing.eigrp.eigrp_events.eigrp_events")
+eigrp_interfaces = lazy_command("lina.routing.eigrp.eigrp_interfaces.eigrp_interfaces")
+eigrp_neighbors = lazy_command("lina.routing.eigrp.eigrp_neighbors.eigrp_neighbors")
+eigrp_topology = lazy_command("lina.routing.eigrp.eigrp_topology.eigrp_topology")
+eigrp_traffic = lazy_command("lina.routing.eigrp.eigrp_traffic.eigrp_traffic")
+eigrp_routing_table = lazy_command("lina.routing.eigrp.eigrp_routing_table.eigrp_routing_table")
+eigrp_help = lazy_command("lina.routing.eigrp.eigrp_help.eigrp_help")
+eigrp_running_config = lazy_command("lina.routing.eigrp.eigrp_running_config.eigrp_running_config")
 
 
 def eigrp_menu():
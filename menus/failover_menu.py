@@ -1,14 +1,17 @@
-from lina.failover.failover_running_config.failover_running_config import failover_running_config
-from lina.failover.failover_state.failover_state import failover_state
-from lina.failover.failover.failover import failover
-from lina.failover.failover_details.failover_details import failover_details
-from lina.failover.failover_interface.failover_interface import failover_interface
-from lina.failover.failover_descriptor.failover_descriptor import failover_descriptor
-from lina.failover.failover_config_sync_status.failover_config_sync_status import failover_config_sync_status
-from lina.failover.failover_app_sync_stats.failover_app_sync_stats import failover_app_sync_stats
-from lina.failover.failover_help.failover_help import failover_help
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
 
+# Feature modules are imported only when their menu entry is selected
+failover_running_config = lazy_command("lina.failover.failover_running_config.failover_running_config")
+failover_state = lazy_command("lina.failover.failover_state.failover_state")
+failover = lazy_command("lina.failover.failover.failover")
+failover_details = lazy_command("lina.failover.failover_details.failover_details")
+failover_interface = lazy_command("lina.failover.failover_interface.failover_interface")
+failover_descriptor = lazy_command("lina.failover.failover_descriptor.failover_descriptor")
+failover_config_sync_status = lazy_command("lina.failover.failover_config_sync_status.failover_config_sync_status")
+failover_app_sync_stats = lazy_command("lina.failover.failover_app_sync_stats.failover_app_sync_stats")
+failover_help = lazy_command("lina.failover.failover_help.failover_help")
+
 
 def failover_menu():
     """Displays a menu for selecting failover-related commands and executes the corresponding function.
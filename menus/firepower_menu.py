@@ -1,14 +1,17 @@
 # Description: This script is the main menu for the Firepower troubleshooting section.
 # It allows the user to access various troubleshooting tools for Cisco Firepower devices.
 
-from firepower.registration.registration_menu import registration_menu
-from firepower.device_information.device_information import device_information
-from firepower.database.database_menu import database_menu
-from firepower.disk_usage.disk_usage_menu import disk_usage_menu
-from firepower.cpu_usage.cpu_usage_menu import cpu_usage_menu
-from menus.firepower_menu_help.firepower_menu_help import firepower_menu_help
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
 
+# Feature modules are imported only when their menu entry is selected
+registration_menu = lazy_command("firepower.registration.registration_menu")
+device_information = lazy_command("firepower.device_information.device_information")
+database_menu = lazy_command("firepower.database.database_menu")
+disk_usage_menu = lazy_command("firepower.disk_usage.disk_usage_menu")
+cpu_usage_menu = lazy_command("firepower.cpu_usage.cpu_usage_menu")
+firepower_menu_help = lazy_command("menus.firepower_menu_help.firepower_menu_help")
+
 
 def firepower_menu():
     # Map menu options to descriptions and their respective functions
@@ -1,10 +1,13 @@
 # Description: This script contains the Global Routing menu and its associated functions.
 
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.routing.global_routing.show_route_all.show_route_all import show_route_all
-from lina.routing.global_routing.asp_table_routing_all.asp_table_routing_all import asp_table_routing_all
-from lina.routing.global_routing.global_routing_help.global_routing_help import global_routing_help
-from lina.routing.global_routing.running_config_all.running_config_all import running_config_all
+
+# Feature modules are imported only when their menu entry is selected
+show_route_all = lazy_command("lina.routing.global_routing.show_route_all.show_route_all")
+asp_table_routing_all = lazy_command("lina.routing.global_routing.asp_table_routing_all.asp_table_routing_all")
+global_routing_help = lazy_command("lina.routing.global_routing.global_routing_help.global_routing_help")
+running_config_all = lazy_command("lina.routing.global_routing.running_config_all.running_config_all")
 
 
 def global_routing_menu():
@@ -1,15 +1,18 @@
 # Description: This script contains the ISIS menu options and functions to access the ISIS data.
 
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.routing.isis.isis_database.isis_database import isis_database
-from lina.routing.isis.isis_hostname.isis_hostname import isis_hostname
-from lina.routing.isis.isis_lsp_log.isis_lsp_log import isis_lsp_log
-from lina.routing.isis.isis_neighbors.isis_neighbors import isis_neighbors
-from lina.routing.isis.isis_rib.isis_rib import isis_rib
-from lina.routing.isis.isis_spf_log.isis_spf_log import isis_spf_log
-from lina.routing.isis.isis_topology.isis_topology import isis_topology
-from lina.routing.isis.isis_help.isis_help import isis_help
-from lina.routing.isis.isis_running_config.isis_running_config import isis_running_config
+
+# Feature modules are imported only when their menu entry is selected
+isis_database = lazy_command("lina.routing.isis.isis_database.isis_database")
+isis_hostname = lazy_command("lina.routing.isis.isis_hostname.isis_hostname")
+isis_lsp_log = lazy_command("lina.routing.isis.isis_lsp_log.isis_lsp_log")
+isis_neighbors = lazy_command("lina.routing.isis.isis_neighbors.isis_neighbors")
+isis_rib = lazy_command("lina.routing.isis.isis_rib.isis_rib")
+isis_spf_log = lazy_command("lina.routing.isis.isis_spf_log.isis_spf_log")
+isis_topology = lazy_command("lina.routing.isis.isis_topology.isis_topology")
+isis_help = lazy_command("lina.routing.isis.isis_help.isis_help")
+isis_running_config = lazy_command("lina.routing.isis.isis_running_config.isis_running_config")
 
 
 def isis_menu():
@@ -1,16 +1,19 @@
 # Description: This script contains the Lina menu and its options.
 
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.show_version.show_version import show_version
-from menus.nat_menu import nat_menu
-from menus.connectivity_and_traffic_menu import connectivity_and_traffic_menu
-from menus.routing_menu import routing_menu
-from menus.vpn_menu import vpn_menu
-from menus.failover_menu import failover_menu
-from menus.logging_and_monitoring_menu import logging_and_monitoring_menu
-from menus.cluster_menu import cluster_menu
-from menus.blocks_menu import blocks_menu
-from menus.lina_menu_help.lina_menu_help import lina_menu_help
+
+# Feature modules are imported only when their menu entry is selected
+show_version = lazy_command("lina.show_version.show_version")
+nat_menu = lazy_command("menus.nat_menu")
+connectivity_and_traffic_menu = lazy_command("menus.connectivity_and_traffic_menu")
+routing_menu = lazy_command("menus.routing_menu")
+vpn_menu = lazy_command("menus.vpn_menu")
+failover_menu = lazy_command("menus.failover_menu")
+logging_and_monitoring_menu = lazy_command("menus.logging_and_monitoring_menu")
+cluster_menu = lazy_command("menus.cluster_menu")
+blocks_menu = lazy_command("menus.blocks_menu")
+lina_menu_help = lazy_command("menus.lina_menu_help.lina_menu_help")
 
 
 def lina_menu():
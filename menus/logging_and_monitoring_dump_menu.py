@@ -1,9 +1,12 @@
 # Description: This script contains the Logging and Monitoring Dump menu.
 
-from lina.logging_and_monitoring.syslog.dump_all_syslog_data.dump_all_syslog_data import dump_all_syslog_data
-from lina.logging_and_monitoring.snmp.dump_all_snmp_data.dump_all_snmp_data import dump_all_snmp_data
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
 
+# Feature modules are imported only when their menu entry is selected
+dump_all_syslog_data = lazy_command("lina.logging_and_monitoring.syslog.dump_all_syslog_data.dump_all_syslog_data")
+dump_all_snmp_data = lazy_command("lina.logging_and_monitoring.snmp.dump_all_snmp_data.dump_all_snmp_data")
+
 
 def logging_and_monitoring_dump_menu():
     menu_options = {
@@ -1,7 +1,10 @@
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from menus.syslog_menu import syslog_menu
-from menus.snmp_menu import snmp_menu
-from lina.logging_and_monitoring.logging_and_monitoring_help import logging_and_monitoring_help  # Import help function
+
+# Feature modules are imported only when their menu entry is selected
+syslog_menu = lazy_command("menus.syslog_menu")
+snmp_menu = lazy_command("menus.snmp_menu")
+logging_and_monitoring_help = lazy_command("lina.logging_and_monitoring.logging_and_monitoring_help")
 
 
 def logging_and_monitoring_menu():
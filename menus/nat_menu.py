@@ -1,14 +1,17 @@
 # Description: This script contains the NAT menu and its corresponding functions.
 
-from lina.nat.nat_running_config.nat_running_config import nat_running_config
-from lina.nat.nat_detail.nat_detail import nat_detail
-from lina.nat.xlate_count.xlate_count import xlate_count
-from lina.nat.xlate_detail.xlate_detail import xlate_detail_interactive
-from lina.nat.nat_proxy_arp.nat_proxy_arp import nat_proxy_arp
-from lina.nat.nat_pool.nat_pool import nat_pool
-from lina.nat.nat_help.nat_help import nat_help
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
 
+# Feature modules are imported only when their menu entry is selected
+nat_running_config = lazy_command("lina.nat.nat_running_config.nat_running_config")
+nat_detail = lazy_command("lina.nat.nat_detail.nat_detail")
+xlate_count = lazy_command("lina.nat.xlate_count.xlate_count")
+xlate_detail_interactive = lazy_command("lina.nat.xlate_detail.xlate_detail", "xlate_detail_interactive")
+nat_proxy_arp = lazy_command("lina.nat.nat_proxy_arp.nat_proxy_arp")
+nat_pool = lazy_command("lina.nat.nat_pool.nat_pool")
+nat_help = lazy_command("lina.nat.nat_help.nat_help")
+
 
 def nat_menu():
     menu_options = {
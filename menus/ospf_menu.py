@@ -1,18 +1,21 @@
 # Description: This script contains the OSPF menu and its associated functions.
 
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.routing.ospf.ospf_running_config.ospf_running_config import ospf_running_config
-from lina.routing.ospf.ospf_all.ospf_all import ospf_all
-from lina.routing.ospf.ospf_border_routers.ospf_border_routers import ospf_border_routers
-from lina.routing.ospf.ospf_database.ospf_database import ospf_database
-from lina.routing.ospf.ospf_events.ospf_events import ospf_events
-from lina.routing.ospf.ospf_interface.ospf_interface import ospf_interface
-from lina.routing.ospf.ospf_neighbor.ospf_neighbor import ospf_neighbor
-from lina.routing.ospf.ospf_nsf.ospf_nsf import ospf_nsf
-from lina.routing.ospf.ospf_rib.ospf_rib import ospf_rib
-from lina.routing.ospf.ospf_statistics.ospf_statistics import ospf_statistics
-from lina.routing.ospf.ospf_traffic.ospf_traffic import ospf_traffic
-from lina.routing.ospf.ospf_help.ospf_help import ospf_help
+
+# Feature modules are imported only when their menu entry is selected
+ospf_running_config = lazy_command("lina.routing.ospf.ospf_running_config.ospf_running_config")
+ospf_all = lazy_command("lina.routing.ospf.ospf_all.ospf_all")
+ospf_border_routers = lazy_command("lina.routing.ospf.ospf_border_routers.ospf_border_routers")
+ospf_database = lazy_command("lina.routing.ospf.ospf_database.ospf_database")
+ospf_events = lazy_command("lina.routing.ospf.ospf_events.ospf_events")
+ospf_interface = lazy_command("lina.routing.ospf.ospf_interface.ospf_interface")
+ospf_neighbor = lazy_command("lina.routing.ospf.ospf_neighbor.ospf_neighbor")
+ospf_nsf = lazy_command("lina.routing.ospf.ospf_nsf.ospf_nsf")
+ospf_rib = lazy_command("lina.routing.ospf.ospf_rib.ospf_rib")
+ospf_statistics = lazy_command("lina.routing.ospf.ospf_statistics.ospf_statistics")
+ospf_traffic = lazy_command("lina.routing.ospf.ospf_traffic.ospf_traffic")
+ospf_help = lazy_command("lina.routing.ospf.ospf_help.ospf_help")
 
 
 def ospf_menu():
@@ -1,13 +1,16 @@
 # Description: This script contains the routing menu and its corresponding functions.
 
-from lina.routing.global_routing.dump_all_route_data.dump_all_route_data import dump_all_route_data
-from lina.routing.eigrp.dump_all_eigrp_data.dump_all_eigrp_data import dump_all_eigrp_data
-from lina.routing.ospf.dump_all_ospf_data.dump_all_ospf_data import dump_all_ospf_data
-from lina.routing.bgp.dump_all_bgp_data.dump_all_bgp_data import dump_all_bgp_data
-from lina.routing.isis.dump_all_isis_data.dump_all_isis_data import dump_all_isis_data
-from lina.routing.vrf.dump_all_vrf_data.dump_all_vrf_data import dump_all_vrf_data
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
 
+# Feature modules are imported only when their menu entry is selected
+dump_all_route_data = lazy_command("lina.routing.global_routing.dump_all_route_data.dump_all_route_data")
+dump_all_eigrp_data = lazy_command("lina.routing.eigrp.dump_all_eigrp_data.dump_all_eigrp_data")
+dump_all_ospf_data = lazy_command("lina.routing.ospf.dump_all_ospf_data.dump_all_ospf_data")
+dump_all_bgp_data = lazy_command("lina.routing.bgp.dump_all_bgp_data.dump_all_bgp_data")
+dump_all_isis_data = lazy_command("lina.routing.isis.dump_all_isis_data.dump_all_isis_data")
+dump_all_vrf_data = lazy_command("lina.routing.vrf.dump_all_vrf_data.dump_all_vrf_data")
+
 
 def routing_dump_menu():
     menu_options = {
@@ -1,14 +1,17 @@
 # Description: This script contains the routing menu and its corresponding functions.
 
-from menus.global_routing_menu import global_routing_menu
-from menus.eigrp_menu import eigrp_menu
-from menus.ospf_menu import ospf_menu
-from menus.bgp_menu import bgp_menu
-from menus.isis_menu import isis_menu
-from menus.vrf_menu import vrf_menu
-from lina.routing.routing_help.routing_help import routing_help
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
 
+# Feature modules are imported only when their menu entry is selected
+global_routing_menu = lazy_command("menus.global_routing_menu")
+eigrp_menu = lazy_command("menus.eigrp_menu")
+ospf_menu = lazy_command("menus.ospf_menu")
+bgp_menu = lazy_command("menus.bgp_menu")
+isis_menu = lazy_command("menus.isis_menu")
+vrf_menu = lazy_command("menus.vrf_menu")
+routing_help = lazy_command("lina.routing.routing_help.routing_help")
+
 
 def routing_menu():
     menu_options = {
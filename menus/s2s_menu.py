@@ -1,14 +1,17 @@
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.vpn.s2s.s2s_config.s2s_config import (
-    s2s_ikev1_vti_config,
-    s2s_ikev1_policy_based_config,
-    s2s_ikev2_vti_config,
-    s2s_ikev2_policy_based_config,
-)
-from lina.vpn.s2s.s2s_crypto_accelerator_data.s2s_crypto_accelerator_data import s2s_crypto_accelerator_data
-from lina.vpn.s2s.crypto_isakmp_sa_detail.crypto_isakmp_sa_detail import crypto_isakmp_sa_detail
-from lina.vpn.s2s.crypto_ipsec_sa_detail.crypto_ipsec_sa_detail import crypto_ipsec_sa_detail
-from lina.vpn.s2s.s2s_help.s2s_help import s2s_help
+
+# Feature modules are imported only when their menu entry is selected
+s2s_ikev1_vti_config = lazy_command("lina.vpn.s2s.s2s_config.s2s_config", "s2s_ikev1_vti_config")
+s2s_ikev1_policy_based_config = lazy_command("lina.vpn.s2s.s2s_config.s2s_config", "s2s_ikev1_policy_based_config")
+s2s_ikev2_vti_config = lazy_command("lina.vpn.s2s.s2s_config.s2s_config", "s2s_ikev2_vti_config")
+s2s_ikev2_policy_based_config = lazy_command("lina.vpn.s2s.s2s_config.s2s_config", "s2s_ikev2_policy_based_config")
+s2s_crypto_accelerator_data = lazy_command("lina.vpn.s2s.s2s_crypto_accelerator_data.s2s_crypto_accelerator_data")
+crypto_isakmp_sa_detail = lazy_command("lina.vpn.s2s.crypto_isakmp_sa_detail.crypto_isakmp_sa_detail")
+crypto_ipsec_sa_detail = lazy_command("lina.vpn.s2s.crypto_ipsec_sa_detail.crypto_ipsec_sa_detail")
+ipsec_sa_monitor = lazy_command("lina.vpn.s2s.ipsec_sa_monitor.ipsec_sa_monitor")
+ike_sa_health = lazy_command("lina.vpn.s2s.ike_sa_health.ike_sa_health")
+s2s_help = lazy_command("lina.vpn.s2s.s2s_help.s2s_help")
 
 
 def s2s_menu(selected_peers):
@@ -22,7 +25,9 @@ def s2s_menu(selected_peers):
         "2": ("Crypto ISAKMP SA Detail", crypto_isakmp_sa_detail),
         "3": ("Crypto IPSec SA Detail", crypto_ipsec_sa_detail),
         "4": ("Crypto Accelerator Data", s2s_crypto_accelerator_data),
-        "5": ("Site-to-Site Help", s2s_help),
+        "5": ("IPSec SA Throughput Monitor", ipsec_sa_monitor),
+        "6": ("IKE SA Health Summary", ike_sa_health),
+        "7": ("Site-to-Site Help", s2s_help),
         "0": ("Exit", None),
     }
 
@@ -82,7 +87,7 @@ def s2s_menu(selected_peers):
 
                 elif function == s2s_help:
                     function()
-                elif function == crypto_ipsec_sa_detail:
+                elif function in (crypto_ipsec_sa_detail, ipsec_sa_monitor, ike_sa_health):
                     function(selected_peers, help_requested=True)
                 else:
                     function(help_requested=True)
@@ -116,13 +121,13 @@ def s2s_menu(selected_peers):
 
                 print("\n✅ Configuration Complete.")
 
-            # Execute the chosen function for options 2-5
+            # Execute the chosen function for options 2-7
             elif function:
                 print("\n" + "=" * 80)
                 print(f"🔹 Accessing {description}".center(80))
                 print("=" * 80)
 
-                if function == crypto_ipsec_sa_detail:
+                if function in (crypto_ipsec_sa_detail, ipsec_sa_monitor, ike_sa_health):
                     function(selected_peers, help_requested=False)
                 elif function in (crypto_isakmp_sa_detail, s2s_crypto_accelerator_data):
                     function(help_requested=False)
@@ -135,4 +140,4 @@ def s2s_menu(selected_peers):
                 break
 
         else:
-            print("\n[!] Invalid choice. Please enter a number between 0 and 5.")
+            print("\n[!] Invalid choice. Please enter a number between 0 and 7.")
@@ -0,0 +1,39 @@
+# Description: This script lists the Show Tech runs kept in the deduplicated store (FPTH_DEDUP_STORE=1) and
+# materializes a selected run back into a normal archive under /var/log/fp_troubleshooting_data.
+
+from datetime import datetime
+from core.dedup_store import list_runs, materialize_run
+from core.utils import display_formatted_menu
+
+
+def stored_runs_menu():
+    while True:
+        runs = list_runs()
+        if not runs:
+            print("\n[!] No runs in the store. Set FPTH_DEDUP_STORE=1 to record Show Tech dumps in it.")
+            return
+
+        # Newest runs first, numbered for selection
+        runs = runs[::-1]
+        options_display = {}
+        for number, run in enumerate(runs, start=1):
+            created = datetime.fromtimestamp(run["created"]).strftime("%Y-%m-%d %H:%M:%S")
+            size = sum(member["size"] for member in run["members"])
+            options_display[str(number)] = f"{run['run']} ({created}, {len(run['members'])} files, {size} bytes)"
+        options_display["0"] = "Exit"
+        display_formatted_menu("Show Tech - Stored Runs", options_display)
+
+        choice = input(f"Select a run to materialize (0-{len(runs)}): ").strip()
+
+        if choice == "0":
+            print("\nExiting to previous menu...")
+            break
+        if choice in options_display:
+            run_id = runs[int(choice) - 1]["run"]
+            try:
+                archive_path = materialize_run(run_id)
+                print(f"[+] Run {run_id} materialized to: {archive_path}")
+            except Exception as e:
+                print(f"[!] Error materializing run {run_id}: {e}")
+        else:
+            print(f"\n[!] Invalid choice. Please enter a number between 0 and {len(runs)}.")
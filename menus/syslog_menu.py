@@ -1,13 +1,27 @@
+from core.help_catalogue import print_help
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.logging_and_monitoring.syslog.logging_config.logging_config import logging_config
-from lina.logging_and_monitoring.syslog.logging_queue.logging_queue import logging_queue
-from lina.logging_and_monitoring.syslog.logging_message.logging_message import logging_message
-from lina.logging_and_monitoring.syslog.logging_manager_detail.logging_manager_detail import logging_manager_detail
-from lina.logging_and_monitoring.syslog.logging_dynamic_rate_limit.logging_dynamic_rate_limit import logging_dynamic_rate_limit
-from lina.logging_and_monitoring.syslog.logging_unified_client.logging_unified_client import logging_unified_client
-from lina.logging_and_monitoring.syslog.logging_unified_client_stats.logging_unified_client_stats import logging_unified_client_stats
-from lina.logging_and_monitoring.syslog.logging_buffered_output.logging_buffered_output import logging_buffered_output
-from lina.logging_and_monitoring.syslog.syslog_help.syslog_help import syslog_help
+
+# Feature modules are imported only when their menu entry is selected
+logging_config = lazy_command("lina.logging_and_monitoring.syslog.logging_config.logging_config")
+logging_queue = lazy_command("lina.logging_and_monitoring.syslog.logging_queue.logging_queue")
+logging_message = lazy_command("lina.logging_and_monitoring.syslog.logging_message.logging_message")
+logging_manager_detail = lazy_command(
+    "lina.logging_and_monitoring.syslog.logging_manager_detail.logging_manager_detail"
+)
+logging_dynamic_rate_limit = lazy_command(
+    "lina.logging_and_monitoring.syslog.logging_dynamic_rate_limit.logging_dynamic_rate_limit"
+)
+logging_unified_client = lazy_command(
+    "lina.logging_and_monitoring.syslog.logging_unified_client.logging_unified_client"
+)
+logging_unified_client_stats = lazy_command(
+    "lina.logging_and_monitoring.syslog.logging_unified_client_stats.logging_unified_client_stats"
+)
+logging_buffered_output = lazy_command(
+    "lina.logging_and_monitoring.syslog.logging_buffered_output.logging_buffered_output"
+)
+syslog_help = lazy_command("lina.logging_and_monitoring.syslog.syslog_help.syslog_help")
 
 
 def syslog_menu(help_requested=False):
@@ -15,59 +29,8 @@ def syslog_menu(help_requested=False):
        Supports 'X?' functionality to display help for each menu option.
     """
 
-    syslog_menu_help_info = {
-        'command': 'Syslog Menu',
-        'description': (
-            "The Syslog Menu provides options for configuring, monitoring, and troubleshooting "
-            "syslog messages. This menu includes controls for log buffers, dynamic rate limiting, "
-            "queue management, and unified logging clients. These commands help diagnose log "
-            "delivery failures, performance bottlenecks, and excessive message drops."
-        ),
-        'troubleshooting_steps': [
-            "🔹 **Step 1: Verify Logging Configuration**",
-            "   - Run `Logging Config` to ensure logging is enabled and levels are correctly set.",
-            "   - Check the logging destination (buffered, console, or remote server).",
-            "🔹 **Step 2: Monitor Message Processing**",
-            "   - Use `Logging Queue` to inspect log queue size and dropped messages.",
-            "   - If logs are being dropped, consider increasing queue limits or adjusting logging rates.",
-            "🔹 **Step 3: Check Log Filtering and Dynamic Rate Limits**",
-            "   - Run `Logging Dynamic Rate Limit` to ensure rate limits are not filtering out critical logs.",
-            "   - If logs are missing, review logging filters and severity settings.",
-            "🔹 **Step 4: Debug Logging Client Communication**",
-            "   - Use `Logging Unified Client` and `Logging Unified Client Stats` to verify remote logging connectivity.",
-            "   - Ensure the syslog server is reachable and accepting messages.",
-            "🔹 **Step 5: Examine Buffered Output**",
-            "   - Run `Logging Buffered Output` to check if logs are accumulating in the buffer.",
-            "   - If logs are stuck in the buffer, increase the buffer size or enable periodic flushing."
-        ],
-        'example_output': """
-================================================================================
-                                   Syslog Menu
-================================================================================
-1) Logging Config
-2) Logging Queue
-3) Logging Message
-4) Logging Manager Detail
-5) Logging Dynamic Rate Limit
-6) Logging Unified Client
-7) Logging Unified Client Stats
-8) Logging Buffered Output
-9) Logging Help
-0) Exit
-================================================================================
-        """
-    }
-
     if help_requested:
-        print("\n" + "=" * 80)
-        print(f"📖 Help for: {syslog_menu_help_info['command']}".center(80))
-        print("=" * 80)
-        print(f"\n{syslog_menu_help_info['description']}\n")
-        print("Troubleshooting Steps:")
-        for step in syslog_menu_help_info['troubleshooting_steps']:
-            print(f"   {step}")
-        print("\nExample Output:")
-        print(syslog_menu_help_info['example_output'])
+        print_help("syslog_menu")
         return None
 
     menu_options = {
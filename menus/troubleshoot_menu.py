@@ -1,12 +1,15 @@
 # Description: This script is a simple menu-driven program that allows the user to access various troubleshooting tools
 # for Cisco Firepower devices.
 
-from firepower.device_information.device_information import device_information
-from menus.firepower_menu import firepower_menu
-from menus.lina_menu import lina_menu
-from menus.troubleshooting_menu_help.troubleshooting_menu_help import troubleshooting_menu_help
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
 
+# Feature modules are imported only when their menu entry is selected
+device_information = lazy_command("firepower.device_information.device_information")
+firepower_menu = lazy_command("menus.firepower_menu")
+lina_menu = lazy_command("menus.lina_menu")
+troubleshooting_menu_help = lazy_command("menus.troubleshooting_menu_help.troubleshooting_menu_help")
+
 
 def troubleshoot_menu():
     menu_options = {
@@ -1,7 +1,10 @@
-from lina.vpn.anyconnect.dump_all_anyconnect_data.dump_all_anyconnect_data import dump_all_anyconnect_data
-from lina.vpn.s2s.dump_all_s2s_data.dump_all_s2s_data import dump_s2s_tunnel_groups
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
 
+# Feature modules are imported only when their menu entry is selected
+dump_all_anyconnect_data = lazy_command("lina.vpn.anyconnect.dump_all_anyconnect_data.dump_all_anyconnect_data")
+dump_s2s_tunnel_groups = lazy_command("lina.vpn.s2s.dump_all_s2s_data.dump_all_s2s_data", "dump_s2s_tunnel_groups")
+
 
 def vpn_dump_menu():
     menu_options = {
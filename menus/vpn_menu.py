@@ -1,7 +1,10 @@
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.vpn.anyconnect.anyconnect_tunnel_groups.anyconnect_tunnel_groups import anyconnect_tunnel_groups
-from lina.vpn.s2s.s2s_tunnel_groups.s2s_tunnel_groups import s2s_tunnel_groups
-from menus.vpn_menu_help.vpn_menu_help import vpn_menu_help
+
+# Feature modules are imported only when their menu entry is selected
+anyconnect_tunnel_groups = lazy_command("lina.vpn.anyconnect.anyconnect_tunnel_groups.anyconnect_tunnel_groups")
+s2s_tunnel_groups = lazy_command("lina.vpn.s2s.s2s_tunnel_groups.s2s_tunnel_groups")
+vpn_menu_help = lazy_command("menus.vpn_menu_help.vpn_menu_help")
 
 
 def vpn_menu():
@@ -1,13 +1,16 @@
 # Description: This script contains the VRF menu and its associated functions.
 
+from core.registry import lazy_command
 from core.utils import display_formatted_menu
-from lina.routing.vrf.vrf_running_config.vrf_running_config import vrf_running_config
-from lina.routing.vrf.vrf.vrf import vrf
-from lina.routing.vrf.vrf_counters.vrf_counters import vrf_counters
-from lina.routing.vrf.vrf_detail.vrf_detail import vrf_detail
-from lina.routing.vrf.vrf_lock.vrf_lock import vrf_lock
-from lina.routing.vrf.vrf_tableid.vrf_tableid import vrf_tableid
-from lina.routing.vrf.vrf_help.vrf_help import vrf_help
+
+# Feature modules are imported only when their menu entry is selected
+vrf_running_config = lazy_command("lina.routing.vrf.vrf_running_config.vrf_running_config")
+vrf = lazy_command("lina.routing.vrf.vrf.vrf")
+vrf_counters = lazy_command("lina.routing.vrf.vrf_counters.vrf_counters")
+vrf_detail = lazy_command("lina.routing.vrf.vrf_detail.vrf_detail")
+vrf_lock = lazy_command("lina.routing.vrf.vrf_lock.vrf_lock")
+vrf_tableid = lazy_command("lina.routing.vrf.vrf_tableid.vrf_tableid")
+vrf_help = lazy_command("lina.routing.vrf.vrf_help.vrf_help")
 
 
 def vrf_menu():